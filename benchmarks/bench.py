@@ -0,0 +1,297 @@
+"""Microbenchmarks for uritools functions.
+
+Usage: python benchmarks/bench.py run [OPTIONS]
+       python benchmarks/bench.py compare [OPTIONS] OLD NEW
+
+The ``run`` command times each benchmark for :class:`str` and
+:class:`bytes` inputs and each kind of corpus from ``corpus.py``, and
+writes the results as JSON to standard output or the file given with
+``-o``.  Times are reported in nanoseconds per URI reference, using
+the minimum of several repetitions.
+
+The ``compare`` command compares two result files, for example from
+two different commits, and exits with status 1 if any benchmark is
+slower by more than the given threshold.
+
+"""
+
+import argparse
+import collections
+import json
+import platform
+import re
+import sys
+import time
+import timeit
+
+from corpus import BASE, KINDS, corpus
+
+import uritools
+
+# benchmark name -> (function, input kinds or None for all)
+BENCHMARKS = {}
+
+
+def benchmark(*kinds):
+    def decorator(func):
+        BENCHMARKS[func.__name__.removeprefix("bench_")] = (func, kinds or None)
+        return func
+
+    return decorator
+
+
+def consume(iterator):
+    collections.deque(iterator, maxlen=0)
+
+
+# Each benchmark is called with a list of URI reference strings, all
+# of the same type, and returns a function that processes all of them,
+# or None if the input type is not supported.
+
+
+@benchmark()
+def bench_urisplit(uris):
+    return lambda: consume(map(uritools.urisplit, uris))
+
+
+@benchmark()
+def bench_urisplitcompact(uris):
+    return lambda: consume(map(uritools.urisplitcompact, uris))
+
+
+@benchmark()
+def bench_urisplitspans(uris):
+    return lambda: consume(map(uritools.urisplitspans, uris))
+
+
+@benchmark()
+def bench_urisplitbatch(uris):
+    return lambda: uritools.urisplitbatch(uris)
+
+
+@benchmark()
+def bench_uriunsplit(uris):
+    parts = list(map(uritools.urisplit, uris))
+    return lambda: consume(map(uritools.uriunsplit, parts))
+
+
+@benchmark()
+def bench_uridefrag(uris):
+    return lambda: consume(map(uritools.uridefrag, uris))
+
+
+@benchmark("short", "long", "dotsegments", "rfc3986")
+def bench_urijoin(uris):
+    base = BASE.encode() if isinstance(uris[0], bytes) else BASE
+    urijoin = uritools.urijoin
+    return lambda: consume(urijoin(base, uri) for uri in uris)
+
+
+@benchmark("short", "long", "dotsegments", "rfc3986")
+def bench_urijoinall(uris):
+    base = BASE.encode() if isinstance(uris[0], bytes) else BASE
+    return lambda: consume(uritools.urijoinall(base, uris))
+
+
+@benchmark()
+def bench_urinormalize(uris):
+    return lambda: consume(map(uritools.urinormalize, uris))
+
+
+@benchmark()
+def bench_urifingerprint(uris):
+    return lambda: consume(map(uritools.urifingerprint, uris))
+
+
+@benchmark()
+def bench_uriencode(uris):
+    # percent-decoded URI references make for realistic input
+    strings = [uritools.uridecode(uri, errors="replace") for uri in uris]
+    if isinstance(uris[0], bytes):
+        strings = [s.encode("utf-8") for s in strings]
+    uriencode = uritools.uriencode
+    return lambda: consume(uriencode(s, "/") for s in strings)
+
+
+@benchmark()
+def bench_uridecode(uris):
+    return lambda: consume(map(uritools.uridecode, uris))
+
+
+@benchmark("short", "long", "query", "ipv6", "percent")
+def bench_uricompose(uris):
+    items = []
+    for parts in map(uritools.urisplit, uris):
+        items.append(
+            {
+                "scheme": parts.getscheme(),
+                "host": parts.gethost(),
+                "port": parts.getport(),
+                "path": parts.getpath(errors="replace"),
+                "query": parts.getquerylist(errors="replace"),
+                "fragment": parts.getfragment(errors="replace"),
+            }
+        )
+    if isinstance(uris[0], bytes):
+        for item in items:
+            item["path"] = item["path"].encode("utf-8")
+    uricompose = uritools.uricompose
+    return lambda: consume(uricompose(**item) for item in items)
+
+
+@benchmark("short", "long", "ipv6")
+def bench_gethost(uris):
+    parts = list(map(uritools.urisplit, uris))
+    return lambda: consume(p.gethost() for p in parts)
+
+
+@benchmark("query", "long")
+def bench_getquerydict(uris):
+    parts = list(map(uritools.urisplit, uris))
+    return lambda: consume(p.getquerydict() for p in parts)
+
+
+@benchmark()
+def bench_isuri(uris):
+    return lambda: consume(map(uritools.isuri, uris))
+
+
+@benchmark()
+def bench_isrelpath(uris):
+    return lambda: consume(map(uritools.isrelpath, uris))
+
+
+@benchmark()
+def bench_uriscan(uris):
+    if not isinstance(uris[0], bytes):
+        return None
+    text = b" see ".join(uris)
+    return lambda: consume(uritools.uriscan(text))
+
+
+def measure(func, number, repeat):
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run(args):
+    pattern = re.compile(args.benchmarks or "")
+    results = {}
+    for kind in KINDS:
+        strings = corpus(kind, args.count, args.seed)
+        for name, (bench, kinds) in BENCHMARKS.items():
+            if kinds is not None and kind not in kinds:
+                continue
+            for uris in (strings, [s.encode("utf-8") for s in strings]):
+                key = "%s[%s,%s]" % (name, type(uris[0]).__name__, kind)
+                if not pattern.search(key):
+                    continue
+                func = bench(uris)
+                if func is None:
+                    continue
+                elapsed = measure(func, args.number, args.repeat)
+                results[key] = elapsed / len(uris) * 1e9
+                if args.verbose:
+                    print("%-40s %10.1f ns" % (key, results[key]), file=sys.stderr)
+    return {
+        "uritools": uritools.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "count": args.count,
+        "seed": args.seed,
+        "unit": "ns",
+        "results": results,
+    }
+
+
+def compare(old, new, threshold):
+    regressions = 0
+    print("%-40s %10s %10s %8s" % ("benchmark", "old", "new", "change"))
+    for key in sorted(old["results"].keys() & new["results"].keys()):
+        a, b = old["results"][key], new["results"][key]
+        change = b / a - 1.0
+        if change > threshold:
+            regressions += 1
+            flag = "  SLOWER"
+        elif change < -threshold:
+            flag = "  faster"
+        else:
+            flag = ""
+        print("%-40s %10.1f %10.1f %+7.1f%%%s" % (key, a, b, change * 100, flag))
+    for key in sorted(old["results"].keys() ^ new["results"].keys()):
+        print("%-40s %s" % (key, "missing" if key in old["results"] else "added"))
+    print("%d benchmarks slower by more than %.0f%%" % (regressions, threshold * 100))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python benchmarks/bench.py",
+        description="Run or compare uritools microbenchmarks.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    runner = commands.add_parser("run", help="run benchmarks")
+    runner.add_argument("-o", "--output", help="output file (default: stdout)")
+    runner.add_argument(
+        "-b", "--benchmarks", metavar="REGEX", help="only run matching benchmarks"
+    )
+    runner.add_argument(
+        "-c",
+        "--count",
+        type=int,
+        default=1000,
+        help="URI references per corpus (default: %(default)s)",
+    )
+    runner.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        default=10,
+        help="iterations per repetition (default: %(default)s)",
+    )
+    runner.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of repetitions (default: %(default)s)",
+    )
+    runner.add_argument(
+        "-s", "--seed", type=int, default=0, help="corpus seed (default: %(default)s)"
+    )
+    runner.add_argument(
+        "-v", "--verbose", action="store_true", help="report progress on stderr"
+    )
+    comparer = commands.add_parser("compare", help="compare two result files")
+    comparer.add_argument("old", help="baseline results")
+    comparer.add_argument("new", help="new results")
+    comparer.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown to report as regression (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(args)
+        if args.output is None:
+            json.dump(results, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+        return 0
+    else:
+        with open(args.old) as f:
+            old = json.load(f)
+        with open(args.new) as f:
+            new = json.load(f)
+        return 1 if compare(old, new, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
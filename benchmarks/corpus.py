@@ -0,0 +1,193 @@
+"""Deterministic synthetic corpora of URI references for benchmarks.
+
+Usage: python benchmarks/corpus.py [KIND [COUNT [SEED]]]
+
+Each kind of corpus is generated from a fixed random seed, so the same
+URI references are produced on every run and platform.
+When run as a script, the selected corpus is written to standard
+output, one URI reference per line.
+
+"""
+
+import random
+import sys
+
+# RFC 3986 5.4: Reference Resolution Examples
+BASE = "http://a/b/c/d;p?q"
+
+RFC3986_EXAMPLES = [
+    # 5.4.1. Normal Examples
+    "g:h",
+    "g",
+    "./g",
+    "g/",
+    "/g",
+    "//g",
+    "?y",
+    "g?y",
+    "#s",
+    "g#s",
+    "g?y#s",
+    ";x",
+    "g;x",
+    "g;x?y#s",
+    "",
+    ".",
+    "./",
+    "..",
+    "../",
+    "../g",
+    "../..",
+    "../../",
+    "../../g",
+    # 5.4.2. Abnormal Examples
+    "../../../g",
+    "../../../../g",
+    "/./g",
+    "/../g",
+    "g.",
+    ".g",
+    "g..",
+    "..g",
+    "./../g",
+    "./g/.",
+    "g/./h",
+    "g/../h",
+    "g;x=1/./y",
+    "g;x=1/../y",
+    "g?y/./x",
+    "g?y/../x",
+    "g#s/./x",
+    "g#s/../x",
+    "http:g",
+]
+
+SCHEMES = ["http", "https", "https", "https", "ftp", "ws"]
+
+DOMAINS = ["example.com", "example.org", "example.net", "example.edu"]
+
+WORDS = [
+    "api",
+    "assets",
+    "blog",
+    "category",
+    "docs",
+    "images",
+    "index.html",
+    "item",
+    "news",
+    "products",
+    "search",
+    "static",
+    "user",
+    "v1",
+    "v2",
+]
+
+KEYS = ["q", "id", "page", "sort", "lang", "ref", "utm_source", "session"]
+
+# characters likely to be percent-encoded in paths
+UNSAFE = ' "<>\\^`{|}%\xe4\xf6\xfc\xdf\xe9\u20ac\u4e2d\u6587\U0001f600'
+
+
+def _host(rng):
+    labels = rng.sample(["www", "cdn", "api", "static", "m"], rng.randint(0, 2))
+    return ".".join([*labels, rng.choice(DOMAINS)])
+
+
+def _path(rng, n):
+    return "".join("/" + rng.choice(WORDS) for _ in range(n))
+
+
+def _query(rng, n):
+    items = []
+    for _ in range(n):
+        value = rng.choice(WORDS) if rng.random() < 0.5 else str(rng.getrandbits(32))
+        items.append("%s=%s" % (rng.choice(KEYS), value))
+    return "&".join(items)
+
+
+def _encoded(rng, n):
+    chars = [rng.choice(UNSAFE) if rng.random() < 0.5 else "a" for _ in range(n)]
+    return "".join("%%%02X" % b for b in "".join(chars).encode("utf-8"))
+
+
+def short(rng):
+    """Short absolute URIs."""
+    return "%s://%s%s" % (rng.choice(SCHEMES), rng.choice(DOMAINS), _path(rng, 1))
+
+
+def long(rng):
+    """Long absolute URIs with userinfo, port, query and fragment."""
+    return "%s://user%d@%s:%d%s?%s#%s" % (
+        rng.choice(SCHEMES),
+        rng.getrandbits(16),
+        _host(rng),
+        rng.randint(1024, 65535),
+        _path(rng, rng.randint(6, 12)),
+        _query(rng, rng.randint(3, 6)),
+        rng.choice(WORDS),
+    )
+
+
+def query(rng):
+    """URIs with long query strings."""
+    return "https://%s/search?%s" % (_host(rng), _query(rng, rng.randint(10, 30)))
+
+
+def ipv6(rng):
+    """URIs with IPv6 address literals."""
+    groups = ["%x" % rng.getrandbits(16) for _ in range(rng.randint(1, 5))]
+    host = "[2001:db8::%s]" % ":".join(groups)
+    port = ":%d" % rng.randint(1, 65535) if rng.random() < 0.5 else ""
+    return "http://%s%s%s" % (host, port, _path(rng, rng.randint(0, 3)))
+
+
+def percent(rng):
+    """URIs with mostly percent-encoded paths."""
+    segments = [_encoded(rng, rng.randint(2, 10)) for _ in range(rng.randint(1, 5))]
+    return "https://%s/%s" % (_host(rng), "/".join(segments))
+
+
+def dotsegments(rng):
+    """Relative references with many dot-segments."""
+    segments = rng.choices(["..", ".", *WORDS], k=rng.randint(3, 12))
+    return "/".join(segments)
+
+
+def rfc3986(rng):
+    """RFC 3986 reference resolution examples."""
+    return rng.choice(RFC3986_EXAMPLES)
+
+
+KINDS = {
+    "short": short,
+    "long": long,
+    "query": query,
+    "ipv6": ipv6,
+    "percent": percent,
+    "dotsegments": dotsegments,
+    "rfc3986": rfc3986,
+}
+
+
+def corpus(kind, count, seed=0):
+    """Return a list of `count` URI reference strings of the given kind."""
+    # str seeds are hashed using SHA-512, so they are not randomized
+    rng = random.Random("%s:%d" % (kind, seed))
+    generate = KINDS[kind]
+    return [generate(rng) for _ in range(count)]
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    kinds = [args[0]] if args else list(KINDS)
+    count = int(args[1]) if len(args) > 1 else 10
+    seed = int(args[2]) if len(args) > 2 else 0
+    for kind in kinds:
+        for uri in corpus(kind, count, seed):
+            print(uri)
+
+
+if __name__ == "__main__":
+    main()
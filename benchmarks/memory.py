@@ -0,0 +1,77 @@
+"""Compare memory usage of split URI reference representations.
+
+Usage: python benchmarks/memory.py [OPTIONS]
+
+The memory held by a list of :func:`uritools.urisplit` results for
+the URI references from ``corpus.py`` is compared to that of
+:func:`uritools.urisplitcompact` results, using :mod:`tracemalloc`.
+The URI reference strings themselves are created before tracing
+starts, so they are not included in the results.
+Note that compact results keep a reference to their URI reference
+string, so its size has to be added if the string would not be kept
+otherwise.
+
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+
+from corpus import KINDS, corpus
+
+import uritools
+
+
+def measure(func, uris):
+    gc.collect()
+    tracemalloc.start()
+    results = [func(uri) for uri in uris]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python benchmarks/memory.py",
+        description="Compare memory usage of split URI references.",
+    )
+    parser.add_argument(
+        "-c",
+        "--count",
+        type=int,
+        default=10000,
+        help="URI references per corpus kind (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-k",
+        "--kind",
+        dest="kinds",
+        action="append",
+        choices=KINDS,
+        help="corpus kind, may be repeated (default: all)",
+    )
+    parser.add_argument(
+        "-s", "--seed", type=int, default=0, help="corpus seed (default: %(default)s)"
+    )
+    args = parser.parse_args(argv)
+    uris = []
+    for kind in args.kinds or KINDS:
+        uris.extend(corpus(kind, args.count, args.seed))
+    count = len(uris)
+    length = sum(map(len, uris)) / count
+    strings = sum(map(sys.getsizeof, uris)) / count
+    print("%d URI references, %.1f characters on average" % (count, length))
+    print("%-16s %8.1f bytes per URI reference" % ("strings", strings))
+    for name, func in [
+        ("urisplit", uritools.urisplit),
+        ("urisplitcompact", uritools.urisplitcompact),
+    ]:
+        size = measure(func, uris)
+        print("%-16s %8.1f bytes per URI reference" % (name, size / count))
+
+
+if __name__ == "__main__":
+    main()
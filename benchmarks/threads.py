@@ -0,0 +1,114 @@
+"""Measure throughput of URI functions versus number of threads.
+
+Usage: python benchmarks/threads.py [OPTIONS]
+
+The URI references from ``corpus.py`` are divided evenly among an
+increasing number of threads, up to the number given with ``-t``
+(default: number of CPUs), and the total throughput and speedup
+relative to a single thread is reported.
+On standard Python builds, the global interpreter lock prevents any
+speedup; use a free-threaded build to measure scaling.
+
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+from corpus import KINDS, corpus
+
+import uritools
+
+
+def run(func, items, nthreads):
+    size = -(-len(items) // nthreads)
+    chunks = [items[i : i + size] for i in range(0, len(items), size)]
+    barrier = threading.Barrier(len(chunks) + 1)
+
+    def worker(chunk):
+        barrier.wait()
+        for item in chunk:
+            func(item)
+
+    threads = [threading.Thread(target=worker, args=(c,)) for c in chunks]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python benchmarks/threads.py",
+        description="Measure uritools throughput versus number of threads.",
+    )
+    parser.add_argument(
+        "-c",
+        "--count",
+        type=int,
+        default=20000,
+        help="URI references per corpus kind (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-k",
+        "--kind",
+        dest="kinds",
+        action="append",
+        choices=KINDS,
+        help="corpus kind, may be repeated (default: all)",
+    )
+    parser.add_argument(
+        "-s", "--seed", type=int, default=0, help="corpus seed (default: %(default)s)"
+    )
+    parser.add_argument(
+        "-t",
+        "--threads",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="maximum number of threads (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+    if args.threads < 1:
+        parser.error("invalid number of threads: %d" % args.threads)
+    nthreads = [1]
+    while nthreads[-1] * 2 <= args.threads:
+        nthreads.append(nthreads[-1] * 2)
+    if nthreads[-1] != args.threads:
+        nthreads.append(args.threads)
+    uris = []
+    for kind in args.kinds or KINDS:
+        uris.extend(corpus(kind, args.count, args.seed))
+    parts = list(map(uritools.urisplit, uris))
+    paths = [uritools.uridecode(p.path, errors="replace") for p in parts]
+    count = len(uris)
+    enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        "Python %s, GIL %s"
+        % (sys.version.split()[0], "enabled" if enabled else "disabled")
+    )
+    print("%d operations per function" % count)
+    for name, func, items in [
+        ("uriencode", lambda s: uritools.uriencode(s, "/"), paths),
+        ("uridecode", uritools.uridecode, uris),
+        ("urisplit", uritools.urisplit, uris),
+        ("urinormalize", uritools.urinormalize, uris),
+        ("gethost", uritools.SplitResult.gethost, parts),
+        ("getport", uritools.SplitResult.getport, parts),
+    ]:
+        base = None
+        for n in nthreads:
+            elapsed = run(func, items, n)
+            rate = count / elapsed
+            base = base or rate
+            print(
+                "%-12s %3d threads %12.0f ops/s %6.2fx" % (name, n, rate, rate / base)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""Compare uritools with equivalent urllib.parse operations.
+
+Usage: python benchmarks/urllibparse.py [OPTIONS] [OPERATION ...]
+
+Each operation is run over the same corpus of URI reference strings
+from ``corpus.py`` using both uritools and :mod:`urllib.parse`, and
+throughput, per-call latency percentiles and peak memory of retained
+results are reported side by side.  Operations where uritools is
+slower than urllib.parse by more than the given factor are flagged,
+and the exit status is 1 if there are any.
+
+The reported ratio is the time taken by uritools relative to
+urllib.parse, so values below 1.0 mean uritools is faster.  Note that
+operations are equivalent, not identical: for example,
+:func:`uritools.uriencode` returns :class:`bytes`,
+:func:`urllib.parse.urljoin` does not implement RFC 3986 reference
+resolution for all schemes, and :func:`urllib.parse.urlsplit` caches
+results for recently used arguments.
+
+"""
+
+import argparse
+import collections
+import gc
+import ipaddress
+import json
+import sys
+import time
+import tracemalloc
+from urllib.parse import (
+    parse_qsl,
+    quote,
+    unquote,
+    urlencode,
+    urljoin,
+    urlsplit,
+    urlunsplit,
+)
+
+from corpus import BASE, KINDS, corpus
+
+import uritools
+
+
+def _compose_args(uri):
+    parts = uritools.urisplit(uri)
+    return (
+        parts.getscheme(),
+        parts.gethost(),
+        parts.getport(),
+        parts.getpath(errors="replace"),
+        parts.getquerylist(errors="replace"),
+        parts.getfragment(errors="replace"),
+    )
+
+
+def _uricompose(args):
+    scheme, host, port, path, query, fragment = args
+    return uritools.uricompose(
+        scheme, None, path, query, fragment, host=host, port=port
+    )
+
+
+def _urlcompose(args):
+    scheme, host, port, path, query, fragment = args
+    if host is None:
+        netloc = ""
+    elif isinstance(host, ipaddress.IPv6Address):
+        netloc = "[%s]" % host
+    else:
+        netloc = str(host)
+    if port is not None:
+        netloc += ":%d" % port
+    query = urlencode(query, quote_via=quote) if query else ""
+    fragment = quote(fragment) if fragment else ""
+    return urlunsplit((scheme or "", netloc, quote(path), query, fragment))
+
+
+# operation name -> (prepare input, uritools function, urllib function)
+OPERATIONS = {
+    "split": (None, uritools.urisplit, urlsplit),
+    "join": (
+        None,
+        lambda ref: uritools.urijoin(BASE, ref),
+        lambda ref: urljoin(BASE, ref),
+    ),
+    "encode": (
+        lambda uri: unquote(uri, errors="replace"),
+        lambda s: uritools.uriencode(s, "/"),
+        lambda s: quote(s, "/"),
+    ),
+    "decode": (None, uritools.uridecode, unquote),
+    "querylist": (
+        None,
+        lambda uri: uritools.urisplit(uri).getquerylist(),
+        lambda uri: parse_qsl(urlsplit(uri).query, keep_blank_values=True),
+    ),
+    "compose": (_compose_args, _uricompose, _urlcompose),
+}
+
+
+def throughput(func, items, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        collections.deque(map(func, items), maxlen=0)
+        best = min(best, time.perf_counter() - start)
+    return len(items) / best
+
+
+def latencies(func, items):
+    clock = time.perf_counter_ns
+    # subtract the overhead of reading the clock from each sample
+    samples = []
+    for _ in range(1000):
+        start = clock()
+        samples.append(clock() - start)
+    overhead = min(samples)
+    result = []
+    for item in items:
+        start = clock()
+        func(item)
+        result.append(max(clock() - start - overhead, 0))
+    result.sort()
+    return {
+        "p%d" % p: result[min(len(result) * p // 100, len(result) - 1)]
+        for p in (50, 90, 99)
+    }
+
+
+def peakmemory(func, items):
+    gc.collect()
+    tracemalloc.start()
+    results = list(map(func, items))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return peak
+
+
+def measure(func, items, repeat):
+    return {
+        "ops": throughput(func, items, repeat),
+        **latencies(func, items),
+        "peak": peakmemory(func, items),
+    }
+
+
+def run(args):
+    uris = []
+    for kind in args.kinds:
+        uris.extend(corpus(kind, args.count, args.seed))
+    results = {}
+    for name, (prepare, urifunc, urlfunc) in OPERATIONS.items():
+        if args.operations and name not in args.operations:
+            continue
+        items = list(map(prepare, uris)) if prepare else uris
+        results[name] = {
+            "uritools": measure(urifunc, items, args.repeat),
+            "urllib": measure(urlfunc, items, args.repeat),
+        }
+    return results
+
+
+def report(results, factor):
+    flagged = []
+    print(
+        "%-10s %-9s %12s %8s %8s %8s %10s %7s"
+        % (
+            "operation",
+            "library",
+            "ops/s",
+            "p50 ns",
+            "p90 ns",
+            "p99 ns",
+            "peak KiB",
+            "ratio",
+        )
+    )
+    for name, result in results.items():
+        ratio = result["urllib"]["ops"] / result["uritools"]["ops"]
+        for library in ("uritools", "urllib"):
+            r = result[library]
+            print(
+                "%-10s %-9s %12.0f %8d %8d %8d %10.1f %s"
+                % (
+                    name,
+                    library,
+                    r["ops"],
+                    r["p50"],
+                    r["p90"],
+                    r["p99"],
+                    r["peak"] / 1024,
+                    "%6.2fx" % ratio if library == "uritools" else "",
+                )
+            )
+        if ratio > factor:
+            flagged.append(name)
+    if flagged:
+        print("uritools slower by more than %.2fx: %s" % (factor, ", ".join(flagged)))
+    return flagged
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python benchmarks/urllibparse.py",
+        description="Compare uritools with urllib.parse.",
+    )
+    parser.add_argument(
+        "operations",
+        metavar="OPERATION",
+        nargs="*",
+        help="operations to compare (default: all): %s" % ", ".join(OPERATIONS),
+    )
+    parser.add_argument(
+        "-c",
+        "--count",
+        type=int,
+        default=1000,
+        help="URI references per corpus kind (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-k",
+        "--kind",
+        dest="kinds",
+        action="append",
+        choices=KINDS,
+        help="corpus kind, may be repeated (default: all)",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="throughput repetitions (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-s", "--seed", type=int, default=0, help="corpus seed (default: %(default)s)"
+    )
+    parser.add_argument(
+        "-f",
+        "--factor",
+        type=float,
+        default=1.5,
+        help="flag operations slower by more than this factor (default: %(default)s)",
+    )
+    parser.add_argument("-o", "--output", help="also write results as JSON to file")
+    args = parser.parse_args(argv)
+    for name in args.operations:
+        if name not in OPERATIONS:
+            parser.error("invalid operation: %r" % name)
+    if args.kinds is None:
+        args.kinds = list(KINDS)
+
+    results = run(args)
+    flagged = report(results, args.factor)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump({"factor": args.factor, "results": results}, f, indent=2)
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
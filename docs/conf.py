@@ -16,3 +16,11 @@ exclude_patterns = ["_build"]
 master_doc = "index"
 html_theme = "classic"
 intersphinx_mapping = {"python": ("https://docs.python.org/3", None)}
+
+# optional dependencies for doctests
+doctest_global_setup = """
+try:
+    import numpy
+except ImportError:
+    numpy = None
+"""
@@ -6,30 +6,63 @@ commonly used functions of the Python Standard Library
 
 """
 
+import array
+import codecs
 import collections
 import collections.abc
+import functools
+import hashlib
 import ipaddress
+import itertools
 import numbers
 import re
-from string import hexdigits
+import threading
+from string import ascii_lowercase, ascii_uppercase, hexdigits
 
 __all__ = (
     "GEN_DELIMS",
     "RESERVED",
     "SUB_DELIMS",
     "UNRESERVED",
+    "AuthorityCache",
+    "HostCache",
+    "IncrementalURIDecoder",
+    "InternCache",
+    "PathCache",
+    "PercentEncoder",
+    "SchemeNormalizer",
+    "SplitCache",
+    "URIComposer",
+    "URISet",
+    "URITemplate",
     "isabspath",
+    "isabspathmask",
     "isabsuri",
+    "isabsurimask",
     "isnetpath",
+    "isnetpathmask",
     "isrelpath",
+    "isrelpathmask",
     "issamedoc",
+    "issamedocmask",
     "isuri",
+    "isurimask",
+    "registerscheme",
     "uricompose",
     "uridecode",
     "uridefrag",
     "uriencode",
+    "uriexpand",
+    "urifingerprint",
     "urijoin",
+    "urijoinall",
+    "urinormalize",
+    "urinormalizeall",
+    "uriscan",
     "urisplit",
+    "urisplitbatch",
+    "urisplitcompact",
+    "urisplitspans",
     "uriunsplit",
 )
 
@@ -57,53 +90,165 @@ UNRESERVED = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~
 
 _unreserved = frozenset(UNRESERVED.encode())
 
+_decoded = {
+    (a + b).encode(): bytes.fromhex(a + b) for a in hexdigits for b in hexdigits
+}
+
+
 # RFC 3986 2.1: For consistency, URI producers and normalizers should
 # use uppercase hexadecimal digits for all percent-encodings.
-_encoded = {
-    b"": [
-        bytes([i]) if i in _unreserved else ("%%%02X" % i).encode() for i in range(256)
-    ]
-}
+_escaped = [("%%%02X" % i).encode() for i in range(256)]
 
-_decoded = {
-    (a + b).encode(): bytes.fromhex(a + b) for a in hexdigits for b in hexdigits
+_bytes = [bytes([i]) for i in range(256)]
+
+# RFC 3986 6.2.2.2: Percent-encoded octets corresponding to unreserved
+# characters should be decoded by URI normalizers.
+_pctnormal = {
+    b"%" + k: v if v[0] in _unreserved else _escaped[v[0]] for k, v in _decoded.items()
 }
 
 
+class PercentEncoder:
+    """Reusable encoder for URI strings or string components."""
+
+    __slots__ = ("__encoded", "__safe")
+
+    # maximum number of distinct characters to replace individually
+    _MAXREPLACE = 8
+
+    def __init__(self, safe=""):
+        if isinstance(safe, str):
+            safe = safe.encode("ascii")
+        chars = _unreserved.union(safe)
+        self.__safe = bytes(sorted(chars))
+        self.__encoded = [_bytes[i] if i in chars else _escaped[i] for i in range(256)]
+
+    @property
+    def safe(self):
+        return self.__safe
+
+    def encode(self, uristring, encoding="utf-8", errors="strict"):
+        """Encode a URI string or string component."""
+        if not isinstance(uristring, bytes):
+            uristring = uristring.encode(encoding, errors)
+        unsafe = uristring.translate(None, self.__safe)
+        if not unsafe:
+            return uristring
+        unsafe = set(unsafe)
+        if len(unsafe) > self._MAXREPLACE:
+            return b"".join(map(self.__encoded.__getitem__, uristring))
+        # "%" must be replaced first, since it is part of any replacement
+        if 0x25 in unsafe:
+            uristring = uristring.replace(b"%", b"%25")
+            unsafe.discard(0x25)
+        for i in unsafe:
+            uristring = uristring.replace(_bytes[i], _escaped[i])
+        return uristring
+
+
+@functools.lru_cache(maxsize=128)
+def _encoder(safe):
+    return PercentEncoder(safe).encode
+
+
+def _getencoder(safe):
+    # precomputed encoders are looked up without going through the
+    # shared LRU cache
+    encode = _encoders.get(safe)
+    if encode is None:
+        if not isinstance(safe, bytes):
+            safe = safe.encode("ascii")
+        encode = _encoder(safe)
+    return encode
+
+
 def uriencode(uristring, safe="", encoding="utf-8", errors="strict"):
     """Encode a URI string or string component."""
-    if not isinstance(uristring, bytes):
-        uristring = uristring.encode(encoding, errors)
-    if not isinstance(safe, bytes):
-        safe = safe.encode("ascii")
-    # FIXME: though unlikely, _encoded may grow without bounds if arbitrary
-    # safe values are passed by a caller - consider using @functools.lru_cache
-    # instead of plain dict?
-    try:
-        encoded = _encoded[safe]
-    except KeyError:
-        encoded = _encoded[b""][:]
-        for i in safe:
-            encoded[i] = bytes([i])  # type: ignore
-        _encoded[safe] = encoded
-    return b"".join(map(encoded.__getitem__, uristring))
+    return _getencoder(safe)(uristring, encoding, errors)
+
+
+# ASCII-compatible encodings for which uridecode() may return
+# percent-encoding-free ASCII strings unchanged
+_ascii_encodings = frozenset(["ascii", "latin-1", "latin1", "utf-8", "utf8"])
+
+
+def _percentdecode(uristring):
+    parts = uristring.split(b"%")
+    decode = _decoded.get
+    for i in range(1, len(parts)):
+        s = parts[i]
+        parts[i] = decode(s[:2], b"%" + s[:2]) + s[2:]
+    return b"".join(parts)
 
 
 def uridecode(uristring, encoding="utf-8", errors="strict"):
     """Decode a URI string or string component."""
     if not isinstance(uristring, bytes):
+        if (
+            encoding in _ascii_encodings
+            and "%" not in uristring
+            and uristring.isascii()
+        ):
+            return uristring
         uristring = uristring.encode(encoding or "ascii", errors)
-    parts = uristring.split(b"%")
-    result = [parts[0]]
-    append = result.append
-    decode = _decoded.get
-    for s in parts[1:]:
-        append(decode(s[:2], b"%" + s[:2]))
-        append(s[2:])
+    if b"%" in uristring:
+        uristring = _percentdecode(uristring)
     if encoding is not None:
-        return b"".join(result).decode(encoding, errors)
+        return uristring.decode(encoding, errors)
     else:
-        return b"".join(result)
+        return uristring
+
+
+class IncrementalURIDecoder:
+    """Incremental decoder for URI strings or string components."""
+
+    def __init__(self, encoding="utf-8", errors="strict"):
+        self.encoding = encoding
+        self.errors = errors
+        if encoding is not None:
+            self.__decoder = codecs.getincrementaldecoder(encoding)(errors)
+        else:
+            self.__decoder = None
+        self.__pending = b""
+
+    def decode(self, input, final=False):
+        """Decode `input` and return the resulting string."""
+        if not isinstance(input, bytes):
+            input = input.encode(self.encoding or "ascii", self.errors)
+        data = self.__pending + input
+        # keep an incomplete percent-encoding for the next call
+        index = -1 if final else data.find(b"%", max(len(data) - 2, 0))
+        if index >= 0:
+            data, self.__pending = data[:index], data[index:]
+        else:
+            self.__pending = b""
+        if b"%" in data:
+            data = _percentdecode(data)
+        if self.__decoder is not None:
+            return self.__decoder.decode(data, final)
+        else:
+            return data
+
+    def reset(self):
+        """Reset the decoder to its initial state."""
+        if self.__decoder is not None:
+            self.__decoder.reset()
+        self.__pending = b""
+
+    def getstate(self):
+        """Return the current state of the decoder."""
+        if self.__decoder is not None:
+            buffer, flag = self.__decoder.getstate()
+            return (uriencode(buffer) + self.__pending, flag)
+        else:
+            return (self.__pending, 0)
+
+    def setstate(self, state):
+        """Set the current state of the decoder."""
+        buffer, flag = state
+        if self.__decoder is not None:
+            self.__decoder.setstate((b"", flag))
+        self.__pending = buffer
 
 
 class DefragResult(collections.namedtuple("DefragResult", "uri fragment")):
@@ -195,24 +340,32 @@ class SplitResult(
             result.extend([self._HASH, fragment])
         return self._EMPTY.join(result)
 
-    def getscheme(self, default=None):
+    def getscheme(self, default=None, intern=None):
         """Return the URI scheme in canonical (lowercase) form, or `default`
         if the original URI reference did not contain a scheme component.
 
+        If `intern` is given, it must be an :class:`InternCache`
+        instance used to share equal return values.
+
         """
         # FIXME: should getscheme() return bytes if geturi() returns bytes?
         scheme = self.scheme
         if scheme is None:
             return default
         elif isinstance(scheme, bytes):
-            return scheme.decode("ascii").lower()
-        else:
+            scheme = scheme.decode("ascii")
+        if intern is None:
             return scheme.lower()
+        else:
+            return intern(scheme.lower())
 
-    def getauthority(self, default=None, encoding="utf-8", errors="strict"):
+    def getauthority(self, default=None, encoding="utf-8", errors="strict", cache=None):
         """Return the decoded userinfo, host and port subcomponents of the URI
         authority as a three-item tuple.
 
+        If `cache` is given, it must be an :class:`AuthorityCache`
+        instance used to look up and store parsed authorities.
+
         """
         # TBD: (userinfo, host, port) kwargs, default string?
         if default is None:
@@ -221,11 +374,17 @@ class SplitResult(
             raise TypeError("Invalid default type")
         elif len(default) != 3:
             raise ValueError("Invalid default length")
-        # TODO: this could be much more efficient by using a dedicated regex
+        authority = self.authority
+        if authority is None:
+            return tuple(default)
+        elif cache is None:
+            userinfo, host, port = _parseauthority(authority, encoding, errors)
+        else:
+            userinfo, host, port = cache(authority, encoding, errors)
         return (
-            self.getuserinfo(default[0], encoding, errors),
-            self.gethost(default[1], errors),
-            self.getport(default[2]),
+            default[0] if userinfo is None else userinfo,
+            default[1] if host == "" and default[1] is not None else host,
+            default[2] if port is None else port,
         )
 
     def getuserinfo(self, default=None, encoding="utf-8", errors="strict"):
@@ -240,27 +399,25 @@ class SplitResult(
         else:
             return uridecode(userinfo, encoding, errors)
 
-    def gethost(self, default=None, errors="strict"):
+    def gethost(self, default=None, errors="strict", intern=None, cache=None):
         """Return the decoded host subcomponent of the URI authority as a
         string or an :mod:`ipaddress` address object, or `default` if
         the original URI reference did not contain a host.
 
+        If `intern` is given, it must be an :class:`InternCache`
+        instance used to share equal return values.  If `cache` is
+        given, it must be a :class:`HostCache` instance used to look
+        up and store parsed hosts.
+
         """
         host = self.host
         if host is None or (not host and default is not None):
             return default
-        elif host.startswith(self._LBRACKET) and host.endswith(self._RBRACKET):
-            return self.__parse_ip_literal(host[1:-1])
-        elif host.startswith(self._LBRACKET) or host.endswith(self._RBRACKET):
-            raise ValueError("Invalid host %r: mismatched brackets" % host)
-        # TODO: faster check for IPv4 address?
-        try:
-            if isinstance(host, bytes):
-                return ipaddress.IPv4Address(host.decode("ascii"))
-            else:
-                return ipaddress.IPv4Address(host)
-        except ValueError:
-            return uridecode(host, "utf-8", errors).lower()
+        elif cache is None:
+            result = _parsehost(host, errors)
+        else:
+            result = cache(host, errors)
+        return result if intern is None else intern(result)
 
     def getport(self, default=None):
         """Return the port subcomponent of the URI authority as an
@@ -274,9 +431,14 @@ class SplitResult(
         else:
             return default
 
-    def getpath(self, encoding="utf-8", errors="strict"):
-        """Return the normalized decoded URI path."""
-        path = self.__remove_dot_segments(self.path)
+    def getpath(self, encoding="utf-8", errors="strict", cache=None):
+        """Return the normalized decoded URI path.
+
+        If `cache` is given, it must be a :class:`PathCache` instance
+        used to look up and store paths with dot-segments removed.
+
+        """
+        path = self.__remove_dot_segments(self.path, cache)
         return uridecode(path, encoding, errors)
 
     def getquery(self, default=None, encoding="utf-8", errors="strict"):
@@ -326,6 +488,22 @@ class SplitResult(
             result.append((name, value))
         return result
 
+    def getqueryview(self, sep="&", encoding="utf-8", errors="strict"):
+        """Return a lazy, read-only view of the query variables separated
+        by `sep`, decoding names and values only when needed.
+
+        """
+        query = self.query or self._EMPTY
+        if isinstance(sep, type(query)):
+            pass
+        elif isinstance(sep, bytes):
+            sep = sep.decode("ascii")
+        else:
+            sep = sep.encode("ascii")
+        if not sep:
+            raise ValueError("empty separator")
+        return QueryView(query, sep, self._EQ, encoding, errors)
+
     def getfragment(self, default=None, encoding="utf-8", errors="strict"):
         """Return the decoded fragment identifier, or `default` if the
         original URI reference did not contain a fragment component.
@@ -374,19 +552,31 @@ class SplitResult(
             and self.query is None
         )
 
-    def transform(self, ref, strict=False):
+    def transform(self, ref, strict=False, cache=None):
         """Transform a URI reference relative to `self` into a
         :class:`SplitResult` representing its target URI.
 
+        If `cache` is given, it must be a :class:`PathCache` instance
+        used to look up and store paths with dot-segments removed.
+
         """
+        return self.__transform(None, strict, cache, ref)
+
+    def _transformer(self, strict=False, cache=None):
+        # return a function for transforming multiple references
+        # relative to self, precomputing the merge prefix once
+        return functools.partial(self.__transform, self.__prefix(), strict, cache)
+
+    def __transform(self, prefix, strict, cache, ref):
+        # if prefix is None, it is only computed when needed
         scheme, authority, path, query, fragment = self._match(ref).groups()
 
         # RFC 3986 5.2.2. Transform References
         if scheme is not None and (strict or scheme != self.scheme):
-            path = self.__remove_dot_segments(path)
+            path = self.__remove_dot_segments(path, cache)
         elif authority is not None:
             scheme = self.scheme
-            path = self.__remove_dot_segments(path)
+            path = self.__remove_dot_segments(path, cache)
         elif not path:
             scheme = self.scheme
             authority = self.authority
@@ -395,23 +585,135 @@ class SplitResult(
         elif path.startswith(self._SLASH):
             scheme = self.scheme
             authority = self.authority
-            path = self.__remove_dot_segments(path)
+            path = self.__remove_dot_segments(path, cache)
         else:
             scheme = self.scheme
             authority = self.authority
-            path = self.__remove_dot_segments(self.__merge(path))
+            if prefix is None:
+                prefix = self.__prefix()
+            path = self.__remove_dot_segments(prefix + path, cache)
         return type(self)(scheme, authority, path, query, fragment)
 
-    def __merge(self, path):
+    def __prefix(self):
         # RFC 3986 5.2.3. Merge Paths
         if self.authority is not None and not self.path:
-            return self._SLASH + path
+            return self._SLASH
+        else:
+            head, sep, _ = self.path.rpartition(self._SLASH)
+            return head + sep
+
+    def normalize(self):
+        """Return a :class:`SplitResult` representing the normalized URI
+        reference.
+
+        """
+        parts = self.__normalize(self.geturi())
+        return self if parts is None else parts
+
+    @classmethod
+    def _normalize(cls, uristring):
+        parts = cls.__normalize(uristring)
+        return uristring if parts is None else parts.geturi()
+
+    @classmethod
+    def __normalize(cls, uristring):
+        # RFC 3986 6.2.2. Syntax-Based Normalization
+        ref = uristring
+        if cls._PERCENT in ref and cls._PCT_NONNORMAL_RE.search(ref):
+            # encode stray "%" characters first, so decoding cannot
+            # form new percent-encodings
+            ref = cls._PCT_INVALID_RE.sub(cls._PCT_ESCAPED, ref)
+            ref = cls._PCT_NONNORMAL_RE.sub(cls.__normalize_pct, ref)
+        scheme, authority, path, query, fragment = cls._match(ref).groups()
+        changed = ref is not uristring
+        if changed and scheme is not None and cls._match(uristring).group(1) is None:
+            # RFC 3986 4.2: decoding must not turn the first segment of
+            # a relative-path reference into a scheme name
+            ref = cls._DOT + cls._SLASH + ref
+            scheme, authority, path, query, fragment = cls._match(ref).groups()
+        # RFC 3986 6.2.2.1: scheme and host are case-insensitive
+        if scheme is not None and scheme != scheme.lower():
+            scheme = scheme.lower()
+            changed = True
+        if authority is not None:
+            normalized = cls.__normalize_authority(authority)
+            if normalized != authority:
+                authority = normalized
+                changed = True
+        # RFC 3986 6.2.2.3: remove dot-segments from paths that would
+        # be subject to remove_dot_segments() when resolved
+        if scheme is not None or authority is not None or path.startswith(cls._SLASH):
+            normalized = cls.__remove_dot_segments(path)
+            # prevent path from being interpreted as authority
+            if authority is None and normalized.startswith(cls._SLASH * 2):
+                normalized = cls._SLASH + cls._DOT + normalized
+            if normalized != path:
+                path = normalized
+                changed = True
+        # RFC 3986 6.2.3. Scheme-Based Normalization
+        normalizer = _schemes.get(scheme)
+        if normalizer is None and not changed:
+            return None
+        parts = cls(scheme, authority, path, query, fragment)
+        if normalizer is not None:
+            result = normalizer(parts)
+            if result is parts and not changed:
+                return None
+            parts = result
+        return parts
+
+    @classmethod
+    def __normalize_pct(cls, match):
+        return cls._PCT_NORMAL(match.group())
+
+    @classmethod
+    def __normalize_authority(cls, authority):
+        # most authorities are already in normal form
+        if (
+            authority.islower()
+            and cls._PERCENT not in authority
+            and not authority.endswith(cls._COLON)
+        ):
+            return authority
+        userinfo, host, port = cls._split_authority(authority)
+        if host.isascii():
+            lower = host.lower()
+        else:
+            lower = host.translate(cls._LOWER)
+        # RFC 3986 2.1: percent-encodings should use uppercase hex digits
+        if cls._PERCENT in lower:
+            lower = cls._PCT_RE.sub(cls.__upper, lower)
+        if lower == host and port != cls._EMPTY:
+            return authority
+        result = []
+        if userinfo is not None:
+            result.extend([userinfo, cls._AT])
+        result.append(lower)
+        if port:
+            result.extend([cls._COLON, port])
+        normalized = cls._EMPTY.join(result)
+        # RFC 3986 6.2.3: an empty port component should be omitted,
+        # unless this would change how the authority is split
+        if port == cls._EMPTY and cls._split_authority(normalized)[1] != lower:
+            normalized += cls._COLON
+        return normalized
+
+    @staticmethod
+    def __upper(match):
+        return match.group().upper()
+
+    @classmethod
+    def __remove_dot_segments(cls, path, cache=None):
+        # most paths do not contain any dot-segments at all
+        if not (cls._DOT in path and cls._DOTSEGMENT_RE.search(path)):
+            return path
+        elif cache is None:
+            return cls._remove_dot_segments(path)
         else:
-            parts = self.path.rpartition(self._SLASH)
-            return parts[1].join((parts[0], path))
+            return cache(path)
 
     @classmethod
-    def __remove_dot_segments(cls, path):
+    def _remove_dot_segments(cls, path):
         # RFC 3986 5.2.4. Remove Dot Segments
         pseg = []
         for s in path.split(cls._SLASH):
@@ -433,27 +735,15 @@ class SplitResult(
         return cls._SLASH.join(pseg)
 
     @classmethod
-    def __parse_ip_literal(cls, address):
-        # RFC 3986 3.2.2: In anticipation of future, as-yet-undefined
-        # IP literal address formats, an implementation may use an
-        # optional version flag to indicate such a format explicitly
-        # rather than rely on heuristic determination.
-        #
-        #  IP-literal = "[" ( IPv6address / IPvFuture  ) "]"
-        #
-        #  IPvFuture  = "v" 1*HEXDIG "." 1*( unreserved / sub-delims / ":" )
-        #
-        # If a URI containing an IP-literal that starts with "v"
-        # (case-insensitive), indicating that the version flag is
-        # present, is dereferenced by an application that does not
-        # know the meaning of that version flag, then the application
-        # should return an appropriate error for "address mechanism
-        # not supported".
-        if isinstance(address, bytes):
-            address = address.decode("ascii")
-        if address.startswith("v"):
-            raise ValueError("address mechanism not supported")
-        return ipaddress.IPv6Address(address)
+    def _split_authority(cls, authority):
+        # RFC 3986 3.2: authority = [ userinfo "@" ] host [ ":" port ]
+        userinfo, at, hostinfo = authority.rpartition(cls._AT)
+        host, colon, port = hostinfo.rpartition(cls._COLON)
+        if port.lstrip(cls._DIGITS):
+            host, port = hostinfo, None
+        elif not colon:
+            port = None
+        return (userinfo if at else None, host, port)
 
 
 # TODO: make private?
@@ -489,11 +779,29 @@ class SplitResultBytes(SplitResult):
 
     # RFC 3986 3.3 dot-segments
     _DOT, _DOTDOT = b".", b".."
+    _DOTSEGMENT_RE = re.compile(rb"(?:\A|/)\.\.?(?:/|\Z)")
 
     _EMPTY, _EQ = b"", b"="
 
     _DIGITS = b"0123456789"
 
+    # RFC 3986 6.2.2.1: case normalization applies to ASCII letters only
+    _LOWER = bytes.maketrans(ascii_uppercase.encode(), ascii_lowercase.encode())
+
+    # RFC 3986 2.1 percent-encoding
+    _PERCENT = b"%"
+    _PCT_RE = re.compile(rb"%[0-9A-Fa-f]{2}")
+    _PCT_INVALID_RE = re.compile(rb"%(?![0-9A-Fa-f]{2})")
+    _PCT_ESCAPED = b"%25"
+
+    # RFC 3986 6.2.2 percent-encodings with lowercase hex digits or
+    # corresponding to unreserved characters
+    _PCT_NONNORMAL_RE = re.compile(
+        rb"%(?:[a-f][0-9A-Fa-f]|[0-9A-F][a-f]|2[DE]|3[0-9]|4[1-9A-F]|5[0-9AF]"
+        rb"|6[1-9A-F]|7[0-9AE])"
+    )
+    _PCT_NORMAL = _pctnormal.__getitem__
+
 
 # TODO: make private?
 class SplitResultString(SplitResult):
@@ -528,11 +836,203 @@ class SplitResultString(SplitResult):
 
     # RFC 3986 3.3 dot-segments
     _DOT, _DOTDOT = ".", ".."
+    _DOTSEGMENT_RE = re.compile(r"(?:\A|/)\.\.?(?:/|\Z)")
 
     _EMPTY, _EQ = "", "="
 
     _DIGITS = "0123456789"
 
+    # RFC 3986 6.2.2.1: case normalization applies to ASCII letters only
+    _LOWER = str.maketrans(ascii_uppercase, ascii_lowercase)
+
+    # RFC 3986 2.1 percent-encoding
+    _PERCENT = "%"
+    _PCT_RE = re.compile(r"%[0-9A-Fa-f]{2}")
+    _PCT_INVALID_RE = re.compile(r"%(?![0-9A-Fa-f]{2})")
+    _PCT_ESCAPED = "%25"
+
+    # RFC 3986 6.2.2 percent-encodings with lowercase hex digits or
+    # corresponding to unreserved characters
+    _PCT_NONNORMAL_RE = re.compile(
+        r"%(?:[a-f][0-9A-Fa-f]|[0-9A-F][a-f]|2[DE]|3[0-9]|4[1-9A-F]|5[0-9AF]"
+        r"|6[1-9A-F]|7[0-9AE])"
+    )
+    _PCT_NORMAL = {k.decode(): v.decode() for k, v in _pctnormal.items()}.__getitem__
+
+
+# syntactic host types returned by _hosttype()
+_IPLITERAL = "IP-literal"
+_IPVFUTURE = "IPvFuture"
+_IPV6ADDRESS = "IPv6address"
+_IPV4ADDRESS = "IPv4address"
+_REGNAME = "reg-name"
+_INVALID = "invalid"
+
+# RFC 3986 3.2.2: IPv4address = dec-octet "." dec-octet "." dec-octet "." dec-octet
+_IPV4_RE = re.compile(r"[0-9]{1,3}(?:\.[0-9]{1,3}){3}\Z")
+
+
+def _hosttype(host):
+    # RFC 3986 3.2.2: The host subcomponent of authority is identified
+    # by an IP literal encapsulated within square brackets, an IPv4
+    # address in dotted-decimal form, or a registered name.
+    #
+    #  host       = IP-literal / IPv4address / reg-name
+    #
+    #  IP-literal = "[" ( IPv6address / IPvFuture  ) "]"
+    #
+    #  IPvFuture  = "v" 1*HEXDIG "." 1*( unreserved / sub-delims / ":" )
+    #
+    # If a URI containing an IP-literal that starts with "v"
+    # (case-insensitive), indicating that the version flag is
+    # present, is dereferenced by an application that does not
+    # know the meaning of that version flag, then the application
+    # should return an appropriate error for "address mechanism
+    # not supported".
+    #
+    # Only syntactic checks are performed here, so callers need to
+    # construct ipaddress objects only for hosts that look like IP
+    # addresses, which avoids raising exceptions for registered names.
+    if host.startswith("["):
+        if not host.endswith("]"):
+            return _INVALID
+        elif host[1:2] in ("v", "V"):
+            return _IPVFUTURE
+        else:
+            return _IPLITERAL
+    elif host.endswith("]"):
+        return _INVALID
+    elif ":" in host:
+        return _IPV6ADDRESS  # without brackets
+    elif _IPV4_RE.match(host):
+        return _IPV4ADDRESS
+    else:
+        return _REGNAME
+
+
+def _parseauthority(authority, encoding, errors):
+    # return decoded userinfo, host and port from a single split
+    if isinstance(authority, bytes):
+        userinfo, host, port = SplitResultBytes._split_authority(authority)
+    else:
+        userinfo, host, port = SplitResultString._split_authority(authority)
+    return (
+        None if userinfo is None else uridecode(userinfo, encoding, errors),
+        _parsehost(host, errors),
+        int(port) if port else None,
+    )
+
+
+def _parsehost(host, errors):
+    if isinstance(host, bytes):
+        text = host.decode("latin-1")
+    else:
+        text = host
+    hosttype = _hosttype(text)
+    if hosttype is _IPLITERAL:
+        if isinstance(host, bytes):
+            return ipaddress.IPv6Address(host[1:-1].decode("ascii"))
+        else:
+            return ipaddress.IPv6Address(host[1:-1])
+    elif hosttype is _IPVFUTURE:
+        raise ValueError("address mechanism not supported")
+    elif hosttype is _INVALID:
+        raise ValueError("Invalid host %r: mismatched brackets" % host)
+    elif hosttype is _IPV4ADDRESS:
+        try:
+            return ipaddress.IPv4Address(text)
+        except ValueError:
+            pass
+    return uridecode(host, "utf-8", errors).lower()
+
+
+class QueryView:
+    """Class to hold :meth:`SplitResult.getqueryview` results."""
+
+    __slots__ = ("__encoding", "__eq", "__errors", "__index", "__query", "__sep")
+
+    def __init__(self, query, sep, eq, encoding, errors):
+        self.__query = query
+        self.__sep = sep
+        self.__eq = eq
+        self.__encoding = encoding
+        self.__errors = errors
+        self.__index = None
+
+    def __contains__(self, name):
+        return name in self.__getindex()
+
+    def __iter__(self):
+        return iter(self.__getindex())
+
+    def __len__(self):
+        return len(self.__getindex())
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, self.__query)
+
+    def get(self, name, default=None):
+        """Return the decoded value of the first query variable `name`, or
+        `default` if no such variable exists.
+
+        """
+        try:
+            return self.__decode(self.__getindex()[name][0])
+        except KeyError:
+            return default
+
+    def getall(self, name):
+        """Return a list of decoded values of all query variables `name`."""
+        return [self.__decode(span) for span in self.__getindex().get(name, ())]
+
+    def items(self):
+        """Return an iterator over decoded `(name, value)` pairs."""
+        query, encoding, errors = self.__query, self.__encoding, self.__errors
+        for start, end, value in self.__scan():
+            name = uridecode(query[start:end], encoding, errors)
+            if value is not None:
+                yield (name, uridecode(query[value[0] : value[1]], encoding, errors))
+            else:
+                yield (name, None)
+
+    def __decode(self, span):
+        if span is None:
+            return None
+        else:
+            start, end = span
+            return uridecode(self.__query[start:end], self.__encoding, self.__errors)
+
+    def __getindex(self):
+        index = self.__index
+        if index is None:
+            query, encoding, errors = self.__query, self.__encoding, self.__errors
+            index = {}
+            for start, end, value in self.__scan():
+                name = uridecode(query[start:end], encoding, errors)
+                try:
+                    index[name].append(value)
+                except KeyError:
+                    index[name] = [value]
+            self.__index = index
+        return index
+
+    def __scan(self):
+        # yield name spans and value spans of non-empty query variables
+        query, sep, eq = self.__query, self.__sep, self.__eq
+        find, size, step = query.find, len(query), len(sep)
+        start = 0
+        while start < size:
+            end = find(sep, start)
+            if end < 0:
+                end = size
+            if end != start:
+                pos = find(eq, start, end)
+                if pos < 0:
+                    yield (start, end, None)
+                else:
+                    yield (start, pos, (pos + 1, end))
+            start = end + step
+
 
 def uridefrag(uristring):
     """Remove an existing fragment component from a URI reference string."""
@@ -543,18 +1043,691 @@ def uridefrag(uristring):
     return DefragResult(parts[0], parts[2] if parts[1] else None)
 
 
-def urisplit(uristring):
+def urisplit(uristring, cache=None, intern=None):
     """Split a well-formed URI reference string into a tuple with five
     components corresponding to a URI's general structure::
 
       <scheme>://<authority>/<path>?<query>#<fragment>
 
     """
-    if isinstance(uristring, bytes):
+    if cache is not None:
+        if intern is not None:
+            raise ValueError("Cannot use both cache and intern")
+        return cache(uristring)
+    elif isinstance(uristring, bytes):
         result = SplitResultBytes
     else:
         result = SplitResultString
-    return result(*result._match(uristring).groups())
+    parts = result(*result._match(uristring).groups())
+    if intern is None:
+        return parts
+    scheme, authority, path, query, fragment = parts
+    return result(intern(scheme), intern(authority), path, query, fragment)
+
+
+def _splitbytes(uristring):
+    return SplitResultBytes(*SplitResultBytes._match(uristring).groups())
+
+
+def _splitstring(uristring):
+    return SplitResultString(*SplitResultString._match(uristring).groups())
+
+
+class _Cache:
+    """Base class for bounded LRU caches wrapping a single function."""
+
+    __slots__ = ("_cached",)
+
+    def __init__(self, maxsize, function):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("Invalid cache size")
+        self._cached = functools.lru_cache(maxsize)(function)
+
+    @property
+    def maxsize(self):
+        return self._cached.cache_parameters()["maxsize"]
+
+    def cache_info(self):
+        """Return :func:`functools.lru_cache` style statistics."""
+        return self._cached.cache_info()
+
+    def cache_clear(self):
+        """Clear the cache and its statistics."""
+        self._cached.cache_clear()
+
+
+class _TypedCache:
+    """Base class for bounded LRU caches wrapping separate functions for
+    :class:`str` and :class:`bytes` arguments.
+
+    """
+
+    __slots__ = ("_bytes", "_string")
+
+    def __init__(self, maxsize, bytesfunction, stringfunction):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("Invalid cache size")
+        # separate caches, since str and bytes results differ in type
+        self._bytes = functools.lru_cache(maxsize)(bytesfunction)
+        self._string = functools.lru_cache(maxsize)(stringfunction)
+
+    def __call__(self, value):
+        if isinstance(value, bytes):
+            return self._bytes(value)
+        else:
+            return self._string(value)
+
+    @property
+    def maxsize(self):
+        return self._string.cache_parameters()["maxsize"]
+
+    def cache_info(self):
+        """Return a two-item tuple of :func:`functools.lru_cache` style
+        statistics for :class:`str` and :class:`bytes` arguments.
+
+        """
+        return (self._string.cache_info(), self._bytes.cache_info())
+
+    def cache_clear(self):
+        """Clear the cache and its statistics."""
+        self._string.cache_clear()
+        self._bytes.cache_clear()
+
+
+class SplitCache(_TypedCache):
+    """Bounded LRU cache for :func:`urisplit` results."""
+
+    __slots__ = ()
+
+    def __init__(self, maxsize=1024, intern=None):
+        if intern is None:
+            super().__init__(maxsize, _splitbytes, _splitstring)
+        else:
+            split = functools.partial(urisplit, intern=intern)
+            super().__init__(maxsize, split, split)
+
+
+class InternCache(_Cache):
+    """Bounded LRU cache for sharing equal URI components."""
+
+    __slots__ = ()
+
+    def __init__(self, maxsize=1024):
+        super().__init__(maxsize, _identity)
+
+    def __call__(self, value):
+        if value is None:
+            return None
+        else:
+            return self._cached(value)
+
+
+def _identity(value):
+    # cached, returns the first of any equal values
+    return value
+
+
+class PathCache(_TypedCache):
+    """Bounded LRU cache for URI paths with dot-segments removed."""
+
+    __slots__ = ()
+
+    def __init__(self, maxsize=1024):
+        super().__init__(
+            maxsize,
+            SplitResultBytes._remove_dot_segments,
+            SplitResultString._remove_dot_segments,
+        )
+
+
+class AuthorityCache(_Cache):
+    """Bounded LRU cache for :meth:`SplitResult.getauthority` results."""
+
+    __slots__ = ()
+
+    def __init__(self, maxsize=1024):
+        super().__init__(maxsize, _parseauthority)
+
+    def __call__(self, authority, encoding="utf-8", errors="strict"):
+        return self._cached(authority, encoding, errors)
+
+
+class HostCache(_Cache):
+    """Bounded LRU cache for :meth:`SplitResult.gethost` results."""
+
+    __slots__ = ()
+
+    def __init__(self, maxsize=1024):
+        super().__init__(maxsize, _parsehost)
+
+    def __call__(self, host, errors="strict"):
+        return self._cached(host, errors)
+
+
+class SplitSpans:
+    """Class to hold :func:`urisplitspans` results."""
+
+    __slots__ = ("__authority", "__match")
+
+    # RFC 3986 3.2.3: port = *DIGIT
+    _PORT_RE_BYTES = re.compile(b"[0-9]*")
+    _PORT_RE_STR = re.compile("[0-9]*")
+
+    # names of components and authority subcomponents
+    _NAMES = frozenset(
+        ["scheme", "authority", "path", "query", "fragment", "userinfo", "host", "port"]
+    )
+
+    def __init__(self, match):
+        self.__match = match
+        self.__authority = None
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, self.__match.string)
+
+    @property
+    def uristring(self):
+        """The original URI reference string."""
+        return self.__match.string
+
+    @property
+    def scheme(self):
+        """The span of the scheme component, or :const:`None`."""
+        return self.__span(1)
+
+    @property
+    def authority(self):
+        """The span of the authority component, or :const:`None`."""
+        return self.__span(2)
+
+    @property
+    def path(self):
+        """The span of the path component."""
+        return self.__match.span(3)
+
+    @property
+    def query(self):
+        """The span of the query component, or :const:`None`."""
+        return self.__span(4)
+
+    @property
+    def fragment(self):
+        """The span of the fragment component, or :const:`None`."""
+        return self.__span(5)
+
+    @property
+    def userinfo(self):
+        """The span of the userinfo subcomponent, or :const:`None`."""
+        return self.__split_authority()[0]
+
+    @property
+    def host(self):
+        """The span of the host subcomponent, or :const:`None`."""
+        return self.__split_authority()[1]
+
+    @property
+    def port(self):
+        """The span of the port subcomponent, or :const:`None`."""
+        return self.__split_authority()[2]
+
+    def get(self, name):
+        """Return the substring for the component or subcomponent `name`,
+        or :const:`None` if it is not defined.
+
+        """
+        if name not in self._NAMES:
+            raise ValueError("Invalid component name: %r" % name)
+        span = getattr(self, name)
+        if span is None:
+            return None
+        start, end = span
+        return self.__match.string[start:end]
+
+    def split(self):
+        """Return a :class:`SplitResult` for the URI reference string."""
+        match = self.__match
+        if isinstance(match.string, bytes):
+            return SplitResultBytes(*match.groups())
+        else:
+            return SplitResultString(*match.groups())
+
+    def __span(self, group):
+        span = self.__match.span(group)
+        return None if span[0] < 0 else span
+
+    def __split_authority(self):
+        if self.__authority is not None:
+            return self.__authority
+        start, end = self.__match.span(2)
+        if start < 0:
+            self.__authority = (None, None, None)
+            return self.__authority
+        string = self.__match.string
+        # same semantics as SplitResult.userinfo, host and port
+        if isinstance(string, bytes):
+            at = string.rfind(b"@", start, end)
+            hoststart = start if at < 0 else at + 1
+            pos = string.rfind(b":", hoststart, end)
+            digits = self._PORT_RE_BYTES.fullmatch(
+                string, pos + 1 if pos >= 0 else hoststart, end
+            )
+        else:
+            at = string.rfind("@", start, end)
+            hoststart = start if at < 0 else at + 1
+            pos = string.rfind(":", hoststart, end)
+            digits = self._PORT_RE_STR.fullmatch(
+                string, pos + 1 if pos >= 0 else hoststart, end
+            )
+        userinfo = None if at < 0 else (start, at)
+        if not digits:
+            host, port = (hoststart, end), None
+        elif pos >= 0:
+            host, port = (hoststart, pos), (pos + 1, end)
+        else:
+            host, port = (hoststart, hoststart), None
+        self.__authority = (userinfo, host, port)
+        return self.__authority
+
+
+def urisplitspans(uristring):
+    """Split a well-formed URI reference string into the start and end
+    offsets of its components.
+
+    """
+    if isinstance(uristring, bytes):
+        return SplitSpans(SplitResultBytes._RE.match(uristring))
+    else:
+        return SplitSpans(SplitResultString._RE.match(uristring))
+
+
+class CompactSplitResult:
+    """Class to hold :func:`urisplitcompact` results."""
+
+    __slots__ = ("__offsets", "__uristring")
+
+    def __init__(self, uristring, offsets):
+        self.__uristring = uristring
+        self.__offsets = offsets
+
+    def __repr__(self):
+        return "%s(scheme=%r, authority=%r, path=%r, query=%r, fragment=%r)" % (
+            CompactSplitResult.__name__,
+            *self.__parts(),
+        )
+
+    def __reduce__(self):
+        return (urisplitcompact, (self.__uristring,))
+
+    def __iter__(self):
+        return iter(self.__parts())
+
+    def __len__(self):
+        return 5
+
+    def __getitem__(self, index):
+        return self.__parts()[index]
+
+    def __eq__(self, other):
+        if isinstance(other, CompactSplitResult):
+            return self.__uristring == other.__uristring
+        elif isinstance(other, SplitResult):
+            return self.__parts() == other
+        else:
+            return NotImplemented
+
+    def __hash__(self):
+        return hash(self.__parts())
+
+    @property
+    def scheme(self):
+        uristring, scheme, _, _, _ = self.__unpack()
+        return uristring[:scheme] if scheme else None
+
+    @property
+    def authority(self):
+        uristring, scheme, path, _, _ = self.__unpack()
+        start = scheme + 1 if scheme else 0
+        return uristring[start + 2 : path] if path != start else None
+
+    @property
+    def path(self):
+        uristring, _, start, end, _ = self.__unpack()
+        return uristring[start:end]
+
+    @property
+    def query(self):
+        uristring, _, _, path, query = self.__unpack()
+        return uristring[path + 1 : query] if query != path else None
+
+    @property
+    def fragment(self):
+        uristring, _, _, _, query = self.__unpack()
+        return uristring[query + 1 :] if query != len(uristring) else None
+
+    # SplitResult methods only access components through attributes
+    userinfo = SplitResult.userinfo
+    host = SplitResult.host
+    port = SplitResult.port
+
+    def geturi(self):
+        """Return the original URI reference string."""
+        return self.__uristring
+
+    getscheme = SplitResult.getscheme
+    getauthority = SplitResult.getauthority
+    getuserinfo = SplitResult.getuserinfo
+    gethost = SplitResult.gethost
+    getport = SplitResult.getport
+    getpath = SplitResult.getpath
+    getquery = SplitResult.getquery
+    getquerydict = SplitResult.getquerydict
+    getquerylist = SplitResult.getquerylist
+    getqueryview = SplitResult.getqueryview
+    getfragment = SplitResult.getfragment
+    isuri = SplitResult.isuri
+    isabsuri = SplitResult.isabsuri
+    isnetpath = SplitResult.isnetpath
+    isabspath = SplitResult.isabspath
+    isrelpath = SplitResult.isrelpath
+    issamedoc = SplitResult.issamedoc
+    normalize = SplitResult.normalize
+
+    def transform(self, ref, strict=False, cache=None):
+        """Transform a URI reference relative to `self` into a
+        :class:`SplitResult` representing its target URI.
+
+        """
+        return self.split().transform(ref, strict, cache)
+
+    def split(self):
+        """Return a :class:`SplitResult` holding the same components."""
+        if isinstance(self.__uristring, bytes):
+            return SplitResultBytes(*self.__parts())
+        else:
+            return SplitResultString(*self.__parts())
+
+    def __unpack(self):
+        # offsets of scheme end, path start, path end and query end,
+        # packed into a single integer with fields just wide enough
+        # to hold the length of the URI reference string
+        uristring, offsets = self.__uristring, self.__offsets
+        width = len(uristring).bit_length()
+        mask = (1 << width) - 1
+        return (
+            uristring,
+            offsets & mask,
+            (offsets >> width) & mask,
+            (offsets >> 2 * width) & mask,
+            offsets >> 3 * width,
+        )
+
+    def __parts(self):
+        uristring, scheme, path, end, query = self.__unpack()
+        start = scheme + 1 if scheme else 0
+        return (
+            uristring[:scheme] if scheme else None,
+            uristring[start + 2 : path] if path != start else None,
+            uristring[path:end],
+            uristring[end + 1 : query] if query != end else None,
+            uristring[query + 1 :] if query != len(uristring) else None,
+        )
+
+
+class _CompactSplitResultBytes(CompactSplitResult):
+    __slots__ = ()  # prevent creation of instance dictionary
+
+    # class constants and private helpers used by SplitResult methods
+    _AT, _COLON, _DIGITS = b"@", b":", b"0123456789"
+    _EMPTY, _EQ, _SLASH = b"", b"=", b"/"
+    _SplitResult__remove_dot_segments = (
+        SplitResultBytes._SplitResult__remove_dot_segments
+    )
+    _SplitResult__normalize = SplitResultBytes._SplitResult__normalize
+
+
+class _CompactSplitResultString(CompactSplitResult):
+    __slots__ = ()  # prevent creation of instance dictionary
+
+    # class constants and private helpers used by SplitResult methods
+    _AT, _COLON, _DIGITS = "@", ":", "0123456789"
+    _EMPTY, _EQ, _SLASH = "", "=", "/"
+    _SplitResult__remove_dot_segments = (
+        SplitResultString._SplitResult__remove_dot_segments
+    )
+    _SplitResult__normalize = SplitResultString._SplitResult__normalize
+
+
+def urisplitcompact(uristring):
+    """Split a well-formed URI reference string into a compact
+    :class:`CompactSplitResult`, which creates component strings on
+    demand.
+
+    """
+    if isinstance(uristring, bytes):
+        match = SplitResultBytes._RE.match(uristring)
+    else:
+        match = SplitResultString._RE.match(uristring)
+    return _compact(match)
+
+
+def _compact(match):
+    uristring, end = match.string, match.end()
+    # fragment may stop short of the end of the string
+    if end != len(uristring):
+        uristring = uristring[:end]
+    start, stop = match.span(3)
+    query = match.end(4) if match.start(4) >= 0 else stop
+    width = end.bit_length()
+    offsets = max(match.end(1), 0)
+    offsets |= start << width | stop << 2 * width | query << 3 * width
+    if isinstance(uristring, bytes):
+        return _CompactSplitResultBytes(uristring, offsets)
+    else:
+        return _CompactSplitResultString(uristring, offsets)
+
+
+class SplitBatch:
+    """Class to hold :func:`urisplitbatch` results."""
+
+    __slots__ = ("__buffer", "__columns", "__flags", "__offsets", "__type")
+
+    _COLUMNS = ("scheme", "authority", "path", "query", "fragment")
+
+    def __init__(self, buffer, offsets, columns, flags):
+        self.__buffer = buffer
+        self.__offsets = offsets
+        self.__columns = columns
+        self.__flags = flags
+        if isinstance(buffer, bytes):
+            self.__type = SplitResultBytes
+        else:
+            self.__type = SplitResultString
+
+    def __repr__(self):
+        return "<%s with %d rows>" % (type(self).__name__, len(self))
+
+    def __len__(self):
+        return len(self.__flags)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SplitBatch index out of range")
+        return self.__type(*self.__row(index))
+
+    def __iter__(self):
+        cls, row = self.__type, self.__row
+        for index in range(len(self)):
+            yield cls(*row(index))
+
+    @property
+    def buffer(self):
+        """The concatenated URI reference strings."""
+        return self.__buffer
+
+    @property
+    def offsets(self):
+        """An :class:`array.array` of the start offsets of all rows in
+        :attr:`buffer`, followed by its total length.
+
+        """
+        return self.__offsets
+
+    def column(self, name):
+        """Return a list of the values of the column `name`, with
+        :const:`None` for undefined components.
+
+        """
+        try:
+            index = self._COLUMNS.index(name)
+        except ValueError:
+            raise ValueError("Invalid column name: %r" % name) from None
+        return [row[index] for row in map(self.__row, range(len(self)))]
+
+    def toarrow(self):
+        """Return a :class:`pyarrow.Table` holding the columns.
+
+        This requires the :mod:`pyarrow` package to be installed.
+
+        """
+        import pyarrow  # type: ignore
+
+        if isinstance(self.__buffer, bytes):
+            datatype = pyarrow.large_binary()
+        else:
+            datatype = pyarrow.large_string()
+        return pyarrow.table(
+            {
+                name: pyarrow.array(self.column(name), type=datatype)
+                for name in self._COLUMNS
+            }
+        )
+
+    def tonumpy(self):
+        """Return a dictionary mapping column names to NumPy object
+        arrays, with :const:`None` for undefined components.
+
+        This requires the :mod:`numpy` package to be installed.
+
+        """
+        import numpy  # type: ignore
+
+        result = {}
+        for name in self._COLUMNS:
+            values = self.column(name)
+            # avoid numpy inferring a fixed-width string dtype
+            result[name] = numpy.empty(len(values), dtype=object)
+            result[name][:] = values
+        return result
+
+    def __row(self, index):
+        buffer = self.__buffer
+        start, end = self.__offsets[index], self.__offsets[index + 1]
+        scheme, authority, path, query = self.__columns
+        # flags hold bits for defined scheme, authority, query and
+        # fragment components; columns hold end offsets relative to the row's start offset,
+        # with start offsets implied by the components' delimiters
+        se = start + scheme[index]
+        ae = start + authority[index]
+        pe = start + path[index]
+        qe = start + query[index]
+        flags = self.__flags[index]
+        return (
+            buffer[start:se] if flags & 1 else None,
+            buffer[(se + 3 if flags & 1 else se + 2) : ae] if flags & 2 else None,
+            buffer[ae:pe],
+            buffer[pe + 1 : qe] if flags & 4 else None,
+            buffer[qe + 1 : end] if flags & 8 else None,
+        )
+
+
+def urisplitbatch(iterable):
+    """Split an iterable of well-formed URI reference strings into a
+    columnar :class:`SplitBatch`.
+
+    """
+    iterator = iter(iterable)
+    for uristring in iterator:
+        if isinstance(uristring, bytes):
+            match, empty = SplitResultBytes._RE.match, b""
+        else:
+            match, empty = SplitResultString._RE.match, ""
+        return _splitbatch(match, empty, itertools.chain([uristring], iterator))
+    return _splitbatch(SplitResultString._RE.match, "", ())
+
+
+def _splitbatch(match, empty, iterable):
+    offsets = array.array("q", [0])
+    columns = tuple(array.array("I") for _ in range(4))
+    scheme, authority, path, query = columns
+    flags = bytearray()
+    strings = []
+    offset = 0
+    for uristring in iterable:
+        m = match(uristring)
+        end = m.end()
+        # fragment may stop short of the end of the string
+        if end != len(uristring):
+            uristring = uristring[:end]
+        bits = 0
+        if m.start(1) >= 0:
+            bits |= 1
+        if m.start(2) >= 0:
+            bits |= 2
+        if m.start(4) >= 0:
+            bits |= 4
+        if m.start(5) >= 0:
+            bits |= 8
+        scheme.append(max(m.end(1), 0))
+        authority.append(m.start(3))
+        path.append(m.end(3))
+        query.append(m.end(4) if bits & 4 else m.end(3))
+        flags.append(bits)
+        strings.append(uristring)
+        offset += end
+        offsets.append(offset)
+    return SplitBatch(empty.join(strings), offsets, columns, flags)
+
+
+# RFC 3986 Appendix B, restricted to characters allowed in URIs
+_SCAN_PATTERN = rb"""
+    (?<![A-Za-z0-9+.-])(%s):                   # scheme (RFC 3986 3.1)
+    (?=[A-Za-z0-9._~!$&'()*+,;=:@%%/?\#-])       # at least one more character
+    (?://([A-Za-z0-9._~!$&'()*+,;=:@%%[\]-]*))?  # authority
+    ([A-Za-z0-9._~!$&'()*+,;=:@%%/-]*)          # path
+    (?:\?([A-Za-z0-9._~!$&'()*+,;=:@%%/?-]*))?   # query
+    (?:\#([A-Za-z0-9._~!$&'()*+,;=:@%%/?-]*))?   # fragment
+"""
+
+
+@functools.lru_cache(maxsize=128)
+def _scanner(schemes):
+    if schemes is None:
+        pattern = rb"[A-Za-z][A-Za-z0-9+.-]*"
+    elif schemes:
+        # try longer schemes first, e.g. "https" before "http"
+        names = sorted({_scheme(s) for s in schemes}, key=len, reverse=True)
+        pattern = rb"(?i:%s)" % b"|".join(map(re.escape, names))
+    else:
+        raise ValueError("Empty schemes")
+    return re.compile(_SCAN_PATTERN % pattern, flags=re.VERBOSE)
+
+
+def uriscan(buffer, schemes=None, split=False):
+    """Scan a bytes-like object for URIs, returning an iterator of their
+    start and end offsets.
+
+    """
+    if schemes is not None:
+        schemes = frozenset(
+            s.encode("ascii") if isinstance(s, str) else s for s in schemes
+        )
+    for match in _scanner(schemes).finditer(buffer):
+        if split:
+            yield match.start(), match.end(), SplitResultBytes(*match.groups())
+        else:
+            yield match.span()
 
 
 def uriunsplit(parts):
@@ -570,17 +1743,163 @@ def uriunsplit(parts):
     return result(scheme, authority, path, query, fragment).geturi()
 
 
-def urijoin(base, ref, strict=False):
+def urijoin(base, ref, strict=False, cache=None):
     """Convert a URI reference relative to a base URI to its target URI
     string.
 
     """
     if isinstance(base, type(ref)):
-        return urisplit(base).transform(ref, strict).geturi()
+        return urisplit(base).transform(ref, strict, cache).geturi()
     elif isinstance(base, bytes):
-        return urisplit(base.decode()).transform(ref, strict).geturi()
+        return urisplit(base.decode()).transform(ref, strict, cache).geturi()
     else:
-        return urisplit(base).transform(ref.decode(), strict).geturi()
+        return urisplit(base).transform(ref.decode(), strict, cache).geturi()
+
+
+def urijoinall(base, refs, strict=False, cache=None):
+    """Convert multiple URI references relative to a common base URI to
+    their target URI strings.
+
+    """
+    transform = urisplit(base)._transformer(strict, cache)
+    decoded = None
+    for ref in refs:
+        if isinstance(base, type(ref)):
+            yield transform(ref).geturi()
+        elif isinstance(base, bytes):
+            if decoded is None:
+                decoded = urisplit(base.decode())._transformer(strict, cache)
+            yield decoded(ref).geturi()
+        else:
+            yield transform(ref.decode()).geturi()
+
+
+def urinormalize(uristring):
+    """Normalize a URI reference string using RFC 3986 syntax-based
+    normalization.
+
+    """
+    if isinstance(uristring, bytes):
+        return SplitResultBytes._normalize(uristring)
+    else:
+        return SplitResultString._normalize(uristring)
+
+
+def urinormalizeall(iterable):
+    """Normalize multiple URI reference strings using RFC 3986
+    syntax-based normalization.
+
+    """
+    normalize_bytes = SplitResultBytes._normalize
+    normalize_string = SplitResultString._normalize
+    for uristring in iterable:
+        if isinstance(uristring, bytes):
+            yield normalize_bytes(uristring)
+        else:
+            yield normalize_string(uristring)
+
+
+def urifingerprint(uristring):
+    """Return a stable 64-bit fingerprint of the normalized form of a URI
+    reference string, :class:`SplitResult` or
+    :class:`CompactSplitResult`.
+
+    """
+    if isinstance(uristring, (SplitResult, CompactSplitResult)):
+        uristring = uristring.geturi()
+    if isinstance(uristring, bytes):
+        data = SplitResultBytes._normalize(uristring)
+    else:
+        data = SplitResultString._normalize(uristring).encode("utf-8")
+    digest = hashlib.blake2b(data, digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class URISet:
+    """Compact set of URI references, stored as 64-bit fingerprints."""
+
+    __slots__ = ("__len", "__mask", "__table", "__zero")
+
+    # initial table size, must be a power of two
+    _MINSIZE = 16
+
+    def __init__(self, iterable=()):
+        self.__table = array.array("Q", bytes(8 * self._MINSIZE))
+        self.__mask = self._MINSIZE - 1
+        self.__len = 0
+        # zero marks empty table slots, so track it separately
+        self.__zero = False
+        self.update(iterable)
+
+    def __repr__(self):
+        return "<%s with %d fingerprints>" % (type(self).__name__, self.__len)
+
+    def __len__(self):
+        return self.__len
+
+    def __contains__(self, uristring):
+        fingerprint = urifingerprint(uristring)
+        if not fingerprint:
+            return self.__zero
+        table, mask = self.__table, self.__mask
+        # fingerprints are uniformly distributed, so use low bits
+        index = fingerprint & mask
+        while True:
+            value = table[index]
+            if value == fingerprint:
+                return True
+            elif not value:
+                return False
+            index = (index + 1) & mask
+
+    def add(self, uristring):
+        """Add a URI reference string or :class:`SplitResult` to the
+        set.
+
+        """
+        self.__add(urifingerprint(uristring))
+
+    def update(self, iterable):
+        """Add all URI reference strings or :class:`SplitResult`
+        objects from `iterable` to the set.
+
+        """
+        add = self.__add
+        for uristring in iterable:
+            add(urifingerprint(uristring))
+
+    def __add(self, fingerprint):
+        if not fingerprint:
+            if not self.__zero:
+                self.__zero = True
+                self.__len += 1
+            return
+        table, mask = self.__table, self.__mask
+        index = fingerprint & mask
+        while True:
+            value = table[index]
+            if value == fingerprint:
+                return
+            elif not value:
+                break
+            index = (index + 1) & mask
+        table[index] = fingerprint
+        self.__len += 1
+        # keep load factor below 3/4 for short probe sequences
+        if self.__len * 4 > len(table) * 3:
+            self.__resize(len(table) * 2)
+
+    def __resize(self, size):
+        table = array.array("Q", bytes(8 * size))
+        mask = size - 1
+        for fingerprint in self.__table:
+            if fingerprint:
+                index = fingerprint & mask
+                while table[index]:
+                    index = (index + 1) & mask
+                table[index] = fingerprint
+        self.__table = table
+        self.__mask = mask
 
 
 def isuri(uristring):
@@ -613,6 +1932,128 @@ def issamedoc(uristring):
     return urisplit(uristring).issamedoc()
 
 
+def isurimask(values):
+    """Return a boolean NumPy array indicating which elements of `values`
+    are URIs.
+
+    """
+    return _classifyarray(values, isuri, _isurimask)
+
+
+def isabsurimask(values):
+    """Return a boolean NumPy array indicating which elements of `values`
+    are absolute URIs.
+
+    """
+    return _classifyarray(values, isabsuri, _isabsurimask)
+
+
+def isnetpathmask(values):
+    """Return a boolean NumPy array indicating which elements of `values`
+    are network-path references.
+
+    """
+    return _classifyarray(values, isnetpath, _isnetpathmask)
+
+
+def isabspathmask(values):
+    """Return a boolean NumPy array indicating which elements of `values`
+    are absolute-path references.
+
+    """
+    return _classifyarray(values, isabspath, _isabspathmask)
+
+
+def isrelpathmask(values):
+    """Return a boolean NumPy array indicating which elements of `values`
+    are relative-path references.
+
+    """
+    return _classifyarray(values, isrelpath, _isrelpathmask)
+
+
+def issamedocmask(values):
+    """Return a boolean NumPy array indicating which elements of `values`
+    are same-document references.
+
+    """
+    return _classifyarray(values, issamedoc, _issamedocmask)
+
+
+def _classifyarray(values, func, classify):
+    import numpy  # type: ignore
+
+    values = numpy.asarray(values)
+    kind = values.dtype.kind
+    if kind in "OT":
+        # object arrays or variable-width strings, so classify elements
+        result = numpy.fromiter(map(func, values.flat), dtype=bool, count=values.size)
+        return result.reshape(values.shape)
+    elif kind == "U":
+        size, code = 4, values.dtype.byteorder + "u4"
+    elif kind == "S":
+        size, code = 1, "u1"
+    else:
+        raise TypeError("Invalid array type: %s" % values.dtype)
+    # make sure the first two characters can always be accessed
+    if values.dtype.itemsize < 2 * size:
+        values = values.astype(kind + "2")
+    # view elements as rows of zero-padded character codes
+    width = values.dtype.itemsize // size
+    codes = numpy.ascontiguousarray(values).reshape(-1).view(code)
+    return classify(numpy, codes.reshape(values.size, width)).reshape(values.shape)
+
+
+def _isurimask(numpy, codes):
+    # RFC 3986 3.1: scheme = ALPHA *( ALPHA / DIGIT / "+" / "-" / "." )
+    result = numpy.zeros(len(codes), dtype=bool)
+    lower = codes[:, 0] | 0x20
+    rows = numpy.flatnonzero((lower >= 0x61) & (lower <= 0x7A))
+    # only scan columns as long as rows may still have a scheme
+    for column in codes.T[1:]:
+        if not rows.size:
+            break
+        chars = column[rows]
+        result[rows[chars == 0x3A]] = True
+        lower = chars | 0x20
+        rows = rows[
+            ((lower >= 0x61) & (lower <= 0x7A))
+            | ((chars >= 0x30) & (chars <= 0x39))
+            | (chars == 0x2B)
+            | (chars == 0x2D)
+            | (chars == 0x2E)
+        ]
+    return result
+
+
+def _isabsurimask(numpy, codes):
+    result = _isurimask(numpy, codes)
+    rows = numpy.flatnonzero(result)
+    result[rows[(codes[rows] == 0x23).any(axis=1)]] = False
+    return result
+
+
+def _isnetpathmask(numpy, codes):
+    # a scheme cannot start with "/"
+    return (codes[:, 0] == 0x2F) & (codes[:, 1] == 0x2F)
+
+
+def _isabspathmask(numpy, codes):
+    return (codes[:, 0] == 0x2F) & (codes[:, 1] != 0x2F)
+
+
+def _isrelpathmask(numpy, codes):
+    return (codes[:, 0] != 0x2F) & ~_isurimask(numpy, codes)
+
+
+def _issamedocmask(numpy, codes):
+    result = codes[:, 0] == 0x23
+    # empty strings, but not strings starting with NUL characters
+    rows = numpy.flatnonzero(codes[:, 0] == 0)
+    result[rows[~codes[rows].any(axis=1)]] = True
+    return result
+
+
 # RFC 3986 3.1: scheme = ALPHA *( ALPHA / DIGIT / "+" / "-" / "." )
 _SCHEME_RE = re.compile(b"^[A-Za-z][A-Za-z0-9+.-]*$")
 
@@ -627,6 +2068,25 @@ _SAFE_PATH = SUB_DELIMS + ":@/"
 _SAFE_QUERY = SUB_DELIMS + ":@/?"
 _SAFE_FRAGMENT = SUB_DELIMS + ":@/?"
 
+# encoders for commonly used safe characters, keyed by both str and
+# bytes; this is never modified, so it can be shared between threads
+_encoders = {
+    key: encode
+    for safe in {
+        "",
+        "/",
+        _SAFE_USERINFO,
+        _SAFE_HOST,
+        _SAFE_PATH,
+        _SAFE_QUERY,
+        _SAFE_FRAGMENT,
+        _SAFE_QUERY.replace("&", ""),
+        _SAFE_QUERY.replace(";", ""),
+    }
+    for encode in [PercentEncoder(safe).encode]
+    for key in (safe, safe.encode("ascii"))
+}
+
 
 def _scheme(scheme):
     if _SCHEME_RE.match(scheme):
@@ -664,10 +2124,7 @@ def _authority(userinfo, host, port, encoding):
 
 
 def _ip_literal(address):
-    if address.startswith("v"):
-        raise ValueError("Address mechanism not supported")
-    else:
-        return b"[" + ipaddress.IPv6Address(address).compressed.encode() + b"]"
+    return b"[" + ipaddress.IPv6Address(address).compressed.encode() + b"]"
 
 
 def _host(host):
@@ -675,13 +2132,18 @@ def _host(host):
     # normalizers should use lowercase for registered names and
     # hexadecimal addresses for the sake of uniformity, while only
     # using uppercase letters for percent-encodings.
-    if host.startswith(b"[") and host.endswith(b"]"):
+    hosttype = _hosttype(host.decode("latin-1"))
+    if hosttype is _IPLITERAL:
         return _ip_literal(host[1:-1].decode())
-    # check for IPv6 addresses as returned by SplitResult.gethost()
-    try:
-        return _ip_literal(host.decode("utf-8"))
-    except ValueError:
-        return uriencode(host.lower(), _SAFE_HOST, "utf-8")
+    elif hosttype is _IPVFUTURE:
+        raise ValueError("Address mechanism not supported")
+    elif hosttype is _IPV6ADDRESS:
+        # check for IPv6 addresses as returned by SplitResult.gethost()
+        try:
+            return _ip_literal(host.decode("utf-8"))
+        except ValueError:
+            pass
+    return uriencode(host.lower(), _SAFE_HOST, "utf-8")
 
 
 def _port(port):
@@ -699,15 +2161,15 @@ def _port(port):
 def _querylist(items, sep, encoding):
     terms = []
     append = terms.append
-    safe = _SAFE_QUERY.replace(sep, "")
+    encode = _getencoder(_SAFE_QUERY.replace(sep, ""))
     for key, value in items:
-        name = uriencode(key, safe, encoding)
+        name = encode(key, encoding)
         if value is None:
             append(name)
-        elif isinstance(value, (bytes, str)):
-            append(name + b"=" + uriencode(value, safe, encoding))
-        else:
-            append(name + b"=" + uriencode(str(value), safe, encoding))
+            continue
+        if not isinstance(value, (bytes, str)):
+            value = str(value)
+        append(name + b"=" + encode(value, encoding))
     return sep.encode("ascii").join(terms)
 
 
@@ -723,20 +2185,7 @@ def _querydict(mapping, sep, encoding):
     return _querylist(items, sep, encoding)
 
 
-def uricompose(
-    scheme=None,
-    authority=None,
-    path="",
-    query=None,
-    fragment=None,
-    userinfo=None,
-    host=None,
-    port=None,
-    querysep="&",
-    encoding="utf-8",
-):
-    """Compose a URI reference string from its individual components."""
-
+def _compose_scheme(scheme):
     # RFC 3986 3.1: Scheme names consist of a sequence of characters
     # beginning with a letter and followed by any combination of
     # letters, digits, plus ("+"), period ("."), or hyphen ("-").
@@ -747,10 +2196,14 @@ def uricompose(
     # "HTTP" as well as "http") for the sake of robustness but should
     # only produce lowercase scheme names for consistency.
     if isinstance(scheme, bytes):
-        scheme = _scheme(scheme)
+        return _scheme(scheme)
     elif scheme is not None:
-        scheme = _scheme(scheme.encode())
+        return _scheme(scheme.encode())
+    else:
+        return None
 
+
+def _compose_authority(authority, userinfo, host, port, encoding):
     # authority must be string type or three-item sequence
     if authority is None:
         authority = (None, None, None)
@@ -762,18 +2215,19 @@ def uricompose(
         raise TypeError("Invalid authority type")
     elif len(authority) != 3:
         raise ValueError("Invalid authority length")
-    authority = _authority(
+    return _authority(
         userinfo if userinfo is not None else authority[0],
         host if host is not None else authority[1],
         port if port is not None else authority[2],
         encoding,
     )
 
+
+def _compose_path(path, scheme, authority):
     # RFC 3986 3.3: If a URI contains an authority component, then the
     # path component must either be empty or begin with a slash ("/")
     # character.  If a URI does not contain an authority component,
     # then the path cannot begin with two slash characters ("//").
-    path = uriencode(path, _SAFE_PATH, encoding)
     if authority is not None and path and not path.startswith(b"/"):
         raise ValueError("Invalid path with authority component")
     if authority is None and path.startswith(b"//"):
@@ -787,7 +2241,10 @@ def uricompose(
     if scheme is None and authority is None and not path.startswith(b"/"):
         if b":" in path.partition(b"/")[0]:
             path = b"./" + path
+    return path
 
+
+def _compose_query(query, querysep, encoding):
     # RFC 3986 3.4: The characters slash ("/") and question mark ("?")
     # may represent data within the query component.  Beware that some
     # older, erroneous implementations may not handle such data
@@ -800,21 +2257,433 @@ def uricompose(
     # URI, it is sometimes better for usability to avoid percent-
     # encoding those characters.
     if isinstance(query, (bytes, str)):
-        query = uriencode(query, _SAFE_QUERY, encoding)
+        return uriencode(query, _SAFE_QUERY, encoding)
     elif isinstance(query, collections.abc.Mapping):
-        query = _querydict(query, querysep, encoding)
+        return _querydict(query, querysep, encoding)
     elif isinstance(query, collections.abc.Iterable):
-        query = _querylist(query, querysep, encoding)
+        return _querylist(query, querysep, encoding)
     elif query is not None:
         raise TypeError("Invalid query type")
+    else:
+        return None
 
+
+def _compose_fragment(fragment, encoding):
     # RFC 3986 3.5: The characters slash ("/") and question mark ("?")
     # are allowed to represent data within the fragment identifier.
     # Beware that some older, erroneous implementations may not handle
     # this data correctly when it is used as the base URI for relative
     # references.
     if fragment is not None:
-        fragment = uriencode(fragment, _SAFE_FRAGMENT, encoding)
+        return uriencode(fragment, _SAFE_FRAGMENT, encoding)
+    else:
+        return None
+
+
+class SchemeNormalizer:
+    """Scheme-based normalizer for URI references."""
+
+    __slots__ = ("__path", "__port")
+
+    def __init__(self, port=None, path=None):
+        self.__port = port
+        self.__path = path
+
+    def __repr__(self):
+        return "%s(port=%r, path=%r)" % (type(self).__name__, self.__port, self.__path)
+
+    @property
+    def port(self):
+        """The scheme's default port, or :const:`None`."""
+        return self.__port
+
+    @property
+    def path(self):
+        """The path to use if the path of a URI reference with an authority
+        is empty, or :const:`None`.
+
+        """
+        return self.__path
+
+    def __call__(self, parts):
+        scheme, authority, path, query, fragment = parts
+        if authority is None:
+            return parts
+        changed = False
+        # RFC 3986 6.2.3: URI producers and normalizers should omit the
+        # port component and its ":" delimiter if port is empty or if
+        # its value would be the same as that of the scheme's default.
+        if self.__port is not None and authority[-1:].isdigit():
+            userinfo, host, port = parts._split_authority(authority)
+            if port and int(port) == self.__port:
+                stripped = authority[: -len(port) - 1]
+                # removing the port must not change how the authority
+                # is split, e.g. for "a:80:80"
+                if parts._split_authority(stripped) == (userinfo, host, None):
+                    authority = stripped
+                    changed = True
+        # RFC 3986 6.2.3: Normalization should not remove delimiters
+        # when their associated component is empty unless licensed to
+        # do so by the scheme specification.
+        if not path and self.__path is not None:
+            if isinstance(path, bytes):
+                path = self.__path.encode("ascii")
+            else:
+                path = self.__path
+            changed = True
+        if changed:
+            return type(parts)(scheme, authority, path, query, fragment)
+        else:
+            return parts
+
+
+# scheme-based normalizers, keyed by lowercase scheme as str and bytes;
+# this is replaced rather than modified, so readers need no locking
+_schemes = {}
+
+_schemes_lock = threading.Lock()
+
+
+def registerscheme(scheme, normalizer):
+    """Register a scheme-based normalizer for URI references with the
+    given scheme, or remove its registration if `normalizer` is
+    :const:`None`.
+
+    """
+    global _schemes
+    if isinstance(scheme, str):
+        scheme = scheme.encode("ascii")
+    scheme = _scheme(scheme)
+    with _schemes_lock:
+        schemes = dict(_schemes)
+        if normalizer is None:
+            schemes.pop(scheme, None)
+            schemes.pop(scheme.decode(), None)
+        else:
+            schemes[scheme] = schemes[scheme.decode()] = normalizer
+        _schemes = schemes
+
+
+# RFC 9110 4.2, RFC 6455 3, RFC 1738 3.2
+registerscheme("http", SchemeNormalizer(port=80, path="/"))
+registerscheme("https", SchemeNormalizer(port=443, path="/"))
+registerscheme("ws", SchemeNormalizer(port=80, path="/"))
+registerscheme("wss", SchemeNormalizer(port=443, path="/"))
+registerscheme("ftp", SchemeNormalizer(port=21))
 
+
+def uricompose(
+    scheme=None,
+    authority=None,
+    path="",
+    query=None,
+    fragment=None,
+    userinfo=None,
+    host=None,
+    port=None,
+    querysep="&",
+    encoding="utf-8",
+    normalize=False,
+):
+    """Compose a URI reference string from its individual components."""
+    scheme = _compose_scheme(scheme)
+    authority = _compose_authority(authority, userinfo, host, port, encoding)
+    path = _compose_path(uriencode(path, _SAFE_PATH, encoding), scheme, authority)
+    query = _compose_query(query, querysep, encoding)
+    fragment = _compose_fragment(fragment, encoding)
+    parts = SplitResultBytes(scheme, authority, path, query, fragment)
+    if normalize and (normalizer := _schemes.get(scheme)) is not None:
+        parts = normalizer(parts)
     # return URI reference as `str`
-    return uriunsplit((scheme, authority, path, query, fragment)).decode()
+    return parts.geturi().decode()
+
+
+class URIComposer:
+    """Reusable composer for URI references sharing a common prefix."""
+
+    __slots__ = (
+        "__authority",
+        "__encoding",
+        "__normalizer",
+        "__path",
+        "__prefix",
+        "__querysep",
+        "__scheme",
+    )
+
+    def __init__(
+        self,
+        scheme=None,
+        authority=None,
+        path="",
+        userinfo=None,
+        host=None,
+        port=None,
+        querysep="&",
+        encoding="utf-8",
+        normalize=False,
+    ):
+        scheme = _compose_scheme(scheme)
+        authority = _compose_authority(authority, userinfo, host, port, encoding)
+        prefix = []
+        if scheme is not None:
+            prefix.extend([scheme, b":"])
+        if authority is not None:
+            prefix.extend([b"//", authority])
+        self.__scheme = scheme
+        self.__authority = authority
+        self.__path = uriencode(path, _SAFE_PATH, encoding)
+        self.__prefix = b"".join(prefix)
+        self.__querysep = querysep
+        self.__encoding = encoding
+        self.__normalizer = _schemes.get(scheme) if normalize else None
+
+    def compose(self, path="", query=None, fragment=None):
+        """Compose a URI reference string from the composer's fixed
+        components, appending `path` to its path component.
+
+        """
+        encoding = self.__encoding
+        if path:
+            path = self.__path + uriencode(path, _SAFE_PATH, encoding)
+        else:
+            path = self.__path
+        path = _compose_path(path, self.__scheme, self.__authority)
+        query = _compose_query(query, self.__querysep, encoding)
+        fragment = _compose_fragment(fragment, encoding)
+        if self.__normalizer is not None:
+            parts = SplitResultBytes(
+                self.__scheme, self.__authority, path, query, fragment
+            )
+            return self.__normalizer(parts).geturi().decode()
+        # RFC 3986 5.3. Component Recomposition
+        result = [self.__prefix, path]
+        if query is not None:
+            result.extend([b"?", query])
+        if fragment is not None:
+            result.extend([b"#", fragment])
+        return b"".join(result).decode()
+
+
+# RFC 6570 2.  Syntax
+#
+#   expression    =  "{" [ operator ] variable-list "}"
+#   operator      =  op-level2 / op-level3 / op-reserve
+#   op-level2     =  "+" / "#"
+#   op-level3     =  "." / "/" / ";" / "?" / "&"
+#   op-reserve    =  "=" / "," / "!" / "@" / "|"
+#
+#   variable-list =  varspec *( "," varspec )
+#   varspec       =  varname [ modifier-level4 ]
+#   varname       =  varchar *( ["."] varchar )
+#   varchar       =  ALPHA / DIGIT / "_" / pct-encoded
+#
+#   modifier-level4 =  prefix / explode
+#   prefix        =  ":" max-length
+#   max-length    =  %x31-39 0*3DIGIT   ; positive integer < 10000
+#   explode       =  "*"
+#
+_TEMPLATE_EXPR_RE = re.compile(r"\{([^{}]*)\}")
+
+_TEMPLATE_VARSPEC_RE = re.compile(
+    r"""
+    ((?:[A-Za-z0-9_]|%[0-9A-Fa-f]{2})(?:\.?(?:[A-Za-z0-9_]|%[0-9A-Fa-f]{2}))*)
+    (?::([1-9][0-9]{0,3})|(\*))?
+    \Z
+    """,
+    flags=re.VERBOSE,
+)
+
+# RFC 6570 3.2.1: The allowed set for a given expansion depends on the
+# expression type: reserved ("+") and fragment ("#") expansions allow
+# the set of characters in the union of ( unreserved / reserved /
+# pct-encoded ) to be passed through without pct-encoding, whereas
+# all other expression types allow only unreserved characters.
+_SAFE_TEMPLATE = RESERVED + "%"
+
+_PCT_INVALID_RE = re.compile(b"%(?![0-9A-Fa-f]{2})")
+
+
+_template_encode_safe = PercentEncoder(_SAFE_TEMPLATE).encode
+
+
+def _template_encode_reserved(value, encoding="utf-8", errors="strict"):
+    value = _template_encode_safe(value, encoding, errors)
+    if b"%" in value:
+        value = _PCT_INVALID_RE.sub(b"%25", value)
+    return value
+
+
+_template_encode_unreserved = _getencoder("")
+
+# RFC 6570 Appendix A: operator -> (first, sep, named, ifemp, encode)
+_TEMPLATE_OPERATORS = {
+    "": (b"", b",", False, b"", _template_encode_unreserved),
+    "+": (b"", b",", False, b"", _template_encode_reserved),
+    ".": (b".", b".", False, b"", _template_encode_unreserved),
+    "/": (b"/", b"/", False, b"", _template_encode_unreserved),
+    ";": (b";", b";", True, b"", _template_encode_unreserved),
+    "?": (b"?", b"&", True, b"=", _template_encode_unreserved),
+    "&": (b"&", b"&", True, b"=", _template_encode_unreserved),
+    "#": (b"#", b",", False, b"", _template_encode_reserved),
+}
+
+
+def _template_expression(expr):
+    operator = expr[:1]
+    if operator and operator in _TEMPLATE_OPERATORS:
+        varlist = expr[1:]
+    else:
+        operator, varlist = "", expr
+    varspecs = []
+    for varspec in varlist.split(","):
+        match = _TEMPLATE_VARSPEC_RE.match(varspec)
+        if match is None:
+            raise ValueError("Invalid URI template expression: {%s}" % expr)
+        name, prefix, explode = match.groups()
+        varspecs.append(
+            (name, name.encode("ascii"), int(prefix or 0), explode is not None)
+        )
+    return _TEMPLATE_OPERATORS[operator] + (tuple(varspecs),)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compiletemplate(template):
+    # compile a template into a tuple of literal byte strings and
+    # parsed expressions, i.e. tuples of operator properties and
+    # variable specifications
+    parts = []
+    pos = 0
+    for match in _TEMPLATE_EXPR_RE.finditer(template):
+        parts.append(template[pos : match.start()])
+        parts.append(_template_expression(match.group(1)))
+        pos = match.end()
+    parts.append(template[pos:])
+    result = []
+    for part in parts:
+        if not isinstance(part, str):
+            result.append(part)
+        elif "{" in part or "}" in part:
+            raise ValueError("Invalid URI template: %r" % template)
+        elif part:
+            # RFC 6570 3.1: literal characters not allowed in URIs are
+            # pct-encoded
+            literal = _template_encode_reserved(part)
+            if result and isinstance(result[-1], bytes):
+                result[-1] += literal
+            else:
+                result.append(literal)
+    return tuple(result)
+
+
+def _template_value(value):
+    if isinstance(value, (str, bytes)):
+        return value
+    else:
+        return str(value)
+
+
+def _template_expand(expression, variables):
+    first, sep, named, ifemp, encode, varspecs = expression
+    result = []
+    append = result.append
+    for name, key, prefix, explode in varspecs:
+        value = variables.get(name)
+        if value is None:
+            continue
+        elif isinstance(value, (str, bytes, numbers.Number)):
+            value = _template_value(value)
+            if prefix:
+                value = value[:prefix]
+            if not named:
+                append(encode(value))
+            elif value:
+                append(key + b"=" + encode(value))
+            else:
+                append(key + ifemp)
+            continue
+        elif isinstance(value, collections.abc.Mapping):
+            items = [(k, _template_value(v)) for k, v in value.items() if v is not None]
+        else:
+            items = [(None, _template_value(v)) for v in value if v is not None]
+        if not items:
+            # RFC 6570 2.3: empty lists and associative arrays are
+            # considered to be undefined
+            continue
+        elif prefix:
+            raise ValueError("Prefix modifier applied to composite value")
+        elif not explode:
+            values = []
+            for k, v in items:
+                if k is not None:
+                    values.append(encode(_template_value(k)))
+                values.append(encode(v))
+            if named:
+                append(key + b"=" + b",".join(values))
+            else:
+                append(b",".join(values))
+        else:
+            for k, v in items:
+                if k is not None:
+                    k = encode(_template_value(k))
+                elif named:
+                    k = key
+                else:
+                    append(encode(v))
+                    continue
+                if v or not named:
+                    append(k + b"=" + encode(v))
+                else:
+                    append(k + ifemp)
+    if result:
+        return first + sep.join(result)
+    else:
+        return b""
+
+
+class URITemplate:
+    """RFC 6570 URI Template."""
+
+    __slots__ = ("__parts", "__template")
+
+    def __init__(self, template):
+        self.__parts = _compiletemplate(template)
+        self.__template = template
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, self.__template)
+
+    @property
+    def template(self):
+        """The URI template string."""
+        return self.__template
+
+    def expand(self, variables):
+        """Expand the URI template using the given mapping of variable
+        names to values.
+
+        """
+        result = []
+        for part in self.__parts:
+            if isinstance(part, bytes):
+                result.append(part)
+            else:
+                result.append(_template_expand(part, variables))
+        return b"".join(result).decode("ascii")
+
+    def expandall(self, iterable):
+        """Expand the URI template for each mapping in `iterable`,
+        returning an iterator of URI reference strings.
+
+        """
+        expand = self.expand
+        for variables in iterable:
+            yield expand(variables)
+
+
+def uriexpand(template, variables):
+    """Expand a RFC 6570 URI template string using the given mapping of
+    variable names to values.
+
+    """
+    return URITemplate(template).expand(variables)
@@ -1,33 +1,93 @@
+import array
+import functools
 import ipaddress
-from collections.abc import Iterable, Mapping, Sequence
-from typing import Any, AnyStr, Generic, NamedTuple, TypeAlias, overload
+import mmap
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import (
+    Any,
+    AnyStr,
+    Generic,
+    Literal,
+    NamedTuple,
+    TypeAlias,
+    TypeVar,
+    overload,
+)
 
 __all__ = [
     "GEN_DELIMS",
     "RESERVED",
     "SUB_DELIMS",
     "UNRESERVED",
+    "AuthorityCache",
+    "HostCache",
+    "IncrementalURIDecoder",
+    "InternCache",
+    "PathCache",
+    "PercentEncoder",
+    "SchemeNormalizer",
+    "SplitCache",
+    "URIComposer",
+    "URISet",
+    "URITemplate",
     "isabspath",
+    "isabspathmask",
     "isabsuri",
+    "isabsurimask",
     "isnetpath",
+    "isnetpathmask",
     "isrelpath",
+    "isrelpathmask",
     "issamedoc",
+    "issamedocmask",
     "isuri",
+    "isurimask",
+    "registerscheme",
     "uricompose",
     "uridecode",
     "uridefrag",
     "uriencode",
+    "uriexpand",
+    "urifingerprint",
     "urijoin",
+    "urijoinall",
+    "urinormalize",
+    "urinormalizeall",
+    "uriscan",
     "urisplit",
+    "urisplitbatch",
+    "urisplitcompact",
+    "urisplitspans",
     "uriunsplit",
 ]
 __version__: str
 
+_T = TypeVar("_T")
+
 GEN_DELIMS: str
 SUB_DELIMS: str
 RESERVED: str
 UNRESERVED: str
 
+class PercentEncoder:
+    def __init__(self, safe: str | bytes = ...) -> None: ...
+    @property
+    def safe(self) -> bytes: ...
+    @overload
+    def encode(
+        self,
+        uristring: str,
+        encoding: str = ...,
+        errors: str = ...,
+    ) -> bytes: ...
+    @overload
+    def encode(
+        self,
+        uristring: bytes,
+        encoding: str | None = ...,
+        errors: str = ...,
+    ) -> bytes: ...
+
 @overload
 def uriencode(
     uristring: str,
@@ -55,6 +115,15 @@ def uridecode(
     errors: str = ...,
 ) -> bytes: ...
 
+class IncrementalURIDecoder:
+    encoding: str | None
+    errors: str
+    def __init__(self, encoding: str | None = ..., errors: str = ...) -> None: ...
+    def decode(self, input: str | bytes, final: bool = ...) -> Any: ...
+    def reset(self) -> None: ...
+    def getstate(self) -> tuple[bytes, int]: ...
+    def setstate(self, state: tuple[bytes, int]) -> None: ...
+
 class DefragResult(NamedTuple, Generic[AnyStr]):
     uri: AnyStr
     fragment: AnyStr | None
@@ -88,13 +157,16 @@ class SplitResult(NamedTuple, Generic[AnyStr]):
     @property
     def port(self) -> AnyStr | None: ...
     def geturi(self) -> AnyStr: ...
-    def getscheme(self, default: str | None = ...) -> str | None: ...
+    def getscheme(
+        self, default: str | None = ..., intern: InternCache | None = ...
+    ) -> str | None: ...
     @overload
     def getauthority(
         self,
         default: tuple[Any, Any, Any] | None = ...,
         encoding: str = ...,
         errors: str = ...,
+        cache: AuthorityCache | None = ...,
     ) -> tuple[
         str | None,
         str | ipaddress.IPv4Address | ipaddress.IPv6Address | None,
@@ -107,6 +179,7 @@ class SplitResult(NamedTuple, Generic[AnyStr]):
         *,
         encoding: None,
         errors: str = ...,
+        cache: AuthorityCache | None = ...,
     ) -> tuple[
         bytes | None,
         str | ipaddress.IPv4Address | ipaddress.IPv6Address | None,
@@ -131,12 +204,24 @@ class SplitResult(NamedTuple, Generic[AnyStr]):
         self,
         default: str | ipaddress.IPv4Address | ipaddress.IPv6Address | None = ...,
         errors: str = ...,
+        intern: InternCache | None = ...,
+        cache: HostCache | None = ...,
     ) -> str | ipaddress.IPv4Address | ipaddress.IPv6Address | None: ...
     def getport(self, default: int | None = ...) -> int | None: ...
     @overload
-    def getpath(self, encoding: str = ..., errors: str = ...) -> str: ...
+    def getpath(
+        self,
+        encoding: str = ...,
+        errors: str = ...,
+        cache: PathCache | None = ...,
+    ) -> str: ...
     @overload
-    def getpath(self, encoding: None, errors: str = ...) -> bytes: ...
+    def getpath(
+        self,
+        encoding: None,
+        errors: str = ...,
+        cache: PathCache | None = ...,
+    ) -> bytes: ...
     @overload
     def getquery(
         self,
@@ -183,6 +268,21 @@ class SplitResult(NamedTuple, Generic[AnyStr]):
         errors: str = ...,
     ) -> list[tuple[bytes, bytes | None]]: ...
     @overload
+    def getqueryview(
+        self,
+        sep: str | bytes = ...,
+        encoding: str = ...,
+        errors: str = ...,
+    ) -> QueryView[str]: ...
+    @overload
+    def getqueryview(
+        self,
+        sep: str | bytes = ...,
+        *,
+        encoding: None,
+        errors: str = ...,
+    ) -> QueryView[bytes]: ...
+    @overload
     def getfragment(
         self,
         default: str | None = ...,
@@ -203,17 +303,395 @@ class SplitResult(NamedTuple, Generic[AnyStr]):
     def isabspath(self) -> bool: ...
     def isrelpath(self) -> bool: ...
     def issamedoc(self) -> bool: ...
-    def transform(self, ref: AnyStr, strict: bool = ...) -> SplitResult[AnyStr]: ...
+    def transform(
+        self, ref: AnyStr, strict: bool = ..., cache: PathCache | None = ...
+    ) -> SplitResult[AnyStr]: ...
+    def normalize(self) -> SplitResult[AnyStr]: ...
+
+class QueryView(Generic[AnyStr]):
+    def __contains__(self, name: object) -> bool: ...
+    def __iter__(self) -> Iterator[AnyStr]: ...
+    def __len__(self) -> int: ...
+    @overload
+    def get(self, name: AnyStr) -> AnyStr | None: ...
+    @overload
+    def get(self, name: AnyStr, default: _T) -> AnyStr | _T | None: ...
+    def getall(self, name: AnyStr) -> list[AnyStr | None]: ...
+    def items(self) -> Iterator[tuple[AnyStr, AnyStr | None]]: ...
 
 def uridefrag(uristring: AnyStr) -> DefragResult[AnyStr]: ...
-def urisplit(uristring: AnyStr) -> SplitResult[AnyStr]: ...
+def urisplit(
+    uristring: AnyStr,
+    cache: SplitCache | None = ...,
+    intern: InternCache | None = ...,
+) -> SplitResult[AnyStr]: ...
+
+_Span: TypeAlias = tuple[int, int]
+
+class SplitSpans(Generic[AnyStr]):
+    @property
+    def uristring(self) -> AnyStr: ...
+    @property
+    def scheme(self) -> _Span | None: ...
+    @property
+    def authority(self) -> _Span | None: ...
+    @property
+    def path(self) -> _Span: ...
+    @property
+    def query(self) -> _Span | None: ...
+    @property
+    def fragment(self) -> _Span | None: ...
+    @property
+    def userinfo(self) -> _Span | None: ...
+    @property
+    def host(self) -> _Span | None: ...
+    @property
+    def port(self) -> _Span | None: ...
+    def get(self, name: str) -> AnyStr | None: ...
+    def split(self) -> SplitResult[AnyStr]: ...
+
+def urisplitspans(uristring: AnyStr) -> SplitSpans[AnyStr]: ...
+
+class CompactSplitResult(Generic[AnyStr]):
+    def __iter__(self) -> Iterator[AnyStr | None]: ...
+    def __len__(self) -> int: ...
+    @overload
+    def __getitem__(self, index: int) -> AnyStr | None: ...
+    @overload
+    def __getitem__(self, index: slice) -> tuple[AnyStr | None, ...]: ...
+    @property
+    def scheme(self) -> AnyStr | None: ...
+    @property
+    def authority(self) -> AnyStr | None: ...
+    @property
+    def path(self) -> AnyStr: ...
+    @property
+    def query(self) -> AnyStr | None: ...
+    @property
+    def fragment(self) -> AnyStr | None: ...
+    @property
+    def userinfo(self) -> AnyStr | None: ...
+    @property
+    def host(self) -> AnyStr | None: ...
+    @property
+    def port(self) -> AnyStr | None: ...
+    def geturi(self) -> AnyStr: ...
+    def getscheme(
+        self, default: str | None = ..., intern: InternCache | None = ...
+    ) -> str | None: ...
+    @overload
+    def getauthority(
+        self,
+        default: tuple[Any, Any, Any] | None = ...,
+        encoding: str = ...,
+        errors: str = ...,
+        cache: AuthorityCache | None = ...,
+    ) -> tuple[
+        str | None,
+        str | ipaddress.IPv4Address | ipaddress.IPv6Address | None,
+        int | None,
+    ]: ...
+    @overload
+    def getauthority(
+        self,
+        default: tuple[Any, Any, Any] | None = ...,
+        *,
+        encoding: None,
+        errors: str = ...,
+        cache: AuthorityCache | None = ...,
+    ) -> tuple[
+        bytes | None,
+        str | ipaddress.IPv4Address | ipaddress.IPv6Address | None,
+        int | None,
+    ]: ...
+    @overload
+    def getuserinfo(
+        self,
+        default: str | None = ...,
+        encoding: str = ...,
+        errors: str = ...,
+    ) -> str | None: ...
+    @overload
+    def getuserinfo(
+        self,
+        default: bytes | None = ...,
+        *,
+        encoding: None,
+        errors: str = ...,
+    ) -> bytes | None: ...
+    def gethost(
+        self,
+        default: str | ipaddress.IPv4Address | ipaddress.IPv6Address | None = ...,
+        errors: str = ...,
+        intern: InternCache | None = ...,
+        cache: HostCache | None = ...,
+    ) -> str | ipaddress.IPv4Address | ipaddress.IPv6Address | None: ...
+    def getport(self, default: int | None = ...) -> int | None: ...
+    @overload
+    def getpath(
+        self,
+        encoding: str = ...,
+        errors: str = ...,
+        cache: PathCache | None = ...,
+    ) -> str: ...
+    @overload
+    def getpath(
+        self,
+        encoding: None,
+        errors: str = ...,
+        cache: PathCache | None = ...,
+    ) -> bytes: ...
+    @overload
+    def getquery(
+        self,
+        default: str | None = ...,
+        encoding: str = ...,
+        errors: str = ...,
+    ) -> str | None: ...
+    @overload
+    def getquery(
+        self,
+        default: bytes | None = ...,
+        *,
+        encoding: None,
+        errors: str = ...,
+    ) -> bytes | None: ...
+    @overload
+    def getquerydict(
+        self,
+        sep: str | bytes = ...,
+        encoding: str = ...,
+        errors: str = ...,
+    ) -> dict[str, list[str | None]]: ...
+    @overload
+    def getquerydict(
+        self,
+        sep: str | bytes = ...,
+        *,
+        encoding: None,
+        errors: str = ...,
+    ) -> dict[bytes, list[bytes | None]]: ...
+    @overload
+    def getquerylist(
+        self,
+        sep: str | bytes = ...,
+        encoding: str = ...,
+        errors: str = ...,
+    ) -> list[tuple[str, str | None]]: ...
+    @overload
+    def getquerylist(
+        self,
+        sep: str | bytes = ...,
+        *,
+        encoding: None,
+        errors: str = ...,
+    ) -> list[tuple[bytes, bytes | None]]: ...
+    @overload
+    def getqueryview(
+        self,
+        sep: str | bytes = ...,
+        encoding: str = ...,
+        errors: str = ...,
+    ) -> QueryView[str]: ...
+    @overload
+    def getqueryview(
+        self,
+        sep: str | bytes = ...,
+        *,
+        encoding: None,
+        errors: str = ...,
+    ) -> QueryView[bytes]: ...
+    @overload
+    def getfragment(
+        self,
+        default: str | None = ...,
+        encoding: str = ...,
+        errors: str = ...,
+    ) -> str | None: ...
+    @overload
+    def getfragment(
+        self,
+        default: bytes | None = ...,
+        *,
+        encoding: None,
+        errors: str = ...,
+    ) -> bytes | None: ...
+    def isuri(self) -> bool: ...
+    def isabsuri(self) -> bool: ...
+    def isnetpath(self) -> bool: ...
+    def isabspath(self) -> bool: ...
+    def isrelpath(self) -> bool: ...
+    def issamedoc(self) -> bool: ...
+    def transform(
+        self, ref: AnyStr, strict: bool = ..., cache: PathCache | None = ...
+    ) -> SplitResult[AnyStr]: ...
+    def normalize(self) -> SplitResult[AnyStr] | CompactSplitResult[AnyStr]: ...
+    def split(self) -> SplitResult[AnyStr]: ...
+
+def urisplitcompact(uristring: AnyStr) -> CompactSplitResult[AnyStr]: ...
+
+class SplitBatch(Generic[AnyStr]):
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> SplitResult[AnyStr]: ...
+    def __iter__(self) -> Iterator[SplitResult[AnyStr]]: ...
+    @property
+    def buffer(self) -> AnyStr: ...
+    @property
+    def offsets(self) -> array.array[int]: ...
+    def column(self, name: str) -> list[AnyStr | None]: ...
+    def toarrow(self) -> Any: ...
+    def tonumpy(self) -> dict[str, Any]: ...
+
+def urisplitbatch(iterable: Iterable[AnyStr]) -> SplitBatch[AnyStr]: ...
+
+_Buffer: TypeAlias = bytes | bytearray | memoryview | mmap.mmap
+
+@overload
+def uriscan(
+    buffer: _Buffer,
+    schemes: Iterable[str | bytes] | None = ...,
+    split: Literal[False] = ...,
+) -> Iterator[tuple[int, int]]: ...
+@overload
+def uriscan(
+    buffer: _Buffer,
+    schemes: Iterable[str | bytes] | None,
+    split: Literal[True],
+) -> Iterator[tuple[int, int, SplitResult[bytes]]]: ...
+@overload
+def uriscan(
+    buffer: _Buffer,
+    schemes: Iterable[str | bytes] | None = ...,
+    *,
+    split: Literal[True],
+) -> Iterator[tuple[int, int, SplitResult[bytes]]]: ...
+
+class SplitCache:
+    def __init__(
+        self, maxsize: int | None = ..., intern: InternCache | None = ...
+    ) -> None: ...
+    def __call__(self, uristring: AnyStr) -> SplitResult[AnyStr]: ...
+    @property
+    def maxsize(self) -> int | None: ...
+    def cache_info(
+        self,
+    ) -> tuple[functools._CacheInfo, functools._CacheInfo]: ...
+    def cache_clear(self) -> None: ...
+
+class InternCache:
+    def __init__(self, maxsize: int | None = ...) -> None: ...
+    @overload
+    def __call__(self, value: None) -> None: ...
+    @overload
+    def __call__(self, value: _T) -> _T: ...
+    @property
+    def maxsize(self) -> int | None: ...
+    def cache_info(self) -> functools._CacheInfo: ...
+    def cache_clear(self) -> None: ...
+
+class PathCache:
+    def __init__(self, maxsize: int | None = ...) -> None: ...
+    def __call__(self, path: AnyStr) -> AnyStr: ...
+    @property
+    def maxsize(self) -> int | None: ...
+    def cache_info(
+        self,
+    ) -> tuple[functools._CacheInfo, functools._CacheInfo]: ...
+    def cache_clear(self) -> None: ...
+
+class AuthorityCache:
+    def __init__(self, maxsize: int | None = ...) -> None: ...
+    def __call__(
+        self, authority: str | bytes, encoding: str | None = ..., errors: str = ...
+    ) -> tuple[
+        str | bytes | None,
+        str | ipaddress.IPv4Address | ipaddress.IPv6Address,
+        int | None,
+    ]: ...
+    @property
+    def maxsize(self) -> int | None: ...
+    def cache_info(self) -> functools._CacheInfo: ...
+    def cache_clear(self) -> None: ...
+
+class HostCache:
+    def __init__(self, maxsize: int | None = ...) -> None: ...
+    def __call__(
+        self, host: str | bytes, errors: str = ...
+    ) -> str | ipaddress.IPv4Address | ipaddress.IPv6Address: ...
+    @property
+    def maxsize(self) -> int | None: ...
+    def cache_info(self) -> functools._CacheInfo: ...
+    def cache_clear(self) -> None: ...
+
 def uriunsplit(parts: Iterable[AnyStr | None]) -> AnyStr: ...
 @overload
-def urijoin(base: str, ref: str | bytes, strict: bool = ...) -> str: ...
+def urijoin(
+    base: str, ref: str | bytes, strict: bool = ..., cache: PathCache | None = ...
+) -> str: ...
 @overload
-def urijoin(base: bytes, ref: str, strict: bool = ...) -> str: ...
+def urijoin(
+    base: bytes, ref: str, strict: bool = ..., cache: PathCache | None = ...
+) -> str: ...
+@overload
+def urijoin(
+    base: bytes, ref: bytes, strict: bool = ..., cache: PathCache | None = ...
+) -> bytes: ...
+@overload
+def urijoinall(
+    base: str,
+    refs: Iterable[str | bytes],
+    strict: bool = ...,
+    cache: PathCache | None = ...,
+) -> Iterator[str]: ...
 @overload
-def urijoin(base: bytes, ref: bytes, strict: bool = ...) -> bytes: ...
+def urijoinall(
+    base: bytes,
+    refs: Iterable[str],
+    strict: bool = ...,
+    cache: PathCache | None = ...,
+) -> Iterator[str]: ...
+@overload
+def urijoinall(
+    base: bytes,
+    refs: Iterable[bytes],
+    strict: bool = ...,
+    cache: PathCache | None = ...,
+) -> Iterator[bytes]: ...
+@overload
+def urijoinall(
+    base: bytes,
+    refs: Iterable[str | bytes],
+    strict: bool = ...,
+    cache: PathCache | None = ...,
+) -> Iterator[str | bytes]: ...
+def urinormalize(uristring: AnyStr) -> AnyStr: ...
+def urinormalizeall(iterable: Iterable[AnyStr]) -> Iterator[AnyStr]: ...
+
+class SchemeNormalizer:
+    def __init__(self, port: int | None = ..., path: str | None = ...) -> None: ...
+    @property
+    def port(self) -> int | None: ...
+    @property
+    def path(self) -> str | None: ...
+    def __call__(self, parts: SplitResult[AnyStr]) -> SplitResult[AnyStr]: ...
+
+def registerscheme(
+    scheme: str | bytes,
+    normalizer: Callable[[SplitResult[Any]], SplitResult[Any]] | None,
+) -> None: ...
+def urifingerprint(
+    uristring: str | bytes | SplitResult[Any] | CompactSplitResult[Any],
+) -> int: ...
+
+class URISet:
+    def __init__(
+        self, iterable: Iterable[str | bytes | SplitResult[Any]] = ...
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, uristring: object) -> bool: ...
+    def add(self, uristring: str | bytes | SplitResult[Any]) -> None: ...
+    def update(self, iterable: Iterable[str | bytes | SplitResult[Any]]) -> None: ...
+
 def isuri(uristring: str | bytes) -> bool: ...
 def isabsuri(uristring: str | bytes) -> bool: ...
 def isnetpath(uristring: str | bytes) -> bool: ...
@@ -221,10 +699,43 @@ def isabspath(uristring: str | bytes) -> bool: ...
 def isrelpath(uristring: str | bytes) -> bool: ...
 def issamedoc(uristring: str | bytes) -> bool: ...
 
+# NumPy is an optional dependency
+def isurimask(values: Any) -> Any: ...
+def isabsurimask(values: Any) -> Any: ...
+def isnetpathmask(values: Any) -> Any: ...
+def isabspathmask(values: Any) -> Any: ...
+def isrelpathmask(values: Any) -> Any: ...
+def issamedocmask(values: Any) -> Any: ...
+
 _QueryType: TypeAlias = (
     str | bytes | Mapping[str | bytes, object] | Iterable[tuple[str | bytes, object]]
 )
 
+class URIComposer:
+    def __init__(
+        self,
+        scheme: str | bytes | None = ...,
+        authority: str
+        | bytes
+        | Sequence[
+            str | bytes | ipaddress.IPv4Address | ipaddress.IPv6Address | int | None
+        ]
+        | None = ...,
+        path: str | bytes = ...,
+        userinfo: str | bytes | None = ...,
+        host: str | bytes | ipaddress.IPv4Address | ipaddress.IPv6Address | None = ...,
+        port: int | str | bytes | None = ...,
+        querysep: str = ...,
+        encoding: str = ...,
+        normalize: bool = ...,
+    ) -> None: ...
+    def compose(
+        self,
+        path: str | bytes = ...,
+        query: _QueryType | None = ...,
+        fragment: str | bytes | None = ...,
+    ) -> str: ...
+
 def uricompose(
     scheme: str | bytes | None = ...,
     authority: str
@@ -239,4 +750,23 @@ def uricompose(
     port: int | str | bytes | None = ...,
     querysep: str = ...,
     encoding: str = ...,
+    normalize: bool = ...,
 ) -> str: ...
+
+_TemplateValue: TypeAlias = str | bytes | int | float
+_TemplateVariables: TypeAlias = Mapping[
+    str,
+    _TemplateValue
+    | Sequence[_TemplateValue | None]
+    | Mapping[str, _TemplateValue | None]
+    | None,
+]
+
+class URITemplate:
+    def __init__(self, template: str) -> None: ...
+    @property
+    def template(self) -> str: ...
+    def expand(self, variables: _TemplateVariables) -> str: ...
+    def expandall(self, iterable: Iterable[_TemplateVariables]) -> Iterator[str]: ...
+
+def uriexpand(template: str, variables: _TemplateVariables) -> str: ...
@@ -0,0 +1,224 @@
+"""Command-line interface for bulk processing of URI references.
+
+Newline-delimited URI references are read as :class:`bytes` in large
+chunks from files or standard input, and results are written as
+tab-separated values or JSON lines.
+
+"""
+
+import argparse
+import contextlib
+import functools
+import json
+import multiprocessing
+import sys
+import time
+
+from . import (
+    uridefrag,
+    urifingerprint,
+    urijoinall,
+    urinormalizeall,
+    urisplit,
+)
+
+
+def _split(refs, base):
+    return map(urisplit, refs)
+
+
+def _join(refs, base):
+    return ((uri,) for uri in urijoinall(base, refs))
+
+
+def _normalize(refs, base):
+    return ((uri,) for uri in urinormalizeall(refs))
+
+
+def _defrag(refs, base):
+    return map(uridefrag, refs)
+
+
+def _classify(refs, base):
+    for parts in map(urisplit, refs):
+        yield (
+            parts.isuri(),
+            parts.isabsuri(),
+            parts.isnetpath(),
+            parts.isabspath(),
+            parts.isrelpath(),
+            parts.issamedoc(),
+        )
+
+
+def _fingerprint(refs, base):
+    return ((b"%016x" % urifingerprint(ref),) for ref in refs)
+
+
+# operation name -> (function, output field names)
+_OPERATIONS = {
+    "split": (_split, ("scheme", "authority", "path", "query", "fragment")),
+    "join": (_join, ("uri",)),
+    "normalize": (_normalize, ("uri",)),
+    "defrag": (_defrag, ("uri", "fragment")),
+    "classify": (
+        _classify,
+        ("isuri", "isabsuri", "isnetpath", "isabspath", "isrelpath", "issamedoc"),
+    ),
+    "fingerprint": (_fingerprint, ("fingerprint",)),
+}
+
+_TSV_VALUES = {None: b"", True: b"1", False: b"0"}
+
+
+def _tsv(results, fields):
+    values = _TSV_VALUES
+    lines = []
+    for result in results:
+        lines.append(
+            b"\t".join(v if isinstance(v, bytes) else values[v] for v in result)
+        )
+    lines.append(b"")
+    return b"\n".join(lines)
+
+
+def _jsonl(results, fields):
+    encoder = json.JSONEncoder(separators=(",", ":"))
+    lines = []
+    for result in results:
+        obj = {
+            k: v.decode("utf-8", "surrogateescape") if isinstance(v, bytes) else v
+            for k, v in zip(fields, result)
+        }
+        lines.append(encoder.encode(obj))
+    lines.append("")
+    return "\n".join(lines).encode("utf-8", "surrogateescape")
+
+
+_FORMATS = {"tsv": _tsv, "jsonl": _jsonl}
+
+
+def _process(operation, fmt, base, lines):
+    # must be a module-level function for use with process pools
+    func, fields = _OPERATIONS[operation]
+    return len(lines), _FORMATS[fmt](func(lines, base), fields)
+
+
+def _chunks(files, size):
+    for file in files:
+        rest = b""
+        while True:
+            data = file.read(size)
+            if not data:
+                break
+            data = rest + data
+            lines = data.split(b"\n")
+            rest = lines.pop()
+            if b"\r" in data:
+                lines = [line.rstrip(b"\r") for line in lines]
+            if lines:
+                yield lines
+        if rest:
+            yield [rest.rstrip(b"\r")]
+
+
+def _open(paths):
+    for path in paths:
+        if path == "-":
+            yield sys.stdin.buffer
+        else:
+            with open(path, "rb") as file:
+                yield file
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m uritools",
+        description="Process newline-delimited URI references.",
+    )
+    parser.add_argument("operation", choices=_OPERATIONS, help="operation to apply")
+    parser.add_argument(
+        "files",
+        metavar="FILE",
+        nargs="*",
+        default=["-"],
+        help='input files (default: standard input, also "-")',
+    )
+    parser.add_argument("-b", "--base", help="base URI for the join operation")
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=_FORMATS,
+        default="tsv",
+        help="output format (default: %(default)s)",
+    )
+    parser.add_argument("-o", "--output", help="output file (default: standard output)")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-u",
+        "--unordered",
+        action="store_true",
+        help="write results of worker processes in completion order",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1 << 20,
+        help="input chunk size in bytes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="report throughput on standard error",
+    )
+    args = parser.parse_intermixed_args(argv)
+
+    if args.operation == "join" and args.base is None:
+        parser.error("the join operation requires --base")
+    if args.jobs < 1:
+        parser.error("--jobs must be positive")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+    base = args.base.encode("utf-8") if args.base is not None else None
+    process = functools.partial(_process, args.operation, args.format, base)
+
+    start = time.perf_counter()
+    count = 0
+    with contextlib.ExitStack() as stack:
+        if args.output is None:
+            output = sys.stdout.buffer
+        else:
+            output = stack.enter_context(open(args.output, "wb"))
+        chunks = _chunks(_open(args.files), args.chunk_size)
+        if args.jobs == 1:
+            results = map(process, chunks)
+        else:
+            pool = stack.enter_context(multiprocessing.Pool(args.jobs))
+            if args.unordered:
+                results = pool.imap_unordered(process, chunks)
+            else:
+                results = pool.imap(process, chunks)
+        # each chunk's results are written with a single call
+        for n, data in results:
+            output.write(data)
+            count += n
+        output.flush()
+    elapsed = time.perf_counter() - start
+
+    if args.stats:
+        print(
+            "%d lines in %.3f s (%.0f lines/s)"
+            % (count, elapsed, count / elapsed if elapsed else 0.0),
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Asynchronous processing of URI references from byte streams.
+
+Newline-delimited URI references are read incrementally from an
+:class:`asyncio.StreamReader` or any other object with a compatible
+:meth:`read` coroutine method, and processed in micro-batches by a
+separate task.  Processed batches are passed on using a bounded queue,
+so reading is suspended while the consumer falls behind.
+
+"""
+
+import asyncio
+import functools
+import time
+
+from . import urijoinall, urisplit
+
+# number of bytes to read at once
+_BUFSIZE = 1 << 16
+
+# number of references to process when the cost is not yet known
+_PROBESIZE = 64
+
+
+def _split(refs):
+    return list(map(urisplit, refs))
+
+
+def _join(base, strict, refs):
+    return list(urijoinall(base, refs, strict))
+
+
+async def _batches(reader, batchsize):
+    rest = b""
+    while data := await reader.read(_BUFSIZE):
+        data = rest + data
+        lines = data.split(b"\n")
+        rest = lines.pop()
+        if b"\r" in data:
+            lines = [line.rstrip(b"\r") for line in lines]
+        # do not wait for a batch to fill up if no more data is available
+        for i in range(0, len(lines), batchsize):
+            yield lines[i : i + batchsize]
+    if rest:
+        yield [rest.rstrip(b"\r")]
+
+
+async def _process(func, batch, executor, budget, cost):
+    # return results and estimated cost per reference in seconds
+    if executor is not None and cost * len(batch) > budget:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, func, batch), cost
+    results = []
+    index = 0
+    while index < len(batch):
+        # process as many references as fit into the time budget
+        size = max(int(budget / cost), 1) if cost else _PROBESIZE
+        refs = batch[index : index + size]
+        start = time.perf_counter()
+        results.extend(func(refs))
+        cost = (time.perf_counter() - start) / len(refs)
+        index += len(refs)
+        # reading and queueing need not suspend, so always yield here
+        await asyncio.sleep(0)
+    return results, cost
+
+
+async def _produce(queue, func, reader, batchsize, executor, budget):
+    try:
+        cost = 0.0
+        async for batch in _batches(reader, batchsize):
+            results, cost = await _process(func, batch, executor, budget, cost)
+            await queue.put((results, None))
+    except Exception as e:  # noqa: BLE001
+        # errors are raised by the consumer
+        await queue.put((None, e))
+    else:
+        await queue.put((None, None))
+
+
+async def _results(func, reader, batchsize, maxsize, executor, budget):
+    queue = asyncio.Queue(maxsize)
+    task = asyncio.create_task(
+        _produce(queue, func, reader, batchsize, executor, budget)
+    )
+    try:
+        while True:
+            results, exception = await queue.get()
+            if exception is not None:
+                raise exception
+            elif results is None:
+                break
+            for result in results:
+                yield result
+            # queued results are available without suspending
+            await asyncio.sleep(0)
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+def _run(func, reader, batchsize, maxsize, executor, budget):
+    if batchsize < 1:
+        raise ValueError("Invalid batch size")
+    if maxsize < 1:
+        raise ValueError("Invalid queue size")
+    if budget < 0:
+        raise ValueError("Invalid time budget")
+    return _results(func, reader, batchsize, maxsize, executor, budget)
+
+
+def asplit(reader, batchsize=1000, maxsize=16, executor=None, budget=0.005):
+    """Split newline-delimited URI references read from `reader`,
+    returning an asynchronous iterator over
+    :class:`~uritools.SplitResult` objects.
+
+    """
+    return _run(_split, reader, batchsize, maxsize, executor, budget)
+
+
+def ajoin(
+    base,
+    reader,
+    strict=False,
+    batchsize=1000,
+    maxsize=16,
+    executor=None,
+    budget=0.005,
+):
+    """Convert newline-delimited URI references read from `reader`
+    relative to a common base URI to their target URI strings,
+    returning an asynchronous iterator.
+
+    """
+    if isinstance(base, str):
+        base = base.encode("utf-8")
+    func = functools.partial(_join, base, strict)
+    return _run(func, reader, batchsize, maxsize, executor, budget)
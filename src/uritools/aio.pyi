@@ -0,0 +1,25 @@
+from collections.abc import AsyncGenerator
+from concurrent.futures import Executor
+from typing import Protocol
+
+from . import SplitResult
+
+class _Reader(Protocol):
+    async def read(self, n: int = ..., /) -> bytes: ...
+
+def asplit(
+    reader: _Reader,
+    batchsize: int = ...,
+    maxsize: int = ...,
+    executor: Executor | None = ...,
+    budget: float = ...,
+) -> AsyncGenerator[SplitResult[bytes]]: ...
+def ajoin(
+    base: str | bytes,
+    reader: _Reader,
+    strict: bool = ...,
+    batchsize: int = ...,
+    maxsize: int = ...,
+    executor: Executor | None = ...,
+    budget: float = ...,
+) -> AsyncGenerator[bytes]: ...
@@ -0,0 +1,249 @@
+"""Parallel processing of large numbers of URI references.
+
+Input is split into chunks, which are processed by a pool of worker
+processes or, on free-threaded Python builds, worker threads.  For
+process pools, chunks of URI reference strings are sent to workers as
+single newline-joined :class:`bytes` objects, and results are sent
+back in similarly compact form.  Chunks containing URI references with
+embedded line breaks are sent as lists instead.
+
+"""
+
+import collections
+import concurrent.futures
+import os
+import sys
+
+from . import uricompose, urijoinall, urinormalizeall, urisplit, urisplitbatch
+
+
+def _decode(data, isbytes):
+    if isbytes:
+        return data.split(b"\n")
+    else:
+        return data.decode("utf-8", "surrogatepass").split("\n")
+
+
+def _encode(strings):
+    # return newline-joined bytes and whether strings are bytes, or
+    # None if strings contain line breaks and cannot be joined
+    if strings and isinstance(strings[0], bytes):
+        data = b"\n".join(strings)
+        if data.count(b"\n") != len(strings) - 1:
+            return None
+        return data, True
+    else:
+        data = "\n".join(strings)
+        if data.count("\n") != len(strings) - 1:
+            return None
+        return data.encode("utf-8", "surrogatepass"), False
+
+
+# worker functions, must be module-level for use with process pools
+
+
+def _split(refs):
+    return list(map(urisplit, refs))
+
+
+def _splitdata(data, isbytes):
+    # a SplitBatch is pickled as a single buffer and a few arrays
+    return urisplitbatch(_decode(data, isbytes))
+
+
+def _join(refs, base, strict):
+    return list(urijoinall(base, refs, strict))
+
+
+def _joindata(data, isbytes, base, strict):
+    results = list(urijoinall(base, _decode(data, isbytes), strict))
+    return _encode(results) or results
+
+
+def _normalize(refs):
+    return list(urinormalizeall(refs))
+
+
+def _normalizedata(data, isbytes):
+    results = list(urinormalizeall(_decode(data, isbytes)))
+    return _encode(results) or results
+
+
+def _compose(items):
+    return [uricompose(**item) for item in items]
+
+
+def _chunks(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _workers(workers):
+    if workers is None:
+        # os.process_cpu_count() is new in Python 3.13
+        count = getattr(os, "process_cpu_count", os.cpu_count)
+        return count() or 1
+    elif workers < 1:
+        raise ValueError("Invalid number of workers")
+    else:
+        return workers
+
+
+def _executor(executor):
+    if executor is None:
+        # use threads if the GIL is disabled on free-threaded builds
+        enabled = getattr(sys, "_is_gil_enabled", None)
+        return "thread" if enabled is not None and not enabled() else "process"
+    elif executor not in ("process", "thread"):
+        raise ValueError("Invalid executor: %r" % executor)
+    else:
+        return executor
+
+
+class Results:
+    """Iterator over the results of a parallel operation."""
+
+    __slots__ = ("__executor", "__results", "__workers")
+
+    def __init__(self, executor, workers, results):
+        self.__executor = executor
+        self.__workers = workers
+        self.__results = results
+
+    def __repr__(self):
+        return "<%s using %d %s workers>" % (
+            type(self).__name__,
+            self.__workers,
+            self.__executor,
+        )
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.__results)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def executor(self):
+        """The kind of executor used, either ``"process"`` or
+        ``"thread"``.
+
+        """
+        return self.__executor
+
+    @property
+    def workers(self):
+        """The number of workers used."""
+        return self.__workers
+
+    def close(self):
+        """Cancel pending chunks and shut down the workers."""
+        self.__results.close()
+
+
+def _run(iterable, chunksize, workers, ordered, executor, funcs, args=(), pack=True):
+    if chunksize < 1:
+        raise ValueError("Invalid chunk size")
+    workers = _workers(workers)
+    executor = _executor(executor)
+    if executor == "process":
+        pool = concurrent.futures.ProcessPoolExecutor(workers)
+    else:
+        pool = concurrent.futures.ThreadPoolExecutor(workers)
+        pack = False
+    chunks = _chunks(iterable, chunksize)
+    results = _results(pool, funcs, args, chunks, pack, 2 * workers, ordered)
+    return Results(executor, workers, results)
+
+
+def _results(pool, funcs, args, chunks, pack, limit, ordered):
+    # limit pending chunks, so input is only consumed as needed
+    if ordered:
+        pending = collections.deque()
+        add = pending.append
+    else:
+        pending = set()
+        add = pending.add
+    try:
+        func, packfunc = funcs
+        for chunk in chunks:
+            if pack and (packed := _encode(chunk)) is not None:
+                add(pool.submit(packfunc, *packed, *args))
+            else:
+                add(pool.submit(func, chunk, *args))
+            while len(pending) >= limit:
+                yield from _completed(pending, ordered)
+        while pending:
+            yield from _completed(pending, ordered)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _completed(pending, ordered):
+    if ordered:
+        completed = [pending.popleft()]
+    else:
+        completed, _ = concurrent.futures.wait(
+            pending, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        pending.difference_update(completed)
+    for future in completed:
+        result = future.result()
+        # encoded results are returned as (data, isbytes) tuples
+        if isinstance(result, tuple):
+            yield from _decode(*result)
+        else:
+            yield from result
+
+
+def split(iterable, chunksize=10000, workers=None, ordered=True, executor=None):
+    """Split URI reference strings from `iterable` in parallel, returning
+    an iterator over :class:`~uritools.SplitResult` objects.
+
+    """
+    funcs = (_split, _splitdata)
+    return _run(iterable, chunksize, workers, ordered, executor, funcs)
+
+
+def join(
+    base,
+    iterable,
+    strict=False,
+    chunksize=10000,
+    workers=None,
+    ordered=True,
+    executor=None,
+):
+    """Convert URI references from `iterable` relative to a common base
+    URI to their target URI strings in parallel.
+
+    """
+    funcs = (_join, _joindata)
+    return _run(iterable, chunksize, workers, ordered, executor, funcs, (base, strict))
+
+
+def normalize(iterable, chunksize=10000, workers=None, ordered=True, executor=None):
+    """Normalize URI reference strings from `iterable` in parallel."""
+    funcs = (_normalize, _normalizedata)
+    return _run(iterable, chunksize, workers, ordered, executor, funcs)
+
+
+def compose(iterable, chunksize=10000, workers=None, ordered=True, executor=None):
+    """Compose URI reference strings in parallel from mappings of
+    :func:`~uritools.uricompose` keyword arguments.
+
+    """
+    funcs = (_compose, _compose)
+    return _run(iterable, chunksize, workers, ordered, executor, funcs, pack=False)
@@ -0,0 +1,50 @@
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, AnyStr, Generic, Literal, TypeAlias, TypeVar
+
+from . import SplitResult
+
+_T = TypeVar("_T")
+
+_Executor: TypeAlias = Literal["process", "thread"]
+
+class Results(Iterator[_T], Generic[_T]):
+    def __iter__(self) -> Results[_T]: ...
+    def __next__(self) -> _T: ...
+    def __enter__(self) -> Results[_T]: ...
+    def __exit__(self, *exc_info: object) -> None: ...
+    @property
+    def executor(self) -> _Executor: ...
+    @property
+    def workers(self) -> int: ...
+    def close(self) -> None: ...
+
+def split(
+    iterable: Iterable[AnyStr],
+    chunksize: int = ...,
+    workers: int | None = ...,
+    ordered: bool = ...,
+    executor: _Executor | None = ...,
+) -> Results[SplitResult[AnyStr]]: ...
+def join(
+    base: str | bytes,
+    iterable: Iterable[AnyStr],
+    strict: bool = ...,
+    chunksize: int = ...,
+    workers: int | None = ...,
+    ordered: bool = ...,
+    executor: _Executor | None = ...,
+) -> Results[AnyStr]: ...
+def normalize(
+    iterable: Iterable[AnyStr],
+    chunksize: int = ...,
+    workers: int | None = ...,
+    ordered: bool = ...,
+    executor: _Executor | None = ...,
+) -> Results[AnyStr]: ...
+def compose(
+    iterable: Iterable[Mapping[str, Any]],
+    chunksize: int = ...,
+    workers: int | None = ...,
+    ordered: bool = ...,
+    executor: _Executor | None = ...,
+) -> Results[str]: ...
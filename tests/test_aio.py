@@ -0,0 +1,139 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import unittest
+
+from uritools import aio, urijoin, urisplit
+
+URIS = [
+    b"foo://user@example.com:8042/over/there?name=ferret#nose",
+    b"urn:example:animal:ferret:nose",
+    b"http://a/b/c/./../d;p?q",
+    b"../g",
+    b"",
+    b"?y#s",
+] * 50
+
+BASE = "http://a/b/c/d;p?q"
+
+
+class ChunkReader:
+    """Stream reader returning data in fixed-size chunks."""
+
+    def __init__(self, data, size=100):
+        self.data = data
+        self.size = size
+        self.reads = 0
+
+    async def read(self, n=-1):
+        n = min(n, self.size) if n >= 0 else self.size
+        data, self.data = self.data[:n], self.data[n:]
+        self.reads += 1
+        return data
+
+
+class FailingReader:
+    async def read(self, n=-1):
+        raise OSError("read failed")
+
+
+async def collect(results):
+    return [result async for result in results]
+
+
+def stream(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class AsyncTest(unittest.TestCase):
+    def run_async(self, func, data, **kwargs):
+        async def run():
+            return await collect(func(stream(data), **kwargs))
+
+        return asyncio.run(run())
+
+    def test_split(self):
+        data = b"\n".join(URIS) + b"\n"
+        for batchsize in (1, 7, 1000):
+            results = self.run_async(aio.asplit, data, batchsize=batchsize)
+            self.assertEqual(results, [urisplit(uri) for uri in URIS])
+
+    def test_join(self):
+        data = b"\n".join(URIS)
+        join = functools.partial(aio.ajoin, BASE)
+        results = self.run_async(join, data, batchsize=7)
+        self.assertEqual(results, [urijoin(BASE.encode(), uri) for uri in URIS])
+        join = functools.partial(aio.ajoin, BASE.encode())
+        results = self.run_async(join, data, strict=True)
+        self.assertEqual(results, [urijoin(BASE, uri, True).encode() for uri in URIS])
+
+    def test_lines(self):
+        cases = [
+            (b"", []),
+            (b"\n", [b""]),
+            (b"a", [b"a"]),
+            (b"a\nb", [b"a", b"b"]),
+            (b"a\r\nb\r\n", [b"a", b"b"]),
+            (b"a\r\n\r\nb\r", [b"a", b"", b"b"]),
+        ]
+        for data, expected in cases:
+            with self.subTest(data=data):
+                results = self.run_async(aio.asplit, data)
+                self.assertEqual(results, [urisplit(uri) for uri in expected])
+
+    def test_chunks(self):
+        data = b"\r\n".join(URIS)
+
+        async def run(size):
+            reader = ChunkReader(data, size)
+            return await collect(aio.asplit(reader, batchsize=5))
+
+        for size in (1, 2, 3, 100):
+            results = asyncio.run(run(size))
+            self.assertEqual(results, [urisplit(uri) for uri in URIS])
+
+    def test_executor(self):
+        data = b"\n".join(URIS)
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            # all batches with known cost exceed the time budget
+            results = self.run_async(
+                aio.asplit, data, batchsize=10, executor=executor, budget=0.0
+            )
+        self.assertEqual(results, [urisplit(uri) for uri in URIS])
+
+    def test_backpressure(self):
+        # each read returns a single line
+        data = b"".join(b"http://example.com/%04d\n" % i for i in range(100))
+        reader = ChunkReader(data, len(b"http://example.com/0000\n"))
+
+        async def run():
+            results = aio.asplit(reader, batchsize=1, maxsize=2)
+            async with contextlib.aclosing(results):
+                await results.__anext__()
+                # give the producer a chance to fill up the queue
+                for _ in range(100):
+                    await asyncio.sleep(0)
+            return reader.reads
+
+        # one line was consumed, two are queued and one is pending
+        self.assertEqual(asyncio.run(run()), 4)
+
+    def test_error(self):
+        async def run():
+            return await collect(aio.asplit(FailingReader()))
+
+        with self.assertRaises(OSError):
+            asyncio.run(run())
+
+    def test_invalid(self):
+        reader = ChunkReader(b"")
+        with self.assertRaises(ValueError):
+            aio.asplit(reader, batchsize=0)
+        with self.assertRaises(ValueError):
+            aio.asplit(reader, maxsize=0)
+        with self.assertRaises(ValueError):
+            aio.ajoin(BASE, reader, budget=-1)
@@ -0,0 +1,87 @@
+import unittest
+
+from uritools import urisplit, urisplitbatch
+
+URIS = [
+    "foo://user@example.com:8042/over/there?name=ferret#nose",
+    "urn:example:animal:ferret:nose",
+    "http://a/b/c/d;p?q",
+    "../g",
+    "//g",
+    "?y#s",
+    "#",
+    "?",
+    "",
+    "a:",
+    "//",
+    "http://a/b#c\nd",
+]
+
+COLUMNS = ("scheme", "authority", "path", "query", "fragment")
+
+
+class BatchTest(unittest.TestCase):
+    def check(self, uris):
+        batch = urisplitbatch(iter(uris))
+        expected = [urisplit(uri) for uri in uris]
+        self.assertEqual(len(batch), len(expected))
+        self.assertEqual(list(batch), expected)
+        for index, parts in enumerate(expected):
+            self.assertEqual(batch[index], parts)
+            self.assertIsInstance(batch[index], type(parts))
+            self.assertEqual(batch[index - len(expected)], parts)
+        for index, name in enumerate(COLUMNS):
+            self.assertEqual(batch.column(name), [p[index] for p in expected])
+        offsets = batch.offsets
+        self.assertEqual(len(offsets), len(uris) + 1)
+        self.assertEqual(offsets[-1], len(batch.buffer))
+        for index, parts in enumerate(expected):
+            row = batch.buffer[offsets[index] : offsets[index + 1]]
+            self.assertEqual(urisplit(row), parts)
+
+    def test_string(self):
+        self.check(URIS)
+
+    def test_bytes(self):
+        self.check([uri.encode() for uri in URIS])
+
+    def test_empty(self):
+        batch = urisplitbatch([])
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(list(batch), [])
+        self.assertEqual(batch.column("path"), [])
+        self.assertEqual(batch.buffer, "")
+
+    def test_errors(self):
+        batch = urisplitbatch(URIS)
+        with self.assertRaises(IndexError):
+            batch[len(URIS)]
+        with self.assertRaises(IndexError):
+            batch[-len(URIS) - 1]
+        with self.assertRaises(ValueError):
+            batch.column("host")
+        with self.assertRaises(TypeError):
+            urisplitbatch(["http://a/", b"http://b/"])  # type: ignore
+
+    def test_numpy(self):
+        try:
+            import numpy  # type: ignore
+        except ImportError:
+            self.skipTest("numpy not installed")
+        arrays = urisplitbatch(URIS).tonumpy()
+        self.assertEqual(list(arrays), list(COLUMNS))
+        for index, name in enumerate(COLUMNS):
+            self.assertEqual(arrays[name].dtype, numpy.dtype(object))
+            self.assertEqual(arrays[name].tolist(), [urisplit(u)[index] for u in URIS])
+
+    def test_arrow(self):
+        try:
+            import pyarrow  # type: ignore  # noqa: F401
+        except ImportError:
+            self.skipTest("pyarrow not installed")
+        table = urisplitbatch(URIS).toarrow()
+        self.assertEqual(table.column_names, list(COLUMNS))
+        for index, name in enumerate(COLUMNS):
+            self.assertEqual(
+                table.column(name).to_pylist(), [urisplit(u)[index] for u in URIS]
+            )
@@ -0,0 +1,171 @@
+import ipaddress
+import unittest
+
+from uritools import (
+    AuthorityCache,
+    HostCache,
+    InternCache,
+    PathCache,
+    SplitCache,
+    urijoin,
+    urijoinall,
+    urisplit,
+)
+
+# cache classes with a sample argument for each
+CACHES = [
+    (AuthorityCache, "user@example.com:80"),
+    (HostCache, "example.com"),
+    (InternCache, "example.com"),
+    (PathCache, "/a/../b"),
+    (SplitCache, "foo://example.com/"),
+]
+
+
+def cache_infos(cache):
+    # str/bytes caches return a pair of statistics
+    info = cache.cache_info()
+    return info if isinstance(info[0], tuple) else (info,)
+
+
+class CacheTest(unittest.TestCase):
+    def test_maxsize(self):
+        for cls, _ in CACHES:
+            with self.subTest(cls=cls.__name__):
+                self.assertEqual(cls().maxsize, 1024)
+                self.assertEqual(cls(maxsize=2).maxsize, 2)
+                self.assertIsNone(cls(maxsize=None).maxsize)
+
+    def test_hits(self):
+        for cls, value in CACHES:
+            with self.subTest(cls=cls.__name__):
+                cache = cls()
+                result = cache(value)
+                self.assertIs(cache(value), result)
+                info = cache_infos(cache)[0]
+                self.assertEqual(info.hits, 1)
+                self.assertEqual(info.misses, 1)
+                self.assertEqual(info.currsize, 1)
+
+    def test_eviction(self):
+        for cls, value in CACHES:
+            with self.subTest(cls=cls.__name__):
+                cache = cls(maxsize=2)
+                first = cache(value + "a")
+                cache(value + "b")
+                cache(value + "c")
+                self.assertEqual(cache_infos(cache)[0].currsize, 2)
+                self.assertIsNot(cache(value + "a"), first)
+                self.assertEqual(cache(value + "a"), first)
+
+    def test_clear(self):
+        for cls, value in CACHES:
+            with self.subTest(cls=cls.__name__):
+                cache = cls()
+                cache(value)
+                cache(value)
+                cache.cache_clear()
+                for info in cache_infos(cache):
+                    self.assertEqual(info.currsize, 0)
+                    self.assertEqual(info.hits, 0)
+                    self.assertEqual(info.misses, 0)
+
+    def test_invalid(self):
+        for cls, _ in CACHES:
+            with self.subTest(cls=cls.__name__):
+                with self.assertRaises(ValueError):
+                    cls(-1)
+                with self.assertRaises(ValueError):
+                    cls(maxsize=-1)
+
+
+class SplitCacheTest(unittest.TestCase):
+    def test_cache(self):
+        cache = SplitCache(maxsize=2)
+        for uri in ["foo://example.com/", b"foo://example.com/"]:
+            result = urisplit(uri, cache=cache)
+            self.assertEqual(result, urisplit(uri))
+            self.assertIs(type(result), type(urisplit(uri)))
+            self.assertIs(cache(uri), result)
+            self.assertIs(urisplit(uri, cache=cache), result)
+        self.assertEqual(cache.cache_info()[0].hits, 2)
+        self.assertEqual(cache.cache_info()[0].misses, 1)
+        self.assertEqual(cache.cache_info()[1].hits, 2)
+        self.assertEqual(cache.cache_info()[1].misses, 1)
+
+    def test_uncached(self):
+        cache = SplitCache()
+        self.assertIsNot(urisplit("a"), urisplit("a"))
+        urisplit("a", cache=cache)
+        self.assertIsNot(urisplit("a"), cache("a"))
+
+
+class HostCacheTest(unittest.TestCase):
+    def test_cache(self):
+        cache = HostCache(maxsize=2)
+        a = urisplit("http://Example.COM/").gethost(cache=cache)
+        b = urisplit(b"http://example.com:80/").gethost(cache=cache)
+        self.assertEqual(a, "example.com")
+        self.assertEqual(b, "example.com")
+        self.assertIs(urisplit("http://Example.COM/").gethost(cache=cache), a)
+        self.assertEqual(cache.cache_info().hits, 1)
+        self.assertEqual(cache.cache_info().misses, 2)
+        self.assertEqual(
+            urisplit("http://[::1]/").gethost(cache=cache),
+            ipaddress.IPv6Address("::1"),
+        )
+        self.assertEqual(cache("127.0.0.1"), ipaddress.IPv4Address("127.0.0.1"))
+        self.assertIsNone(urisplit("/").gethost(cache=cache))
+        self.assertEqual(urisplit("file:///").gethost("x", cache=cache), "x")
+
+    def test_intern(self):
+        cache = HostCache()
+        intern = InternCache()
+        a = urisplit("http://Example.COM/").gethost(intern=intern, cache=cache)
+        b = urisplit(b"http://example.com/").gethost(intern=intern, cache=cache)
+        self.assertIs(a, b)
+
+    def test_errors(self):
+        cache = HostCache()
+        for host in ["[v1.x]", "[::1", "::1]"]:
+            with self.assertRaises(ValueError):
+                cache(host)
+        self.assertEqual(cache("%FF", "replace"), "\ufffd")
+        self.assertEqual(cache.cache_info().currsize, 1)
+
+
+class PathCacheTest(unittest.TestCase):
+    def test_cache(self):
+        cache = PathCache(maxsize=2)
+        for path in ["/a/./b/../c", b"/a/./b/../c"]:
+            result = cache(path)
+            self.assertEqual(result, path[:2] + path[-2:])
+            self.assertIs(type(result), type(path))
+            self.assertIs(cache(path), result)
+        self.assertEqual(cache.cache_info()[0].hits, 1)
+        self.assertEqual(cache.cache_info()[0].misses, 1)
+        self.assertEqual(cache.cache_info()[1].hits, 1)
+        self.assertEqual(cache.cache_info()[1].misses, 1)
+
+    def test_getpath(self):
+        cache = PathCache()
+        parts = urisplit("http://example.com/a/./b/../c%20d")
+        self.assertEqual(parts.getpath(cache=cache), "/a/c d")
+        self.assertEqual(parts.getpath(None, cache=cache), b"/a/c d")
+        self.assertEqual(urisplit("/a/b").getpath(cache=cache), "/a/b")
+        # paths without dot-segments are not cached
+        self.assertEqual(cache.cache_info()[0].currsize, 1)
+
+    def test_join(self):
+        cache = PathCache()
+        base = "http://a/b/c/d;p?q"
+        refs = ["../g", "./g", "g", "/./g", "//g/../h", "http:../g"]
+        for strict in (False, True):
+            expected = [urijoin(base, ref, strict) for ref in refs]
+            self.assertEqual(
+                [urijoin(base, ref, strict, cache) for ref in refs], expected
+            )
+            self.assertEqual(list(urijoinall(base, refs, strict, cache)), expected)
+        result = urisplit(base.encode()).transform(b"../g", cache=cache)
+        self.assertEqual(result.geturi(), b"http://a/b/g")
+        self.assertEqual(cache.cache_info()[1].currsize, 1)
@@ -2,6 +2,11 @@ import unittest
 
 import uritools
 
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None
+
 
 class ClassifyTest(unittest.TestCase):
     def test_classification(self):
@@ -54,3 +59,73 @@ class ClassifyTest(unittest.TestCase):
                 self.assertEqual(uritools.isabspath(ref), abspath)
                 self.assertEqual(uritools.isrelpath(ref), relpath)
                 self.assertEqual(uritools.issamedoc(ref), samedoc)
+
+
+@unittest.skipIf(numpy is None, "numpy not installed")
+class ClassifyMaskTest(unittest.TestCase):
+    PREDICATES = (
+        "isuri",
+        "isabsuri",
+        "isnetpath",
+        "isabspath",
+        "isrelpath",
+        "issamedoc",
+    )
+
+    URIS = (
+        "",
+        "#",
+        "#f",
+        "?q",
+        "p",
+        "p:",
+        "/p",
+        "/p#f",
+        "//",
+        "//n?q#f",
+        "s:",
+        "s:p#f",
+        "s://h/p?q",
+        "S+.-9:p",
+        "9s:p",
+        "s/p:q",
+        "s?p:q",
+        "\0",
+        "\0s:",
+        "\u00e9:p",
+    )
+
+    def check(self, array):
+        assert numpy is not None
+        for name in self.PREDICATES:
+            func = getattr(uritools, name)
+            mask = getattr(uritools, name + "mask")(array)
+            expected = [func(ref) for ref in numpy.asarray(array).flat]
+            self.assertEqual(mask.dtype, numpy.dtype(bool))
+            self.assertEqual(mask.shape, numpy.shape(array))
+            self.assertEqual(mask.reshape(-1).tolist(), expected)
+
+    def test_str(self):
+        assert numpy is not None
+        self.check(numpy.array(self.URIS))
+        self.check(numpy.array(self.URIS, dtype=">U16"))
+        self.check(numpy.array(self.URIS).reshape(4, 5))
+        self.check(numpy.array(["p"] * 3))
+        self.check(numpy.array("s:p"))
+        self.check(numpy.array([], dtype=str))
+
+    def test_bytes(self):
+        assert numpy is not None
+        self.check(numpy.array([s.encode("utf-8") for s in self.URIS]))
+        self.check(numpy.array([], dtype=bytes))
+
+    def test_object(self):
+        assert numpy is not None
+        self.check(numpy.array(self.URIS, dtype=object))
+        self.check(list(self.URIS))
+
+    def test_errors(self):
+        assert numpy is not None
+        for name in self.PREDICATES:
+            with self.assertRaises(TypeError):
+                getattr(uritools, name + "mask")(numpy.zeros(3))
@@ -0,0 +1,132 @@
+import copy
+import pickle
+import unittest
+
+from uritools import urifingerprint, urisplit, urisplitcompact
+
+ATTRIBUTES = (
+    "scheme",
+    "authority",
+    "path",
+    "query",
+    "fragment",
+    "userinfo",
+    "host",
+    "port",
+)
+
+METHODS = (
+    "geturi",
+    "getscheme",
+    "getauthority",
+    "getuserinfo",
+    "gethost",
+    "getport",
+    "getpath",
+    "getquery",
+    "getquerydict",
+    "getquerylist",
+    "getfragment",
+    "isuri",
+    "isabsuri",
+    "isnetpath",
+    "isabspath",
+    "isrelpath",
+    "issamedoc",
+    "normalize",
+)
+
+
+class CompactTest(unittest.TestCase):
+    def check(self, uri):
+        for uristring, ref in ((uri, "../g?y"), (uri.encode(), b"../g?y")):
+            parts = urisplit(uristring)
+            compact = urisplitcompact(uristring)
+            self.assertEqual(tuple(compact), parts)
+            self.assertEqual(len(compact), len(parts))
+            for index in range(-len(parts), len(parts)):
+                self.assertEqual(compact[index], parts[index])
+            self.assertEqual(compact[1:3], parts[1:3])
+            self.assertEqual(compact, parts)
+            self.assertEqual(parts, compact)
+            self.assertEqual(hash(compact), hash(parts))
+            for name in ATTRIBUTES:
+                self.assertEqual(getattr(compact, name), getattr(parts, name), name)
+            for name in METHODS:
+                self.assertEqual(getattr(compact, name)(), getattr(parts, name)(), name)
+            self.assertEqual(list(compact.getqueryview()), list(parts.getqueryview()))
+            self.assertEqual(compact.split(), parts)
+            self.assertIsInstance(compact.split(), type(parts))
+            self.assertEqual(compact.transform(ref), parts.transform(ref))
+            self.assertEqual(urifingerprint(compact), urifingerprint(parts))
+
+    def test_rfc3986(self):
+        self.check("foo://user@example.com:8042/over/there?name=ferret#nose")
+        self.check("urn:example:animal:ferret:nose")
+        self.check("http://a/b/c/d;p?q")
+        self.check("http://a/b/c/./../g")
+        self.check("../g")
+        self.check("//g")
+        self.check("?y#s")
+
+    def test_components(self):
+        self.check("")
+        self.check(":")
+        self.check("s:")
+        self.check("//")
+        self.check("?")
+        self.check("#")
+        self.check("s://?#")
+        self.check("s://u@h:1/p?q#f")
+        self.check("//[::1]:8080")
+        self.check("HTTP://Example.COM:80")
+        self.check("p?q=1&q=2&r")
+
+    def test_lengths(self):
+        for n in (1, 2, 3, 4, 255, 256, 65535, 65536):
+            self.check("s://a/" + "p" * n)
+            self.check("s:" + "p" * n + "#" + "f" * n)
+
+    def test_geturi(self):
+        uristring = "HTTP://Example.COM/a/../b"
+        self.assertIs(urisplitcompact(uristring).geturi(), uristring)
+
+    def test_fragment_newline(self):
+        # the fragment pattern stops at line breaks
+        self.check("s:p#f\nx")
+        self.assertEqual(urisplitcompact("s:p#f\nx").geturi(), "s:p#f")
+
+    def test_normalize(self):
+        compact = urisplitcompact("http://example.com/")
+        self.assertIs(compact.normalize(), compact)
+        compact = urisplitcompact("HTTP://example.com:80")
+        self.assertEqual(compact.normalize().geturi(), "http://example.com/")
+
+    def test_equality(self):
+        self.assertEqual(urisplitcompact("s:p"), urisplitcompact("s:p"))
+        self.assertNotEqual(urisplitcompact("s:p"), urisplitcompact("s:q"))
+        self.assertNotEqual(urisplitcompact("s:p"), urisplitcompact(b"s:p"))
+        self.assertNotEqual(urisplitcompact("s:p"), "s:p")
+
+    def test_copy(self):
+        compact = urisplitcompact("s://h/p?q#f")
+        self.assertEqual(copy.copy(compact), compact)
+        self.assertEqual(copy.deepcopy(compact), compact)
+        self.assertEqual(pickle.loads(pickle.dumps(compact)), compact)
+
+    def test_attributes(self):
+        for uri in ["s://h/p?q#f", b"s://h/p?q#f"]:
+            compact = urisplitcompact(uri)
+            with self.assertRaises(IndexError):
+                compact[5]
+            # namedtuple methods are not supported
+            for name in ("_replace", "_asdict", "_fields", "count", "index", "hots"):
+                with self.assertRaisesRegex(AttributeError, "CompactSplitResult"):
+                    getattr(compact, name)
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(urisplitcompact("s:p#f")),
+            "CompactSplitResult(scheme='s', authority=None, path='p',"
+            " query=None, fragment='f')",
+        )
@@ -1,7 +1,7 @@
 import ipaddress
 import unittest
 
-from uritools import uricompose
+from uritools import URIComposer, uricompose
 
 
 class ComposeTest(unittest.TestCase):
@@ -10,6 +10,19 @@ class ComposeTest(unittest.TestCase):
         self.assertEqual(
             uri, result, msg="%r != %r (kwargs=%r)" % (uri, result, kwargs)
         )
+        # URIComposer with fixed components
+        query = kwargs.pop("query", None)
+        fragment = kwargs.pop("fragment", None)
+        result = URIComposer(**kwargs).compose(query=query, fragment=fragment)
+        self.assertEqual(
+            uri, result, msg="%r != %r (kwargs=%r)" % (uri, result, kwargs)
+        )
+        # URIComposer with path suffix
+        path = kwargs.pop("path", "")
+        result = URIComposer(**kwargs).compose(path, query, fragment)
+        self.assertEqual(
+            uri, result, msg="%r != %r (kwargs=%r)" % (uri, result, kwargs)
+        )
 
     def test_rfc3986(self):
         """uricompose test cases from [RFC3986] 3. Syntax Components"""
@@ -120,7 +133,7 @@ class ComposeTest(unittest.TestCase):
             with self.assertRaises(TypeError, msg="host=%r" % host):
                 uricompose(host=host)  # type: ignore
         # invalid host ip-literal
-        for host in ("[foo]", "[v1.x]"):
+        for host in ("[foo]", "[v1.x]", "[V1.x]"):
             with self.assertRaises(ValueError, msg="host=%r" % host):
                 uricompose(authority=[None, host, None])
             with self.assertRaises(ValueError, msg="host=%r" % host):
@@ -236,3 +249,60 @@ class ComposeTest(unittest.TestCase):
         ]
         for sep, uri, query in cases:
             self.check(uri, query=query, querysep=sep)
+
+    def test_composer(self):
+        composer = URIComposer(scheme="HTTP", host="Example.com", path="/a b/")
+        cases = [
+            ("http://example.com/a%20b/", "", None, None),
+            ("http://example.com/a%20b/c", "c", None, None),
+            ("http://example.com/a%20b/c?x=1", "c", {"x": 1}, None),
+            ("http://example.com/a%20b/c%3Fd?x#y", "c?d", "x", "y"),
+            ("http://example.com/a%20b/?#", b"", b"", b""),
+        ]
+        for uri, path, query, fragment in cases:
+            self.assertEqual(uri, composer.compose(path, query, fragment))
+        composer = URIComposer(path="this")
+        self.assertEqual("./this:that", composer.compose(":that"))
+        with self.assertRaises(ValueError):
+            URIComposer(host="example.com").compose("foo")
+        with self.assertRaises(ValueError):
+            URIComposer(path="/").compose("/foo")
+        with self.assertRaises(ValueError):
+            URIComposer(scheme="foo:")
+        with self.assertRaises(TypeError):
+            URIComposer().compose(query=0)  # type: ignore
+
+    def test_normalize(self):
+        cases = [
+            ("http://example.com/", {"scheme": "http", "host": "example.com"}),
+            (
+                "http://example.com/",
+                {"scheme": "HTTP", "host": "example.com", "port": 80},
+            ),
+            (
+                "https://example.com/?q",
+                {"scheme": "https", "authority": "example.com:443", "query": "q"},
+            ),
+            (
+                "http://example.com:443/",
+                {"scheme": "http", "host": "example.com", "port": 443},
+            ),
+            (
+                "foo://example.com:80",
+                {"scheme": "foo", "host": "example.com", "port": 80},
+            ),
+            ("//example.com:80", {"host": "example.com", "port": 80}),
+        ]
+        for uri, kwargs in cases:
+            self.assertEqual(uri, uricompose(normalize=True, **kwargs))
+            query = kwargs.pop("query", None)
+            composer = URIComposer(normalize=True, **kwargs)
+            self.assertEqual(uri, composer.compose(query=query))
+        self.assertEqual(
+            "http://example.com:80",
+            uricompose(scheme="http", host="example.com", port=80),
+        )
+        composer = URIComposer(
+            scheme="http", host="example.com", port=80, normalize=True
+        )
+        self.assertEqual("http://example.com/a", composer.compose("/a"))
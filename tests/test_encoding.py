@@ -1,6 +1,13 @@
 import unittest
 
-from uritools import RESERVED, UNRESERVED, uridecode, uriencode
+from uritools import (
+    RESERVED,
+    UNRESERVED,
+    IncrementalURIDecoder,
+    PercentEncoder,
+    uridecode,
+    uriencode,
+)
 
 
 class EncodingTest(unittest.TestCase):
@@ -76,3 +83,101 @@ class EncodingTest(unittest.TestCase):
         ]
         for exception, string, safe, encoding in cases:
             self.assertRaises(exception, uriencode, string, safe, encoding)
+
+    def test_percent_encoder(self):
+        cases = [
+            ("", b"", ""),
+            (" ", b"%20", ""),
+            (" ", b" ", " "),
+            ("%", b"%25", ""),
+            ("%20", b"%2520", ""),
+            ("%20", b"%20", b"%"),
+            ("a b/c?d", b"a%20b/c%3Fd", "/"),
+            ("\xf6lk\xfcrbis", b"%C3%B6lk%C3%BCrbis", ""),
+            (RESERVED, RESERVED.encode("ascii"), RESERVED),
+        ]
+        for decoded, encoded, safe in cases:
+            encoder = PercentEncoder(safe)
+            self.assertEqual(encoder.encode(decoded), encoded)
+            self.assertEqual(encoder.encode(decoded.encode()), encoded)
+            self.assertEqual(uriencode(decoded, safe), encoded)
+
+    def test_percent_encoder_safe(self):
+        encoder = PercentEncoder("/")
+        self.assertEqual(encoder.safe, bytes(sorted(UNRESERVED.encode() + b"/")))
+        self.assertEqual(PercentEncoder(b"/").safe, encoder.safe)
+        self.assertRaises(UnicodeError, PercentEncoder, "\xff")
+
+    def test_percent_encoder_all(self):
+        encoder = PercentEncoder()
+        uristring = bytes(range(256))
+        expected = b"".join(
+            bytes([i]) if chr(i) in UNRESERVED else b"%%%02X" % i for i in range(256)
+        )
+        self.assertEqual(encoder.encode(uristring), expected)
+        self.assertEqual(encoder.encode(uristring * 2), expected * 2)
+        # few distinct characters, many replacements
+        self.assertEqual(encoder.encode(b"% +" * 100), b"%25%20%2B" * 100)
+
+    def test_decode_unchanged(self):
+        cases = [
+            ("", ""),
+            ("foo", "foo"),
+            (b"foo", "foo"),
+            ("\xf6lk\xfcrbis", "\xf6lk\xfcrbis"),
+            ("%", "%"),
+            ("%2", "%2"),
+            ("%%41", "%A"),
+            ("%x41", "%x41"),
+        ]
+        for uristring, expected in cases:
+            self.assertEqual(uridecode(uristring), expected)
+            self.assertEqual(uridecode(uristring, "latin-1"), expected)
+        self.assertEqual(uridecode("foo", encoding=None), b"foo")
+        self.assertEqual(uridecode(b"foo", encoding=None), b"foo")
+
+    def test_incremental_decoder(self):
+        cases = [
+            "",
+            "foo",
+            "%F6lk%FCrbis",
+            "%C3%B6lk%C3%BCrbis",
+            "%%41%4%%2x%",
+            "\xf6lk\xfcrbis%20%C3%B6lk%C3%BCrbis",
+        ]
+        for uristring in cases:
+            for encoding in ["utf-8", "latin-1", None]:
+                expected = uridecode(uristring, encoding, "replace")
+                encoded = uristring.encode(encoding or "ascii", "replace")
+                for size in range(1, len(uristring) + 2):
+                    for s in [uristring, encoded]:
+                        decoder = IncrementalURIDecoder(encoding, "replace")
+                        result = [
+                            decoder.decode(s[i : i + size])
+                            for i in range(0, len(s), size)
+                        ]
+                        result.append(decoder.decode(b"", final=True))
+                        self.assertEqual(expected[:0].join(result), expected)
+
+    def test_incremental_decoder_errors(self):
+        decoder = IncrementalURIDecoder()
+        self.assertEqual(decoder.decode("%C3"), "")
+        self.assertRaises(UnicodeError, decoder.decode, "", final=True)
+        decoder.reset()
+        self.assertEqual(decoder.decode("%C3%B6", final=True), "\xf6")
+
+    def test_incremental_decoder_state(self):
+        decoder = IncrementalURIDecoder()
+        self.assertEqual(decoder.decode("a%C3%B"), "a")
+        state = decoder.getstate()
+        self.assertEqual(decoder.decode("6", final=True), "\xf6")
+        decoder.setstate(state)
+        self.assertEqual(decoder.decode("6", final=True), "\xf6")
+        decoder = IncrementalURIDecoder(encoding=None)
+        self.assertEqual(decoder.decode("a%4"), b"a")
+        state = decoder.getstate()
+        self.assertEqual(decoder.decode("1"), b"A")
+        decoder.setstate(state)
+        self.assertEqual(decoder.decode("1"), b"A")
+        decoder.reset()
+        self.assertEqual(decoder.getstate(), (b"", 0))
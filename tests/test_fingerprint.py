@@ -0,0 +1,56 @@
+import unittest
+
+from uritools import URISet, urifingerprint, urisplit
+
+
+class FingerprintTest(unittest.TestCase):
+    def test_fingerprint(self):
+        # fingerprints must be stable across processes and versions
+        self.assertEqual(urifingerprint("http://a/"), 0xAA70DD21F09B4F82)
+        for uri in ["http://a/", "HTTP://A", "http://a:80/", "http://a/b/../"]:
+            self.assertEqual(urifingerprint(uri), 0xAA70DD21F09B4F82)
+            self.assertEqual(urifingerprint(uri.encode()), 0xAA70DD21F09B4F82)
+            self.assertEqual(urifingerprint(urisplit(uri)), 0xAA70DD21F09B4F82)
+            self.assertEqual(urifingerprint(urisplit(uri.encode())), 0xAA70DD21F09B4F82)
+        self.assertNotEqual(urifingerprint("http://a/b"), urifingerprint("http://a/"))
+        self.assertNotEqual(urifingerprint("http://a/?"), urifingerprint("http://a/"))
+        self.assertEqual(urifingerprint("/%C3%A4"), urifingerprint(b"/%C3%A4"))
+        self.assertEqual(urifingerprint("/ä"), urifingerprint("/ä".encode()))
+        self.assertEqual(urifingerprint("http://ÉX/"), urifingerprint("http://Éx/"))
+        self.assertEqual(
+            urifingerprint("http://ÉX/"), urifingerprint("http://ÉX/".encode())
+        )
+        self.assertNotEqual(urifingerprint("http://ÉX/"), urifingerprint("http://éx/"))
+        for uri in ["", "foo", "http://a/"]:
+            self.assertGreaterEqual(urifingerprint(uri), 0)
+            self.assertLess(urifingerprint(uri), 2**64)
+
+
+class URISetTest(unittest.TestCase):
+    def test_set(self):
+        uris = URISet()
+        self.assertEqual(len(uris), 0)
+        self.assertNotIn("http://a/", uris)
+        uris.add("http://a/")
+        self.assertEqual(len(uris), 1)
+        self.assertIn("http://a/", uris)
+        self.assertIn("HTTP://A:80", uris)
+        self.assertIn(b"http://a/", uris)
+        self.assertIn(urisplit("http://a/"), uris)
+        self.assertNotIn("http://b/", uris)
+        uris.add(b"HTTP://A")
+        uris.add(urisplit("http://a/"))
+        self.assertEqual(len(uris), 1)
+
+    def test_update(self):
+        urilist = ["http://example.com/%d" % i for i in range(1000)]
+        uris = URISet(urilist[:500])
+        self.assertEqual(len(uris), 500)
+        uris.update(iter(urilist))
+        self.assertEqual(len(uris), 1000)
+        uris.update(uri.upper() for uri in urilist)
+        self.assertEqual(len(uris), 1000)
+        for uri in urilist:
+            self.assertIn(uri, uris)
+        for i in range(1000, 2000):
+            self.assertNotIn("http://example.com/%d" % i, uris)
@@ -0,0 +1,79 @@
+import ipaddress
+import unittest
+
+from uritools import InternCache, SplitCache, urisplit
+
+
+class InternTest(unittest.TestCase):
+    def test_intern(self):
+        intern = InternCache(maxsize=2)
+        self.assertEqual(intern.maxsize, 2)
+        # str(n) creates a new object for each call
+        a = intern(str(12345))
+        self.assertIsNot(str(12345), a)
+        self.assertIs(intern(str(12345)), a)
+        self.assertIsNone(intern(None))
+        # str and bytes are never equal
+        self.assertIsInstance(intern(b"12345"), bytes)
+        self.assertEqual(intern.cache_info().currsize, 2)
+        # least recently used entry gets evicted
+        intern("c")
+        self.assertIsNot(intern(str(12345)), a)
+        intern.cache_clear()
+        self.assertEqual(intern.cache_info().currsize, 0)
+
+    def test_unbounded(self):
+        intern = InternCache(maxsize=None)
+        self.assertIsNone(intern.maxsize)
+        values = [intern(str(i)) for i in range(10000)]
+        for i, value in enumerate(values):
+            self.assertIs(intern(str(i)), value)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            InternCache(maxsize=-1)
+
+    def test_urisplit(self):
+        intern = InternCache()
+        for uris in [
+            ["http://example.com/%d" % i for i in range(3)],
+            [b"http://example.com/%d" % i for i in range(3)],
+        ]:
+            results = [urisplit(uri, intern=intern) for uri in uris]
+            for uri, parts in zip(uris, results):
+                self.assertEqual(parts, urisplit(uri))
+                self.assertIs(type(parts), type(urisplit(uri)))
+                self.assertIs(parts.scheme, results[0].scheme)
+                self.assertIs(parts.authority, results[0].authority)
+            self.assertIsNone(urisplit(uris[0][5:], intern=intern).scheme)
+            self.assertIsNone(urisplit(uris[0][7:], intern=intern).authority)
+
+    def test_split_cache(self):
+        intern = InternCache()
+        cache = SplitCache(intern=intern)
+        a = urisplit("http://example.com/a", cache=cache)
+        b = urisplit("http://example.com/b", cache=cache)
+        self.assertIs(a.authority, b.authority)
+        self.assertIs(b, cache("http://example.com/b"))
+        with self.assertRaises(ValueError):
+            urisplit("http://example.com/", cache=cache, intern=intern)
+
+    def test_getscheme(self):
+        intern = InternCache()
+        a = urisplit("HTTP://example.com/").getscheme(intern=intern)
+        b = urisplit(b"http://example.com/").getscheme(intern=intern)
+        self.assertEqual(a, "http")
+        self.assertIs(a, b)
+        self.assertEqual(urisplit("/").getscheme("x", intern), "x")
+
+    def test_gethost(self):
+        intern = InternCache()
+        a = urisplit("http://Example.COM/").gethost(intern=intern)
+        b = urisplit("http://example.com:80/").gethost(intern=intern)
+        self.assertEqual(a, "example.com")
+        self.assertIs(a, b)
+        self.assertEqual(
+            urisplit("http://[::1]/").gethost(intern=intern),
+            ipaddress.IPv6Address("::1"),
+        )
+        self.assertIsNone(urisplit("/").gethost(intern=intern))
@@ -1,6 +1,6 @@
 import unittest
 
-from uritools import urijoin
+from uritools import urijoin, urijoinall
 
 
 class JoinTest(unittest.TestCase):
@@ -16,6 +16,14 @@ class JoinTest(unittest.TestCase):
         self.assertEqual(
             expected.encode(), urijoin(base.encode(), ref.encode(), strict)
         )
+        # single reference joined with urijoinall()
+        self.assertEqual([expected], list(urijoinall(base, [ref], strict)))
+        self.assertEqual([expected], list(urijoinall(base.encode(), [ref], strict)))
+        self.assertEqual([expected], list(urijoinall(base, [ref.encode()], strict)))
+        self.assertEqual(
+            [expected.encode()],
+            list(urijoinall(base.encode(), [ref.encode()], strict)),
+        )
 
     def test_rfc3986_normal(self):
         """urijoin test cases from RFC 3986 5.4.1. Normal Examples"""
@@ -97,3 +105,21 @@ class JoinTest(unittest.TestCase):
 
     def test_path_traversal_limits(self):
         self.assertEqual(urijoin("http://a/", "../" * 100), "http://a/")
+
+    def test_joinall(self):
+        refs = ["g", b"g", "../g", b"//g", "", b"#s"]
+        expected = [
+            "http://a/b/c/g",
+            "http://a/b/c/g",
+            "http://a/b/g",
+            "http://g",
+            "http://a/b/c/d;p?q",
+            "http://a/b/c/d;p?q#s",
+        ]
+        self.assertEqual(list(urijoinall(self.RFC3986_BASE, refs)), expected)
+        self.assertEqual(
+            list(urijoinall(self.RFC3986_BASE.encode(), refs)),
+            [s.encode() if isinstance(r, bytes) else s for r, s in zip(refs, expected)],
+        )
+        self.assertEqual(list(urijoinall(self.RFC3986_BASE, [])), [])
+        self.assertEqual(list(urijoinall(self.RFC3986_BASE, iter(refs))), expected)
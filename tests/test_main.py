@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+
+from uritools import urifingerprint
+from uritools.__main__ import main
+
+INPUT = b"HTTP://A:80/b/../c?q#f\r\n//x\n\n/p"
+
+
+class MainTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.tmpdir.name, "input")
+        self.output = os.path.join(self.tmpdir.name, "output")
+        with open(self.input, "wb") as f:
+            f.write(INPUT)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def check(self, args, expected):
+        self.assertEqual(0, main(args + [self.input, "-o", self.output]))
+        with open(self.output, "rb") as f:
+            self.assertEqual(expected, f.read())
+
+    def test_split(self):
+        self.check(
+            ["split"],
+            b"HTTP\tA:80\t/b/../c\tq\tf\n\tx\t\t\t\n\t\t\t\t\n\t\t/p\t\t\n",
+        )
+        self.check(
+            ["split", "-f", "jsonl"],
+            b'{"scheme":"HTTP","authority":"A:80","path":"/b/../c",'
+            b'"query":"q","fragment":"f"}\n'
+            b'{"scheme":null,"authority":"x","path":"","query":null,'
+            b'"fragment":null}\n'
+            b'{"scheme":null,"authority":null,"path":"","query":null,'
+            b'"fragment":null}\n'
+            b'{"scheme":null,"authority":null,"path":"/p","query":null,'
+            b'"fragment":null}\n',
+        )
+
+    def test_join(self):
+        expected = b"HTTP://A:80/c?q#f\nhttp://x\nhttp://a/b/c\nhttp://a/p\n"
+        self.check(["join", "--base", "http://a/b/c"], expected)
+        with self.assertRaises(SystemExit):
+            main(["join", self.input, "-o", self.output])
+
+    def test_normalize(self):
+        expected = b"http://a/c?q#f\n//x\n\n/p\n"
+        self.check(["normalize"], expected)
+        self.check(["normalize", "--chunk-size", "1"], expected)
+        self.check(["normalize", "--chunk-size", "3"], expected)
+
+    def test_defrag(self):
+        self.check(
+            ["defrag", "-f", "jsonl"],
+            b'{"uri":"HTTP://A:80/b/../c?q","fragment":"f"}\n'
+            b'{"uri":"//x","fragment":null}\n'
+            b'{"uri":"","fragment":null}\n'
+            b'{"uri":"/p","fragment":null}\n',
+        )
+
+    def test_classify(self):
+        self.check(
+            ["classify"],
+            b"1\t0\t0\t0\t0\t0\n0\t0\t1\t0\t0\t0\n0\t0\t0\t0\t1\t1\n0\t0\t0\t1\t0\t0\n",
+        )
+        self.check(
+            ["classify", "-f", "jsonl"],
+            b'{"isuri":true,"isabsuri":false,"isnetpath":false,'
+            b'"isabspath":false,"isrelpath":false,"issamedoc":false}\n'
+            b'{"isuri":false,"isabsuri":false,"isnetpath":true,'
+            b'"isabspath":false,"isrelpath":false,"issamedoc":false}\n'
+            b'{"isuri":false,"isabsuri":false,"isnetpath":false,'
+            b'"isabspath":false,"isrelpath":true,"issamedoc":true}\n'
+            b'{"isuri":false,"isabsuri":false,"isnetpath":false,'
+            b'"isabspath":true,"isrelpath":false,"issamedoc":false}\n',
+        )
+
+    def test_fingerprint(self):
+        lines = INPUT.replace(b"\r", b"").split(b"\n")
+        expected = b"".join(b"%016x\n" % urifingerprint(line) for line in lines)
+        self.check(["fingerprint"], expected)
+        expected = b"".join(
+            b'{"fingerprint":"%016x"}\n' % urifingerprint(line) for line in lines
+        )
+        self.check(["fingerprint", "-f", "jsonl"], expected)
+
+    def test_jobs(self):
+        for args in (["-j", "2"], ["-j", "2", "-u"]):
+            self.assertEqual(
+                0,
+                main(
+                    ["normalize", "--chunk-size", "3", self.input, "-o", self.output]
+                    + args
+                ),
+            )
+            with open(self.output, "rb") as f:
+                result = f.read()
+            self.assertEqual(
+                sorted(result.splitlines()),
+                sorted(b"http://a/c?q#f\n//x\n\n/p\n".splitlines()),
+            )
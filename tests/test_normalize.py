@@ -0,0 +1,140 @@
+import unittest
+
+from uritools import (
+    SchemeNormalizer,
+    registerscheme,
+    urifingerprint,
+    urinormalize,
+    urinormalizeall,
+    urisplit,
+)
+
+
+class NormalizeTest(unittest.TestCase):
+    def check(self, uri, expected):
+        self.assertEqual(expected, urinormalize(uri))
+        self.assertEqual(expected.encode(), urinormalize(uri.encode()))
+        self.assertEqual([expected], list(urinormalizeall([uri])))
+        self.assertEqual(expected, urinormalize(expected))
+        if uri == expected:
+            self.assertIs(uri, urinormalize(uri))
+
+    def test_rfc3986(self):
+        """urinormalize test cases from RFC 3986 6.2.2"""
+        self.check("example://a/b/c/%7Bfoo%7D", "example://a/b/c/%7Bfoo%7D")
+        self.check("eXAMPLE://a/./b/../b/%63/%7bfoo%7d", "example://a/b/c/%7Bfoo%7D")
+        self.check("HTTP://www.EXAMPLE.com/", "http://www.example.com/")
+        self.check("http://example.com/%7Esmith/", "http://example.com/~smith/")
+
+    def test_case(self):
+        self.check("http://example.com/", "http://example.com/")
+        self.check(
+            "HtTp://ExAmPlE.CoM/PaTh?QuErY#FrAgMeNt",
+            "http://example.com/PaTh?QuErY#FrAgMeNt",
+        )
+        self.check("http://User:PW@EXAMPLE.COM/", "http://User:PW@example.com/")
+        self.check("http://[::A:B]:8080/", "http://[::a:b]:8080/")
+        self.check("http://%c3%a4.COM/", "http://%C3%A4.com/")
+        self.check("foo:%aa%Ab%aB", "foo:%AA%AB%AB")
+        # only ASCII letters are case-insensitive
+        self.check("http://ÉX.COM/", "http://Éx.com/")
+
+    def test_unreserved(self):
+        self.check("/%41%5A%61%7A%30%39%2D%2E%5F%7E", "/AZaz09-._~")
+        self.check("/%2F%3A%40%20%25", "/%2F%3A%40%20%25")
+        self.check("?%41%3D%26#%41%23", "?A%3D%26#A%23")
+        self.check("//%41%40@%41:%38%30/", "//A%40@a:80/")
+        # decoding must not form a scheme or new percent-encodings
+        self.check("%41:b", "./A:b")
+        self.check("%%34%31%41", "%2541A")
+        self.check("%", "%")
+        self.check("100%", "100%")
+
+    def test_dot_segments(self):
+        self.check("http://a/b/c/./../../g", "http://a/g")
+        self.check("http://a/b/c/%2E%2E/g", "http://a/b/g")
+        self.check("/a/b/../c", "/a/c")
+        self.check("//a/b/../c", "//a/c")
+        self.check("foo:a/./b", "foo:a/b")
+        self.check("a/../b", "a/../b")
+        self.check("../a", "../a")
+        self.check("/..//a", "/.//a")
+        self.check("/.//", "/.//")
+        self.check("/.//a/./b", "/.//a/b")
+
+    def test_port(self):
+        self.check("http://example.com:/", "http://example.com/")
+        self.check("http://example.com:8080/", "http://example.com:8080/")
+        self.check("http://[::1]:/", "http://[::1]/")
+        self.check("foo://a@example.com:", "foo://a@example.com")
+        self.check("//::", "//::")
+
+    def test_scheme(self):
+        self.check("http://example.com", "http://example.com/")
+        self.check("http://example.com:80", "http://example.com/")
+        self.check("HTTP://example.com:080/", "http://example.com/")
+        self.check("http://example.com:443/", "http://example.com:443/")
+        self.check("https://example.com:443?q", "https://example.com/?q")
+        self.check("https://example.com:80#f", "https://example.com:80/#f")
+        self.check("ws://example.com:80", "ws://example.com/")
+        self.check("wss://example.com:443", "wss://example.com/")
+        self.check("ftp://example.com:21", "ftp://example.com")
+        self.check("foo://example.com:80", "foo://example.com:80")
+        self.check("http:", "http:")
+        self.check("http:foo", "http:foo")
+
+    def test_idempotent(self):
+        # removing a default port must not change how the authority is split
+        self.check("HTTP://A:80:80", "http://a:80:80/")
+        self.check("http://http::80", "http://http::80/")
+        self.check("http://u@a:80@b:80", "http://u@a:80@b/")
+        for uri in [
+            "HTTP://A:80:80",
+            "http://http::80",
+            "http://a::80",
+            "http://:80",
+            "http://[::1]:80",
+            "http://u:80@a:80",
+            "http://%41:80",
+        ]:
+            with self.subTest(uri=uri):
+                normalized = urinormalize(uri)
+                self.assertEqual(urinormalize(normalized), normalized)
+                self.assertEqual(urifingerprint(uri), urifingerprint(normalized))
+
+    def test_registerscheme(self):
+        normalizer = SchemeNormalizer(port=8042, path="/")
+        self.assertEqual(normalizer.port, 8042)
+        self.assertEqual(normalizer.path, "/")
+        registerscheme("FOO", normalizer)
+        try:
+            self.check("foo://example.com:8042", "foo://example.com/")
+            self.check("Foo://example.com:80", "foo://example.com:80/")
+        finally:
+            registerscheme("foo", None)
+        self.check("foo://example.com:8042", "foo://example.com:8042")
+        registerscheme(b"bar", lambda parts: parts._replace(query=parts.path))
+        try:
+            self.check("bar:/x", "bar:/x?/x")
+        finally:
+            registerscheme("bar", None)
+        with self.assertRaises(ValueError):
+            registerscheme("1", normalizer)
+
+    def test_splitresult(self):
+        for uri, expected in [
+            ("HTTP://Example.COM:80", "http://example.com/"),
+            (b"HTTP://Example.COM:80", b"http://example.com/"),
+            ("foo://a/b/../c", "foo://a/c"),
+        ]:
+            parts = urisplit(uri)
+            self.assertEqual(parts.normalize(), urisplit(expected))
+            parts = urisplit(expected)
+            self.assertIs(parts.normalize(), parts)
+
+    def test_normalizeall(self):
+        uris = ["HTTP://A/", b"HTTP://A/", "http://a/b/../c", b""]
+        expected = ["http://a/", b"http://a/", "http://a/c", b""]
+        self.assertEqual(list(urinormalizeall(uris)), expected)
+        self.assertEqual(list(urinormalizeall(iter(uris))), expected)
+        self.assertEqual(list(urinormalizeall([])), [])
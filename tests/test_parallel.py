@@ -0,0 +1,117 @@
+import unittest
+
+from uritools import parallel, uricompose, urijoin, urinormalize, urisplit
+
+URIS = [
+    "foo://user@example.com:8042/over/there?name=ferret#nose",
+    "urn:example:animal:ferret:nose",
+    "http://a/b/c/./../d;p?q",
+    "HTTP://Example.COM:80",
+    "../g",
+    "//g",
+    "?y#s",
+    "",
+] * 5
+
+BASE = "http://a/b/c/d;p?q"
+
+
+class ParallelTest(unittest.TestCase):
+    executor = "process"
+
+    def run_parallel(self, func, *args, **kwargs):
+        kwargs.update(chunksize=3, workers=2, executor=self.executor)
+        results = func(*args, **kwargs)
+        self.assertEqual(results.executor, self.executor)
+        self.assertEqual(results.workers, 2)
+        with results:
+            return list(results)
+
+    def check_split(self, uris):
+        results = self.run_parallel(parallel.split, uris)
+        self.assertEqual(results, [urisplit(uri) for uri in uris])
+        for result, uri in zip(results, uris):
+            self.assertIs(type(result), type(urisplit(uri)))
+
+    def check_normalize(self, uris):
+        results = self.run_parallel(parallel.normalize, uris)
+        self.assertEqual(results, [urinormalize(uri) for uri in uris])
+
+    def test_split(self):
+        self.check_split(URIS)
+        self.check_split([uri.encode() for uri in URIS])
+
+    def test_join(self):
+        for base, uris in ((BASE, URIS), (BASE.encode(), [u.encode() for u in URIS])):
+            results = self.run_parallel(parallel.join, base, uris)
+            self.assertEqual(results, [urijoin(base, uri) for uri in uris])
+            results = self.run_parallel(parallel.join, base, uris, True)
+            self.assertEqual(results, [urijoin(base, uri, True) for uri in uris])
+
+    def test_normalize(self):
+        self.check_normalize(URIS)
+        self.check_normalize([uri.encode() for uri in URIS])
+
+    def test_compose(self):
+        items = [
+            {"scheme": "http", "host": "example.com", "path": "/%d" % i}
+            for i in range(10)
+        ]
+        expected = [uricompose("http", "example.com", "/%d" % i) for i in range(10)]
+        results = self.run_parallel(parallel.compose, items)
+        self.assertEqual(results, expected)
+        items = [{"path": "a b", "query": {"q": "\n"}}]
+        results = self.run_parallel(parallel.compose, items)
+        self.assertEqual(results, ["a%20b?q=%0A"])
+
+    def test_unordered(self):
+        results = self.run_parallel(parallel.normalize, URIS, ordered=False)
+        self.assertCountEqual(results, [urinormalize(uri) for uri in URIS])
+
+    def test_empty(self):
+        self.assertEqual(self.run_parallel(parallel.split, []), [])
+        self.assertEqual(self.run_parallel(parallel.split, [""]), [urisplit("")])
+
+    def test_close(self):
+        results = parallel.split(iter(URIS), 1, 1, executor=self.executor)  # type: ignore
+        self.assertEqual(next(results), urisplit(URIS[0]))
+        results.close()
+        with self.assertRaises(StopIteration):
+            next(results)
+
+
+class ThreadParallelTest(ParallelTest):
+    executor = "thread"
+
+
+class ParallelErrorTest(unittest.TestCase):
+    def test_line_breaks(self):
+        refs = ["a", "b\nc", "d\r\n"]
+        for executor in ("process", "thread"):
+            with self.subTest(executor=executor):
+                results = parallel.split(refs, chunksize=2, executor=executor)
+                self.assertEqual(list(results), [urisplit(ref) for ref in refs])
+                results = parallel.split(
+                    [ref.encode() for ref in refs], chunksize=2, executor=executor
+                )
+                self.assertEqual(
+                    list(results), [urisplit(ref.encode()) for ref in refs]
+                )
+                results = parallel.normalize(refs, chunksize=2, executor=executor)
+                self.assertEqual(list(results), [urinormalize(ref) for ref in refs])
+                results = parallel.join("http://a/b\n/", ["c", "d"], executor=executor)
+                self.assertEqual(list(results), ["http://a/b\n/c", "http://a/b\n/d"])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            parallel.split(URIS, chunksize=0)
+        with self.assertRaises(ValueError):
+            parallel.split(URIS, workers=0)
+        with self.assertRaises(ValueError):
+            parallel.split(URIS, executor="fork")  # type: ignore
+
+    def test_default(self):
+        with parallel.split(URIS) as results:
+            self.assertIn(results.executor, ("process", "thread"))
+            self.assertGreaterEqual(results.workers, 1)
+            self.assertEqual(list(results), [urisplit(uri) for uri in URIS])
@@ -0,0 +1,70 @@
+import mmap
+import tempfile
+import unittest
+
+from uritools import uriscan, urisplit
+
+LOG = (
+    b'192.0.2.1 - - [10/Oct/2000:13:55:36 -0700] "GET http://Example.com/a?b=1#f '
+    b'HTTP/1.0" 200 2326 "https://example.org/start.html" "Mozilla/4.08"\n'
+    b"<mailto:user@example.com> urn:isbn:0451450523 x-http://a.b/c\n"
+)
+
+
+class ScanTest(unittest.TestCase):
+    def check(self, buffer, expected, schemes=None):
+        result = list(uriscan(buffer, schemes))
+        self.assertEqual([bytes(buffer[s:e]) for s, e in result], expected)
+        result = list(uriscan(buffer, schemes, split=True))
+        self.assertEqual([bytes(buffer[s:e]) for s, e, _ in result], expected)
+        self.assertEqual([p for _, _, p in result], [urisplit(u) for u in expected])
+
+    def test_scan(self):
+        expected = [
+            b"http://Example.com/a?b=1#f",
+            b"https://example.org/start.html",
+            b"mailto:user@example.com",
+            b"urn:isbn:0451450523",
+            b"x-http://a.b/c",
+        ]
+        self.check(LOG, expected)
+        self.check(bytearray(LOG), expected)
+        self.check(memoryview(LOG), expected)
+
+    def test_schemes(self):
+        expected = [
+            b"http://Example.com/a?b=1#f",
+            b"https://example.org/start.html",
+        ]
+        self.check(LOG, expected, ["http", "HTTPS"])
+        self.check(LOG, expected, [b"https", b"http"])
+        self.check(LOG, expected[1:], ["https"])
+        self.check(LOG, [b"mailto:user@example.com"], {"mailto"})
+        self.check(LOG, [], ["ftp"])
+        with self.assertRaises(ValueError):
+            list(uriscan(LOG, []))
+        with self.assertRaises(ValueError):
+            list(uriscan(LOG, ["1http"]))
+
+    def test_delimiters(self):
+        self.check(b"", [])
+        self.check(b"http:", [])
+        self.check(b"http:/", [b"http:/"])
+        self.check(b"Note: see bot:a, not bot: or (bot:)", [b"bot:a,", b"bot:)"])
+        self.check(b'"http://a/b c"', [b"http://a/b"])
+        self.check(b"<http://a/b>", [b"http://a/b"])
+        self.check(b"http://a/b\thttp://c/d\n", [b"http://a/b", b"http://c/d"])
+        self.check(b"http://[::1]:80/[x]", [b"http://[::1]:80/"])
+        self.check(b"http://a/\xc3\xa4", [b"http://a/"])
+        self.check(b"ahttp://a/ +http://b/", [b"ahttp://a/"])
+
+    def test_mmap(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(LOG * 100)
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                result = list(uriscan(m, ["http"], split=True))
+                self.assertEqual(len(result), 100)
+                for start, end, parts in result:
+                    self.assertEqual(m[start:end], b"http://Example.com/a?b=1#f")
+                    self.assertEqual(parts.gethost(), "example.com")
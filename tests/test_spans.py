@@ -0,0 +1,91 @@
+import unittest
+
+from uritools import urisplit, urisplitspans
+
+NAMES = (
+    "scheme",
+    "authority",
+    "path",
+    "query",
+    "fragment",
+    "userinfo",
+    "host",
+    "port",
+)
+
+
+class SpansTest(unittest.TestCase):
+    def check(self, uri):
+        for uristring in (uri, uri.encode()):
+            parts = urisplit(uristring)
+            spans = urisplitspans(uristring)
+            self.assertIs(spans.uristring, uristring)
+            for name in NAMES:
+                span = getattr(spans, name)
+                value = getattr(parts, name)
+                self.assertEqual(spans.get(name), value)
+                if value is None:
+                    self.assertIsNone(span)
+                else:
+                    self.assertEqual(uristring[span[0] : span[1]], value)
+            self.assertEqual(spans.split(), parts)
+            self.assertIsInstance(spans.split(), type(parts))
+
+    def test_rfc3986(self):
+        self.check("foo://user@example.com:8042/over/there?name=ferret#nose")
+        self.check("urn:example:animal:ferret:nose")
+        self.check("http://a/b/c/d;p?q")
+        self.check("../g")
+        self.check("//g")
+        self.check("?y#s")
+        self.check("")
+
+    def test_spans(self):
+        spans = urisplitspans("foo://user@example.com:8042/over/there?name=ferret#nose")
+        self.assertEqual(spans.scheme, (0, 3))
+        self.assertEqual(spans.authority, (6, 27))
+        self.assertEqual(spans.path, (27, 38))
+        self.assertEqual(spans.query, (39, 50))
+        self.assertEqual(spans.fragment, (51, 55))
+        self.assertEqual(spans.userinfo, (6, 10))
+        self.assertEqual(spans.host, (11, 22))
+        self.assertEqual(spans.port, (23, 27))
+        spans = urisplitspans(b"foo")
+        self.assertIsNone(spans.scheme)
+        self.assertIsNone(spans.authority)
+        self.assertEqual(spans.path, (0, 3))
+        self.assertIsNone(spans.query)
+        self.assertIsNone(spans.fragment)
+        self.assertIsNone(spans.userinfo)
+        self.assertIsNone(spans.host)
+        self.assertIsNone(spans.port)
+
+    def test_authority(self):
+        for authority in [
+            "",
+            ":",
+            "@",
+            "host",
+            "host:",
+            "host:80",
+            "host:x",
+            "80",
+            "user@host",
+            "user:pass@host:80",
+            "user:80@host",
+            "a@b@host:80",
+            "[::1]",
+            "[::1]:80",
+            "user@[::1]:",
+        ]:
+            with self.subTest(authority=authority):
+                self.check("//" + authority + "/path")
+
+    def test_get(self):
+        spans = urisplitspans("http://example.com")
+        self.assertEqual(spans.get("host"), "example.com")
+        self.assertIsNone(spans.get("query"))
+        with self.assertRaises(ValueError):
+            spans.get("split")
+        with self.assertRaises(ValueError):
+            spans.get("__class__")
@@ -1,7 +1,7 @@
 import ipaddress
 import unittest
 
-from uritools import urisplit
+from uritools import AuthorityCache, urisplit
 
 
 class SplitTest(unittest.TestCase):
@@ -282,8 +282,13 @@ class SplitTest(unittest.TestCase):
                 ("userinfo", "test.python.org", 5432),
             ),
         ]
+        cache = AuthorityCache()
         for uri, default, authority in cases:
             self.assertEqual(urisplit(uri).getauthority(default), authority)
+            parts = urisplit(uri.encode())
+            self.assertEqual(parts.getauthority(default, cache=cache), authority)
+            self.assertEqual(parts.getauthority(default, cache=cache), authority)
+        self.assertEqual(cache.cache_info().currsize, 9)
         for uri in ["http://[::1/", "http://::1]/"]:
             with self.assertRaises(ValueError, msg="%r" % uri):
                 urisplit(uri).getauthority()
@@ -301,16 +306,51 @@ class SplitTest(unittest.TestCase):
             ("http://Test.python.org:5432/foo/", "test.python.org"),
             ("http://12.34.56.78:5432/foo/", IPv4Address("12.34.56.78")),
             ("http://[::1]:5432/foo/", IPv6Address("::1")),
+            ("http://[::FFFF]/foo/", IPv6Address("::ffff")),
+            ("http://1.2.3:5432/foo/", "1.2.3"),
+            ("http://1.2.3.256/foo/", "1.2.3.256"),
+            ("http://1.2.3.4.5/foo/", "1.2.3.4.5"),
+            ("http://v1.X/foo/", "v1.x"),
         ]
         for uri, host in cases:
             self.assertEqual(urisplit(uri).gethost(), host)
             self.assertEqual(urisplit(uri.encode()).gethost(), host)
-        for uri in ["http://[::1/", "http://::1]/"]:
+        for uri in ["http://[::1/", "http://::1]/", "http://[v1.x]/", "http://[V1.x]/"]:
             with self.assertRaises(ValueError, msg="%r" % uri):
                 urisplit(uri).gethost()
             with self.assertRaises(ValueError, msg="%r" % uri):
                 urisplit(uri.encode()).gethost()
 
+    def test_authority(self):
+        cases = [
+            ("", None, "", None),
+            (":", None, "", ""),
+            ("@", "", "", None),
+            ("host", None, "host", None),
+            ("host:", None, "host", ""),
+            ("host:80", None, "host", "80"),
+            ("host:x", None, "host:x", None),
+            ("user@host", "user", "host", None),
+            ("user:pass@host:80", "user:pass", "host", "80"),
+            ("user:80@host", "user:80", "host", None),
+            ("a@b@host:80", "a@b", "host", "80"),
+            ("[::1]", None, "[::1]", None),
+            ("[::1]:80", None, "[::1]", "80"),
+            ("user@[::1]:", "user", "[::1]", ""),
+        ]
+        for authority, userinfo, host, port in cases:
+            expected = (userinfo, host, port)
+            result = urisplit("//" + authority)
+            self.assertEqual((result.userinfo, result.host, result.port), expected)
+            # getauthority() splits the authority only once
+            self.assertEqual(
+                result.getauthority(),
+                (result.getuserinfo(), result.gethost(), result.getport()),
+            )
+            expected = tuple(s.encode() if s is not None else s for s in expected)
+            result = urisplit(b"//" + authority.encode())
+            self.assertEqual((result.userinfo, result.host, result.port), expected)
+
     def test_getport(self):
         for uri in ["foo://bar", "foo://bar:", "foo://bar/", "foo://bar:/"]:
             result = urisplit(uri)
@@ -349,6 +389,12 @@ class SplitTest(unittest.TestCase):
             ("../../foo/../bar/.", "../../bar/", "/bar/"),
             ("../../foo/../bar/..", "../../", "/"),
             ("../../foo/../..", "../../../", "/"),
+            ("foo", "foo", "/foo"),
+            ("foo/bar/", "foo/bar/", "/foo/bar/"),
+            ("foo//bar", "foo//bar", "/foo//bar"),
+            (".foo/..bar/baz.", ".foo/..bar/baz.", "/.foo/..bar/baz."),
+            ("foo.../...", "foo.../...", "/foo.../..."),
+            ("foo/%2E/%2E%2E", "foo/./..", "/foo/./.."),
         ]
         for uri, relpath, abspath in cases:
             parts = urisplit(uri)
@@ -417,6 +463,50 @@ class SplitTest(unittest.TestCase):
                 "Error parsing query list for %r" % query,
             )
 
+    def test_getqueryview(self):
+        cases = [
+            "",
+            "?",
+            "?&",
+            "?=",
+            "?a",
+            "?a=",
+            "?&a=b&",
+            "?a=a+b&b=b+c",
+            "?a=a%20b&b=b%20c&a%20b=c",
+            "?a=1&b&a=2&a&c=3",
+        ]
+        for query in cases:
+            for uri in [query, query.encode()]:
+                parts = urisplit(uri)
+                querylist = parts.getquerylist()
+                querydict = parts.getquerydict()
+                view = parts.getqueryview()
+                self.assertEqual(list(view.items()), querylist)
+                self.assertEqual(list(view), list(querydict))
+                self.assertEqual(len(view), len(querydict))
+                for name, values in querydict.items():
+                    self.assertIn(name, view)
+                    self.assertEqual(view.get(name), values[0])
+                    self.assertEqual(view.getall(name), values)
+                self.assertNotIn("x", view)
+                self.assertEqual(view.get("x"), None)
+                self.assertEqual(view.get("x", "y"), "y")
+                self.assertEqual(view.getall("x"), [])
+
+    def test_getqueryview_sep(self):
+        for sep in [";", b";"]:
+            view = urisplit("?a=1;b=2&c=3;a").getqueryview(sep)
+            self.assertEqual(
+                list(view.items()), [("a", "1"), ("b", "2&c=3"), ("a", None)]
+            )
+            self.assertEqual(view.getall("a"), ["1", None])
+            view = urisplit(b"?a=1;;b").getqueryview(sep, encoding=None)
+            self.assertEqual(list(view.items()), [(b"a", b"1"), (b"b", None)])
+            self.assertEqual(view.get(b"a"), b"1")
+        with self.assertRaises(ValueError):
+            urisplit("?a=1").getqueryview("")
+
     def test_ipv4_literal(self):
         cases = [
             ("http://12.34.56.78/foo/", "12.34.56.78", None),
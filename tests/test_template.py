@@ -0,0 +1,206 @@
+import unittest
+
+from uritools import URITemplate, uriexpand
+
+# RFC 6570 3.2.  Expression Expansion
+RFC6570_VARIABLES = {
+    "count": ("one", "two", "three"),
+    "dom": ("example", "com"),
+    "dub": "me/too",
+    "hello": "Hello World!",
+    "half": "50%",
+    "var": "value",
+    "who": "fred",
+    "base": "http://example.com/home/",
+    "path": "/foo/bar",
+    "list": ("red", "green", "blue"),
+    "keys": {"semi": ";", "dot": ".", "comma": ","},
+    "v": "6",
+    "x": "1024",
+    "y": "768",
+    "empty": "",
+    "empty_keys": {},
+    "undef": None,
+}
+
+
+class TemplateTest(unittest.TestCase):
+    def check(self, template, expected, variables=RFC6570_VARIABLES):
+        self.assertEqual(expected, uriexpand(template, variables))
+        self.assertEqual(expected, URITemplate(template).expand(variables))
+        self.assertEqual([expected], list(URITemplate(template).expandall([variables])))
+
+    def test_simple(self):
+        """RFC 6570 3.2.2. Simple String Expansion: {var}"""
+        self.check("{var}", "value")
+        self.check("{hello}", "Hello%20World%21")
+        self.check("{half}", "50%25")
+        self.check("O{empty}X", "OX")
+        self.check("O{undef}X", "OX")
+        self.check("{x,y}", "1024,768")
+        self.check("{x,hello,y}", "1024,Hello%20World%21,768")
+        self.check("?{x,empty}", "?1024,")
+        self.check("?{x,undef}", "?1024")
+        self.check("?{undef,y}", "?768")
+        self.check("{var:3}", "val")
+        self.check("{var:30}", "value")
+        self.check("{list}", "red,green,blue")
+        self.check("{list*}", "red,green,blue")
+        self.check("{keys}", "semi,%3B,dot,.,comma,%2C")
+        self.check("{keys*}", "semi=%3B,dot=.,comma=%2C")
+
+    def test_reserved(self):
+        """RFC 6570 3.2.3. Reserved Expansion: {+var}"""
+        self.check("{+var}", "value")
+        self.check("{+hello}", "Hello%20World!")
+        self.check("{+half}", "50%25")
+        self.check("{base}index", "http%3A%2F%2Fexample.com%2Fhome%2Findex")
+        self.check("{+base}index", "http://example.com/home/index")
+        self.check("O{+empty}X", "OX")
+        self.check("O{+undef}X", "OX")
+        self.check("{+path}/here", "/foo/bar/here")
+        self.check("here?ref={+path}", "here?ref=/foo/bar")
+        self.check("up{+path}{var}/here", "up/foo/barvalue/here")
+        self.check("{+x,hello,y}", "1024,Hello%20World!,768")
+        self.check("{+path,x}/here", "/foo/bar,1024/here")
+        self.check("{+path:6}/here", "/foo/b/here")
+        self.check("{+list}", "red,green,blue")
+        self.check("{+list*}", "red,green,blue")
+        self.check("{+keys}", "semi,;,dot,.,comma,,")
+        self.check("{+keys*}", "semi=;,dot=.,comma=,")
+
+    def test_fragment(self):
+        """RFC 6570 3.2.4. Fragment Expansion: {#var}"""
+        self.check("{#var}", "#value")
+        self.check("{#hello}", "#Hello%20World!")
+        self.check("{#half}", "#50%25")
+        self.check("foo{#empty}", "foo#")
+        self.check("foo{#undef}", "foo")
+        self.check("{#x,hello,y}", "#1024,Hello%20World!,768")
+        self.check("{#path,x}/here", "#/foo/bar,1024/here")
+        self.check("{#path:6}/here", "#/foo/b/here")
+        self.check("{#list}", "#red,green,blue")
+        self.check("{#list*}", "#red,green,blue")
+        self.check("{#keys}", "#semi,;,dot,.,comma,,")
+        self.check("{#keys*}", "#semi=;,dot=.,comma=,")
+
+    def test_label(self):
+        """RFC 6570 3.2.5. Label Expansion with Dot-Prefix: {.var}"""
+        self.check("{.who}", ".fred")
+        self.check("{.who,who}", ".fred.fred")
+        self.check("{.half,who}", ".50%25.fred")
+        self.check("www{.dom*}", "www.example.com")
+        self.check("X{.var}", "X.value")
+        self.check("X{.empty}", "X.")
+        self.check("X{.undef}", "X")
+        self.check("X{.var:3}", "X.val")
+        self.check("X{.list}", "X.red,green,blue")
+        self.check("X{.list*}", "X.red.green.blue")
+        self.check("X{.keys}", "X.semi,%3B,dot,.,comma,%2C")
+        self.check("X{.keys*}", "X.semi=%3B.dot=..comma=%2C")
+        self.check("X{.empty_keys}", "X")
+        self.check("X{.empty_keys*}", "X")
+
+    def test_path(self):
+        """RFC 6570 3.2.6. Path Segment Expansion: {/var}"""
+        self.check("{/who}", "/fred")
+        self.check("{/who,who}", "/fred/fred")
+        self.check("{/half,who}", "/50%25/fred")
+        self.check("{/who,dub}", "/fred/me%2Ftoo")
+        self.check("{/var}", "/value")
+        self.check("{/var,empty}", "/value/")
+        self.check("{/var,undef}", "/value")
+        self.check("{/var,x}/here", "/value/1024/here")
+        self.check("{/var:1,var}", "/v/value")
+        self.check("{/list}", "/red,green,blue")
+        self.check("{/list*}", "/red/green/blue")
+        self.check("{/list*,path:4}", "/red/green/blue/%2Ffoo")
+        self.check("{/keys}", "/semi,%3B,dot,.,comma,%2C")
+        self.check("{/keys*}", "/semi=%3B/dot=./comma=%2C")
+
+    def test_path_params(self):
+        """RFC 6570 3.2.7. Path-Style Parameter Expansion: {;var}"""
+        self.check("{;who}", ";who=fred")
+        self.check("{;half}", ";half=50%25")
+        self.check("{;empty}", ";empty")
+        self.check("{;v,empty,who}", ";v=6;empty;who=fred")
+        self.check("{;v,bar,who}", ";v=6;who=fred")
+        self.check("{;x,y}", ";x=1024;y=768")
+        self.check("{;x,y,empty}", ";x=1024;y=768;empty")
+        self.check("{;x,y,undef}", ";x=1024;y=768")
+        self.check("{;hello:5}", ";hello=Hello")
+        self.check("{;list}", ";list=red,green,blue")
+        self.check("{;list*}", ";list=red;list=green;list=blue")
+        self.check("{;keys}", ";keys=semi,%3B,dot,.,comma,%2C")
+        self.check("{;keys*}", ";semi=%3B;dot=.;comma=%2C")
+
+    def test_query(self):
+        """RFC 6570 3.2.8. Form-Style Query Expansion: {?var}"""
+        self.check("{?who}", "?who=fred")
+        self.check("{?half}", "?half=50%25")
+        self.check("{?x,y}", "?x=1024&y=768")
+        self.check("{?x,y,empty}", "?x=1024&y=768&empty=")
+        self.check("{?x,y,undef}", "?x=1024&y=768")
+        self.check("{?var:3}", "?var=val")
+        self.check("{?list}", "?list=red,green,blue")
+        self.check("{?list*}", "?list=red&list=green&list=blue")
+        self.check("{?keys}", "?keys=semi,%3B,dot,.,comma,%2C")
+        self.check("{?keys*}", "?semi=%3B&dot=.&comma=%2C")
+
+    def test_query_continuation(self):
+        """RFC 6570 3.2.9. Form-Style Query Continuation: {&var}"""
+        self.check("{&who}", "&who=fred")
+        self.check("{&half}", "&half=50%25")
+        self.check("?fixed=yes{&x}", "?fixed=yes&x=1024")
+        self.check("{&x,y,empty}", "&x=1024&y=768&empty=")
+        self.check("{&var:3}", "&var=val")
+        self.check("{&list}", "&list=red,green,blue")
+        self.check("{&list*}", "&list=red&list=green&list=blue")
+        self.check("{&keys}", "&keys=semi,%3B,dot,.,comma,%2C")
+        self.check("{&keys*}", "&semi=%3B&dot=.&comma=%2C")
+
+    def test_literals(self):
+        self.check("", "", {})
+        self.check("http://example.com/", "http://example.com/", {})
+        self.check("/a b/%41%/", "/a%20b/%41%25/", {})
+        self.check("/ä/{x}", "/%C3%A4/%C3%A4", {"x": "ä"})
+
+    def test_values(self):
+        self.check("{x}", "42", {"x": 42})
+        self.check("{x}", "a%20b", {"x": b"a b"})
+        self.check("{x:2}", "%C3%A4%C3%B6", {"x": "äöü"})
+        self.check("{x*}", "1,2", {"x": [1, None, 2]})
+        self.check("{?x*}", "?a=1", {"x": {"a": 1, "b": None}})
+        self.check("{x}", "", {"x": []})
+
+    def test_expandall(self):
+        template = URITemplate("/users/{id}/repos{?page,per_page}")
+        self.assertEqual(template.template, "/users/{id}/repos{?page,per_page}")
+        self.assertEqual(
+            list(template.expandall([{"id": 1}, {"id": 2, "page": 3}])),
+            ["/users/1/repos", "/users/2/repos?page=3"],
+        )
+        self.assertEqual(list(template.expandall([])), [])
+
+    def test_invalid(self):
+        for template in [
+            "{",
+            "}",
+            "{}",
+            "{{x}}",
+            "x}{",
+            "{x",
+            "{!x}",
+            "{=x}",
+            "{x y}",
+            "{x:0}",
+            "{x:10000}",
+            "{x*:1}",
+            "{x,}",
+            "{.x..y}",
+            "{%4}",
+        ]:
+            with self.subTest(template=template), self.assertRaises(ValueError):
+                URITemplate(template)
+        with self.assertRaises(ValueError):
+            uriexpand("{x:1}", {"x": ["a", "b"]})
@@ -0,0 +1,84 @@
+import concurrent.futures
+import unittest
+
+from uritools import (
+    HostCache,
+    PathCache,
+    SchemeNormalizer,
+    registerscheme,
+    uridecode,
+    uriencode,
+    urijoin,
+    urinormalize,
+    urisplit,
+)
+
+SAFE = ["", "/", ":@", "!$&'()*+,;=", b"/", b"?", "~"]
+
+STRINGS = ["a b/c", "caf\xe9", "%/?#", "x;y=z&w", "\U0001f600"]
+
+
+def work(n):
+    # different threads use different safe characters in turn
+    results = []
+    for i in range(200):
+        safe = SAFE[(n + i) % len(SAFE)]
+        string = STRINGS[(n * i) % len(STRINGS)]
+        encoded = uriencode(string, safe)
+        results.append((safe, string, encoded, uridecode(encoded)))
+        results.append((safe, string, urisplit(encoded), None))
+    return results
+
+
+class ThreadsTest(unittest.TestCase):
+    def test_encode(self):
+        with concurrent.futures.ThreadPoolExecutor(8) as pool:
+            for results in pool.map(work, range(32)):
+                for safe, string, encoded, decoded in results:
+                    if decoded is None:
+                        self.assertEqual(encoded, urisplit(uriencode(string, safe)))
+                    else:
+                        self.assertEqual(encoded, uriencode(string, safe))
+                        self.assertEqual(decoded, string)
+
+    def test_caches(self):
+        hosts, paths = HostCache(maxsize=4), PathCache(maxsize=4)
+        uris = ["http://H%d.example/a/./b/../%d" % (i, i) for i in range(16)]
+
+        def work(n):
+            results = []
+            for uri in uris[n % 4 :] + uris[: n % 4]:
+                host = urisplit(uri).gethost(cache=hosts)
+                results.append((uri, host, urijoin(uri, "../c/./d", cache=paths)))
+            return results
+
+        with concurrent.futures.ThreadPoolExecutor(8) as pool:
+            for results in pool.map(work, range(32)):
+                for uri, host, joined in results:
+                    self.assertEqual(host, urisplit(uri).gethost())
+                    self.assertEqual(joined, urijoin(uri, "../c/./d"))
+
+    def test_registerscheme(self):
+        normalizer = SchemeNormalizer(port=8080, path="/")
+
+        def register(n):
+            for _ in range(100):
+                registerscheme("test%d" % n, normalizer)
+                registerscheme("test%d" % n, None)
+            registerscheme("test%d" % n, normalizer)
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(8) as pool:
+                list(pool.map(register, range(16)))
+            for n in range(16):
+                uri = "test%d://example.com:8080" % n
+                self.assertEqual(urinormalize(uri), "test%d://example.com/" % n)
+                self.assertEqual(
+                    urinormalize(uri.encode()), b"test%d://example.com/" % n
+                )
+        finally:
+            for n in range(16):
+                registerscheme("test%d" % n, None)
+        self.assertEqual(
+            urinormalize("test0://example.com:8080"), "test0://example.com:8080"
+        )